@@ -10,32 +10,43 @@ from .const import (
     CLOUD_CATEGORY_CLIMATE_ZONES,
     CONNECTION_TYPE_CLOUD,
     CONNECTION_TYPE_LOCAL,
+    CONF_CLOUD_BASE_URL,
     CONF_CLOUD_EXCLUDE_IAQ_NAMES,
     CONF_CLOUD_INCLUDE_BOUND_IAQS,
     CONF_CLOUD_INCLUDE_CATEGORIES,
     CONF_CLOUD_INCLUDE_DEVICE_IDS,
     CONF_CLOUD_PROFILE,
+    CONF_CLOUD_PUSH,
+    CONF_CLOUD_PUSH_URL,
     CONF_CONNECTION_TYPE,
     CONF_EMAIL,
     CONF_PASSWORD,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
     CONF_USER_ID,
+    CONF_WEBSERVER_MAC,
     DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES,
     DEFAULT_CLOUD_INCLUDE_BOUND_IAQS,
     DEFAULT_CLOUD_INCLUDE_CATEGORIES,
     DEFAULT_CLOUD_INCLUDE_DEVICE_IDS,
+    DEFAULT_CLOUD_BASE_URL,
     DEFAULT_CLOUD_PROFILE,
+    DEFAULT_CLOUD_PUSH,
     DEFAULT_CLOUD_SCAN_INTERVAL,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_MIN,
     DOMAIN,
     CLOUD_PROFILE_COMPLEMENT_LOCAL,
     CLOUD_PROFILE_CUSTOM,
 )
+from .cloud_hub import async_acquire_cloud_hub, async_release_cloud_hub
 from .coordinator import AirzoneCoordinator
 from .coordinator_cloud import AirzoneCloudCoordinator
+from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +100,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 else False
             )
 
+        base_url = entry.data.get(CONF_CLOUD_BASE_URL, DEFAULT_CLOUD_BASE_URL)
+        # Entradas de la misma cuenta comparten login, inventario y estados.
+        hub = async_acquire_cloud_hub(
+            hass,
+            entry.entry_id,
+            entry.data.get(CONF_EMAIL, ""),
+            entry.data.get(CONF_PASSWORD, ""),
+            base_url=base_url,
+            user_id=entry.data.get(CONF_USER_ID),
+        )
         coordinator = AirzoneCloudCoordinator(
             hass,
             email=entry.data.get(CONF_EMAIL, ""),
@@ -103,6 +124,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 CONF_CLOUD_EXCLUDE_IAQ_NAMES,
                 entry.data.get(CONF_CLOUD_EXCLUDE_IAQ_NAMES, DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES),
             ),
+            base_url=base_url,
+            push=entry.options.get(CONF_CLOUD_PUSH, DEFAULT_CLOUD_PUSH),
+            push_url=entry.data.get(CONF_CLOUD_PUSH_URL),
+            hub=hub,
         )
         coordinator.cloud_profile = cloud_profile
     else:
@@ -120,10 +145,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             scan_interval=scan,
             api_prefix=api_prefix,
         )
+        # Intervalo adaptativo: el configurado es el de referencia entre ambos límites.
+        # Sin máximo en opciones no se sondea más despacio de lo configurado.
+        coordinator.set_interval_range(
+            entry.options.get(CONF_SCAN_INTERVAL_MIN, min(DEFAULT_SCAN_INTERVAL_MIN, scan)),
+            entry.options.get(CONF_SCAN_INTERVAL_MAX, scan),
+        )
 
     coordinator.config_entry = entry  # type: ignore[attr-defined]
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        async_release_cloud_hub(hass, entry.entry_id)
+        raise
+
+    if connection_type != CONNECTION_TYPE_CLOUD:
+        # Límites calibrados de las operaciones en bloque (la clave usa la MAC del primer refresco)
+        await coordinator.async_load_capacity()
+        # Las entradas Cloud en complement_local excluyen los dispositivos de este webserver
+        mac = (coordinator.webserver or {}).get("mac")
+        if mac and entry.data.get(CONF_WEBSERVER_MAC) != mac:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_WEBSERVER_MAC: mac})
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -131,6 +174,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "connection_type": connection_type,
     }
 
+    if isinstance(coordinator, AirzoneCloudCoordinator):
+        coordinator.async_start_push()
+
+    async_setup_services(hass)
+
     entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -144,5 +192,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coord: AirzoneCoordinator | None = bundle.get("coordinator")
     if coord:
         await coord.async_close()
+    async_release_cloud_hub(hass, entry.entry_id)
+
+    if not any(isinstance(item, dict) and "coordinator" in item for item in hass.data.get(DOMAIN, {}).values()):
+        async_unload_services(hass)
 
     return unload_ok
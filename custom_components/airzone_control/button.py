@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -17,7 +16,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Ajustes "Hotel": robustez vs rapidez
 _HOTEL_PASSES = 3  # número total de pasadas (1 inicial + reintentos)
-_HOTEL_SLEEP_BETWEEN_CALLS = 0.05  # segundos entre PUTs para evitar saturar el webserver
+# Concurrencia y pausa entre PUTs: coordinator.capacity (calibrable con airzone_control.calibrate)
 
 
 async def async_setup_entry(
@@ -131,19 +130,13 @@ class _SystemButton(CoordinatorEntity[AirzoneCoordinator], ButtonEntity):
                 pending,
             )
 
-            for zid in pending:
-                try:
-                    await self.coordinator.async_set_zone_params(
-                        self._sid,
-                        zid,
-                        request_refresh=False,
-                        on=desired_on,
-                    )
-                except Exception as e:
-                    _LOGGER.debug("[Hotel] set on=%s failed for %s/%s: %s", desired_on, self._sid, zid, e)
-                await asyncio.sleep(_HOTEL_SLEEP_BETWEEN_CALLS)
-
-            await self.coordinator.async_request_refresh()
+            results = await self.coordinator.async_set_zones_params(
+                {(self._sid, zid): {"on": desired_on} for zid in pending},
+                return_exceptions=True,
+            )
+            for zid, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug("[Hotel] set on=%s failed for %s/%s: %s", desired_on, self._sid, zid, result)
 
         # Si llegamos aquí, todavía queda algo desincronizado
         still: List[int] = []
@@ -263,6 +256,7 @@ class HotelCopySetpointButton(_SystemButton):
         zones = self._zones()
         _LOGGER.debug("[Hotel] Copy SP from master zone %s to %d zones", mzid, len(zones))
 
+        bodies: Dict[tuple[int, int], Dict[str, Any]] = {}
         for z in zones:
             try:
                 zid = int(z.get("zoneID"))
@@ -303,16 +297,9 @@ class HotelCopySetpointButton(_SystemButton):
                 continue
 
             # IMPORTANTÍSIMO: copiar consigna NO cambia el ON/OFF
-            try:
-                await self.coordinator.async_set_zone_params(
-                    self._sid,
-                    zid,
-                    request_refresh=False,
-                    **body,
-                )
-            except Exception as e:
-                _LOGGER.debug("[Hotel] Copy SP failed for %s/%s: %s", self._sid, zid, e)
-
-            await asyncio.sleep(_HOTEL_SLEEP_BETWEEN_CALLS)
+            bodies[(self._sid, zid)] = body
 
-        await self.coordinator.async_request_refresh()
+        results = await self.coordinator.async_set_zones_params(bodies, return_exceptions=True)
+        for (_sid, zid), result in zip(bodies, results):
+            if isinstance(result, Exception):
+                _LOGGER.debug("[Hotel] Copy SP failed for %s/%s: %s", self._sid, zid, result)
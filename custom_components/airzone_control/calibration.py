@@ -0,0 +1,266 @@
+"""Calibración bajo demanda de la capacidad de escritura de un webserver Airzone."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CALIBRATION_LATENCY_FACTOR,
+    CALIBRATION_MAX_CONCURRENCY,
+    CALIBRATION_PACINGS,
+    CALIBRATION_ROUNDS,
+    CAPACITY_STORAGE_KEY,
+    CAPACITY_STORAGE_VERSION,
+    DATA_CAPACITY_STORE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_PACING,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import AirzoneCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pasadas para devolver las consignas originales al terminar cada ronda
+_RESTORE_PASSES = 3
+# Por debajo de esta latencia (segundos) el crecimiento frente a la serie no se tiene en cuenta
+_LATENCY_FLOOR = 0.1
+
+
+class WebserverCapacity:
+    """Concurrency and pacing limits for bulk operations on one controller.
+
+    `concurrency` is how many requests may be in flight at once and `pacing`
+    the pause each worker takes after a request. Until the controller is
+    calibrated the limits are the conservative defaults: one PUT at a time,
+    50 ms apart.
+    """
+
+    __slots__ = ("concurrency", "pacing", "calibrated_at", "report")
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        pacing: float = DEFAULT_BULK_PACING,
+        calibrated_at: str | None = None,
+        report: list[dict] | None = None,
+    ) -> None:
+        self.concurrency = max(1, int(concurrency))
+        self.pacing = max(0.0, float(pacing))
+        self.calibrated_at = calibrated_at
+        self.report = report or []
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "WebserverCapacity | None":
+        if not isinstance(data, dict):
+            return None
+        try:
+            return cls(data["concurrency"], data["pacing"], data.get("calibrated_at"), data.get("report"))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "pacing": self.pacing,
+            "calibrated_at": self.calibrated_at,
+            "report": self.report,
+        }
+
+
+def _store(hass: HomeAssistant) -> Store:
+    """Un único fichero .storage para todos los controladores, por clave de controlador."""
+    data = hass.data.setdefault(DOMAIN, {})
+    store = data.get(DATA_CAPACITY_STORE)
+    if store is None:
+        store = data[DATA_CAPACITY_STORE] = Store(hass, CAPACITY_STORAGE_VERSION, CAPACITY_STORAGE_KEY)
+    return store
+
+
+async def async_load_capacity(hass: HomeAssistant, key: str) -> WebserverCapacity | None:
+    stored = await _store(hass).async_load() or {}
+    return WebserverCapacity.from_dict(stored.get(key))
+
+
+async def async_save_capacity(hass: HomeAssistant, key: str, capacity: WebserverCapacity) -> None:
+    store = _store(hass)
+    stored = await store.async_load() or {}
+    stored[key] = capacity.as_dict()
+    await store.async_save(stored)
+
+
+def _float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _probe_zones(data: dict | None, limit: int) -> dict[tuple[int, int], float]:
+    """Zonas con consigna numérica que se pueden mover un paso sin salirse del rango."""
+    zones: dict[tuple[int, int], float] = {}
+    for key, zone in sorted((data or {}).items()):
+        setpoint = _float(zone.get("setpoint"))
+        if setpoint is None:
+            continue
+        zones[key] = setpoint
+        if len(zones) >= limit:
+            break
+    return zones
+
+
+def _nudged(zone: dict, setpoint: float) -> float:
+    """La consigna desplazada un paso hacia dentro del rango de la zona."""
+    step = _float(zone.get("temp_step")) or 0.5
+    max_temp = _float(zone.get("maxTemp"))
+    if max_temp is not None and setpoint + step > max_temp:
+        return setpoint - step
+    return setpoint + step
+
+
+def _same(a: float | None, b: float | None) -> bool:
+    return a is not None and b is not None and abs(a - b) < 0.01
+
+
+async def _read_setpoints(coordinator: AirzoneCoordinator) -> dict[tuple[int, int], float | None]:
+    """Lectura directa de /hvac (sin pasar por el ciclo del coordinator)."""
+    payload = await coordinator._fetch_hvac_all()
+    zones = coordinator._map_zones(coordinator._extract_zone_list(payload) or [])
+    return {key: _float(zone.get("setpoint")) for key, zone in zones.items()}
+
+
+async def _restore(coordinator: AirzoneCoordinator, originals: dict[tuple[int, int], float]) -> list[tuple[int, int]]:
+    """Devuelve las consignas originales, de una en una; las zonas que no lo consiguen."""
+    pending = list(originals)
+    for _ in range(_RESTORE_PASSES):
+        current = await _read_setpoints(coordinator)
+        pending = [key for key in pending if not _same(current.get(key), originals[key])]
+        if not pending:
+            return []
+        await coordinator._gather_limited(
+            [
+                coordinator.async_set_zone_params(*key, request_refresh=False, setpoint=originals[key])
+                for key in pending
+            ],
+            limit=DEFAULT_BULK_CONCURRENCY,
+            pacing=DEFAULT_BULK_PACING,
+        )
+    current = await _read_setpoints(coordinator)
+    return [key for key in pending if not _same(current.get(key), originals[key])]
+
+
+async def _round(
+    coordinator: AirzoneCoordinator,
+    originals: dict[tuple[int, int], float],
+    concurrency: int,
+    pacing: float,
+) -> dict[str, Any]:
+    """Mueve un paso la consigna de todas las zonas de prueba con estos límites y la devuelve."""
+    targets = {key: _nudged(coordinator.get_zone(*key) or {}, value) for key, value in originals.items()}
+    latencies: list[float] = []
+
+    async def _write(key: tuple[int, int], value: float) -> None:
+        started = time.monotonic()
+        await coordinator.async_set_zone_params(*key, request_refresh=False, setpoint=value)
+        latencies.append(time.monotonic() - started)
+
+    results = await coordinator._gather_limited(
+        [_write(key, value) for key, value in targets.items()],
+        limit=concurrency,
+        pacing=pacing,
+    )
+    failed = {key for key, result in zip(targets, results) if isinstance(result, Exception)}
+    current = await _read_setpoints(coordinator)
+    # El webserver confirma algunos PUT que luego no aplica: solo la relectura lo delata
+    dropped = [key for key in targets if key not in failed and not _same(current.get(key), targets[key])]
+    not_restored = await _restore(coordinator, originals)
+    if not_restored:
+        _LOGGER.warning("Airzone calibration could not restore the setpoint of zones %s", not_restored)
+    return {
+        "concurrency": concurrency,
+        "pacing": pacing,
+        "writes": len(targets),
+        "errors": len(failed),
+        "dropped": len(dropped),
+        "latency": round(statistics.median(latencies), 3) if latencies else None,
+    }
+
+
+def _clean(result: dict[str, Any]) -> bool:
+    return not result["errors"] and not result["dropped"] and result["latency"] is not None
+
+
+async def async_calibrate(
+    coordinator: AirzoneCoordinator, max_concurrency: int = CALIBRATION_MAX_CONCURRENCY
+) -> WebserverCapacity:
+    """Measure the concurrency and pacing a controller tolerates for writes.
+
+    Every round moves the setpoint of the probe zones by one step with the
+    candidate limits, reads the zones back and restores the original
+    setpoints. A round fails when a PUT errors, a write is silently dropped or
+    the median latency grows beyond CALIBRATION_LATENCY_FACTOR times the
+    serial one. The shortest clean pacing is found with one write at a time,
+    then the concurrency doubles until a level fails.
+    """
+    originals = _probe_zones(coordinator.data, max(1, max_concurrency) * 2)
+    if not originals:
+        raise ValueError("No zone with a numeric setpoint to calibrate with")
+
+    report: list[dict[str, Any]] = []
+    # Mientras dure, el coordinator no sondea ni abre la ventana rápida por estos PUTs
+    coordinator.calibrating = True
+
+    async def _level(concurrency: int, pacing: float) -> list[dict[str, Any]]:
+        rounds = [await _round(coordinator, originals, concurrency, pacing) for _ in range(CALIBRATION_ROUNDS)]
+        report.extend(rounds)
+        _LOGGER.debug("Airzone calibration %s: %s", coordinator.capacity_key, rounds)
+        return rounds
+
+    try:
+        # 1) De una en una: la pausa más corta con la que no se pierde nada
+        pacing: float | None = None
+        baseline = 0.0
+        for candidate in CALIBRATION_PACINGS:
+            rounds = await _level(1, candidate)
+            if all(_clean(result) for result in rounds):
+                pacing = candidate
+                baseline = max(result["latency"] for result in rounds)
+                break
+        if pacing is None:
+            _LOGGER.warning(
+                "Airzone webserver %s loses writes even one at a time; keeping the slowest pacing",
+                coordinator.capacity_key,
+            )
+            return WebserverCapacity(1, CALIBRATION_PACINGS[-1], _now(), report)
+
+        # 2) Concurrencia doblando hasta que un nivel falle o se dispare la latencia
+        concurrency = 1
+        level = 2
+        ceiling = max(baseline * CALIBRATION_LATENCY_FACTOR, _LATENCY_FLOOR)
+        while level <= min(max_concurrency, len(originals)):
+            rounds = await _level(level, pacing)
+            if not all(_clean(result) and result["latency"] <= ceiling for result in rounds):
+                break
+            concurrency = level
+            level *= 2
+    finally:
+        # Un fallo o una cancelación a mitad de ronda no deja consignas movidas
+        try:
+            if await _restore(coordinator, originals):
+                _LOGGER.warning("Airzone calibration left some setpoints of %s changed", coordinator.capacity_key)
+        finally:
+            coordinator.calibrating = False
+
+    return WebserverCapacity(concurrency, pacing, _now(), report)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,320 @@
+"""Grabación y reproducción de intercambios HTTP ("cassettes")."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import aiohttp
+
+CASSETTE_VERSION = 1
+_MAC = re.compile(r"^[0-9A-Fa-f]{2}([:-][0-9A-Fa-f]{2}){5}$")
+# Rutas de autenticación: no se guarda el cuerpo y el token de la URL se oculta
+_AUTH_PATH = re.compile(r"(/auth/refreshToken/)[^/]+$")
+
+
+class Pseudonymizer:
+    """Replaces sensitive values with stable pseudonyms.
+
+    The same original value always maps to the same pseudonym, so IDs that a
+    response hands out (installation, device, webserver MAC) still match the
+    paths of the requests that use them later and the cassette can be replayed.
+    """
+
+    def __init__(self, keys: frozenset[str] | set[str]) -> None:
+        self._keys = frozenset(keys)
+        self._map: dict[str, str] = {}
+
+    def value(self, original: Any) -> Any:
+        if original is None or isinstance(original, bool) or original == "":
+            return original
+        text = str(original)
+        alias = self._map.get(text)
+        if alias is None:
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=6).hexdigest()
+            if _MAC.match(text):
+                # Conserva el formato MAC (administrada localmente)
+                alias = "02:" + ":".join(digest[i:i + 2] for i in range(2, 12, 2)).upper()
+            else:
+                alias = f"redacted-{digest}"
+            self._map[text] = alias
+        return alias
+
+    def data(self, payload: Any, sensitive: bool = False) -> Any:
+        if isinstance(payload, dict):
+            return {key: self.data(item, key in self._keys) for key, item in payload.items()}
+        if isinstance(payload, list):
+            return [self.data(item, sensitive) for item in payload]
+        if sensitive or (isinstance(payload, str) and _MAC.match(payload)):
+            return self.value(payload)
+        return payload
+
+    def text(self, text: str) -> str:
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            return text
+        return json.dumps(self.data(payload), separators=(",", ":"), ensure_ascii=False)
+
+    def path(self, path: str) -> str:
+        return "/".join(
+            self.value(segment) if _MAC.match(segment) else self._map.get(segment, segment)
+            for segment in path.split("/")
+        )
+
+
+class CassetteResponse:
+    """Minimal stand-in for an aiohttp response whose body is already read."""
+
+    def __init__(self, status: int, text: str) -> None:
+        self.status = status
+        self._text = text
+
+    async def text(self) -> str:
+        return self._text
+
+    async def json(self, content_type: str | None = None) -> Any:
+        return json.loads(self._text) if self._text else None
+
+
+class CassetteRecorder:
+    """Collects the exchanges of the next N refresh cycles of one coordinator."""
+
+    def __init__(
+        self,
+        cycles: int,
+        path: str,
+        redact: frozenset[str] | set[str],
+        connection_type: str,
+    ) -> None:
+        self.remaining = max(1, int(cycles))
+        self.cycles = self.remaining
+        self.path = path
+        self.connection_type = connection_type
+        self.meta: dict[str, Any] = {}
+        self.records: list[dict[str, Any]] = []
+        self.cycle_offsets: list[float] = []
+        self._pseudo = Pseudonymizer(redact)
+        self._started = time.monotonic()
+        self._created = datetime.now(timezone.utc).isoformat()
+
+    def wrap(self, session: aiohttp.ClientSession) -> "RecordingSession":
+        return RecordingSession(session, self)
+
+    def begin_cycle(self) -> None:
+        self.cycle_offsets.append(round(time.monotonic() - self._started, 3))
+
+    def end_cycle(self) -> bool:
+        """True when all requested cycles are captured."""
+        self.remaining -= 1
+        return self.remaining <= 0
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        params: dict | None,
+        body: Any,
+        started: float,
+        status: int | None,
+        text: str | None,
+        error: str | None = None,
+    ) -> None:
+        split = urlsplit(url)
+        query = dict(parse_qsl(split.query))
+        if params:
+            query.update({str(k): v for k, v in params.items()})
+        auth = "/auth/" in split.path
+        path = _AUTH_PATH.sub(r"\1{token}", split.path)
+        record: dict[str, Any] = {
+            "t": round(started - self._started, 3),
+            "m": method.upper(),
+            "s": split.scheme,
+            "p": self._pseudo.path(path),
+            "q": self._pseudo.data(query) or None,
+            "b": None if auth else self._pseudo.data(body),
+            "st": status,
+            "l": round(time.monotonic() - started, 4),
+        }
+        if error is not None:
+            record["e"] = error
+        elif text is not None:
+            record["r"] = "" if auth else self._pseudo.text(text)
+        self.records.append(record)
+
+    def write(self) -> str:
+        """Write the cassette (gzip JSON lines: header + one exchange per line). Blocking."""
+        header = {
+            "version": CASSETTE_VERSION,
+            "created": self._created,
+            "connection_type": self.connection_type,
+            "cycles": self.cycle_offsets,
+            **self.meta,
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.write(json.dumps(header, separators=(",", ":")) + "\n")
+            for record in self.records:
+                handle.write(json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n")
+        return self.path
+
+
+class _RecordedRequest:
+    def __init__(self, recorder: CassetteRecorder, inner: aiohttp.ClientSession, method: str, url: str, kwargs: dict) -> None:
+        self._recorder = recorder
+        self._inner = inner
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+        self._context: Any = None
+
+    async def __aenter__(self) -> CassetteResponse:
+        params = self._kwargs.get("params")
+        body = self._kwargs.get("json")
+        started = time.monotonic()
+        try:
+            self._context = self._inner.request(self._method, self._url, **self._kwargs)
+            response = await self._context.__aenter__()
+        except Exception as err:
+            self._context = None
+            self._recorder.add(self._method, self._url, params, body, started, None, None, repr(err))
+            raise
+        try:
+            text = await response.text()
+        except Exception as err:
+            self._recorder.add(self._method, self._url, params, body, started, response.status, None, repr(err))
+            # __aexit__ no se llamará: liberar aquí la respuesta real
+            context, self._context = self._context, None
+            await context.__aexit__(type(err), err, err.__traceback__)
+            raise
+        self._recorder.add(self._method, self._url, params, body, started, response.status, text)
+        return CassetteResponse(response.status, text)
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._context is not None:
+            await self._context.__aexit__(*exc)
+
+
+class RecordingSession:
+    """aiohttp session wrapper that records every HTTP exchange."""
+
+    def __init__(self, inner: aiohttp.ClientSession, recorder: CassetteRecorder) -> None:
+        self.inner = inner
+        self._recorder = recorder
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _RecordedRequest:
+        return _RecordedRequest(self._recorder, self.inner, method, url, kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> _RecordedRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _RecordedRequest:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> _RecordedRequest:
+        return self.request("PUT", url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # closed, close(), ws_connect()... van a la sesión real sin grabar
+        return getattr(self.inner, name)
+
+
+def load_cassette(path: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Read a cassette written by CassetteRecorder.write(). Blocking."""
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        header = json.loads(handle.readline())
+        records = [json.loads(line) for line in handle if line.strip()]
+    if header.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version: {header.get('version')}")
+    return header, records
+
+
+def _request_key(method: str, scheme: str, path: str, params: Any, body: Any) -> tuple[str, str, str, str, str]:
+    return (
+        method.upper(),
+        scheme,
+        path,
+        json.dumps(params or None, sort_keys=True, default=str),
+        json.dumps(body or None, sort_keys=True, default=str),
+    )
+
+
+class _ReplayRequest:
+    def __init__(self, session: "ReplaySession", method: str, url: str, kwargs: dict) -> None:
+        self._session = session
+        self._method = method
+        self._url = url
+        self._kwargs = kwargs
+
+    async def __aenter__(self) -> CassetteResponse:
+        return await self._session._respond(self._method, self._url, self._kwargs)
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class ReplaySession:
+    """Serves recorded responses in place of an aiohttp session.
+
+    Requests are matched on method, scheme, path, query and JSON body; each
+    match returns the recorded answers in order and wraps around, so a short
+    cassette can drive any number of cycles. Recorded latency is reproduced
+    divided by `speed` (0 = no delay). Login and token refresh are answered
+    with a synthetic token.
+    """
+
+    def __init__(self, records: list[dict[str, Any]], speed: float = 1.0) -> None:
+        self.speed = speed
+        self.closed = False
+        self.unmatched: list[str] = []
+        self._answers: dict[tuple[str, str, str, str, str], list[dict[str, Any]]] = {}
+        self._cursor: dict[tuple[str, str, str, str, str], int] = {}
+        for record in records:
+            key = _request_key(record["m"], record["s"], record["p"], record.get("q"), record.get("b"))
+            self._answers.setdefault(key, []).append(record)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _ReplayRequest:
+        return _ReplayRequest(self, method, url, kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        return self.request("PUT", url, **kwargs)
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def _respond(self, method: str, url: str, kwargs: dict) -> CassetteResponse:
+        split = urlsplit(url)
+        if split.path.endswith("/auth/login") or "/auth/refreshToken/" in split.path:
+            return CassetteResponse(200, json.dumps({"_id": "replay", "token": "replay", "refreshToken": "replay"}))
+
+        query = dict(parse_qsl(split.query))
+        if kwargs.get("params"):
+            query.update({str(k): v for k, v in kwargs["params"].items()})
+        # Los valores grabados pasan por JSON: comparar con la misma forma
+        query = json.loads(json.dumps(query, default=str))
+        key = _request_key(method, split.scheme, split.path, query or None, kwargs.get("json"))
+        answers = self._answers.get(key)
+        if not answers:
+            self.unmatched.append(f"{method.upper()} {split.scheme} {split.path} {query or ''}")
+            return CassetteResponse(404, json.dumps({"error": "not in cassette"}))
+
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        record = answers[index % len(answers)]
+        if self.speed > 0 and record.get("l"):
+            await asyncio.sleep(record["l"] / self.speed)
+        if "e" in record:
+            raise aiohttp.ClientConnectionError(record["e"])
+        return CassetteResponse(record.get("st") or 200, record.get("r") or "")
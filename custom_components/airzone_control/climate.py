@@ -506,57 +506,32 @@ class AirzoneMasterClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity)
             return
         value = float(temp)
 
-        for zid in self._zone_ids:
-            await self.coordinator.async_set_zone_params(
-                self._system_id,
-                zid,
-                request_refresh=False,
-                setpoint=value,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(self._system_id, zid): {"setpoint": value} for zid in self._zone_ids}
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         # El termostato maestro NO cambia el modo (eso lo hace el modo global o el selector por zona).
         # Aquí solo hacemos ON/OFF masivo.
         if hvac_mode == HVACMode.OFF:
-            for zid in self._zone_ids:
-                await self.coordinator.async_set_zone_params(
-                    self._system_id,
-                    zid,
-                    request_refresh=False,
-                    on=0,
-                )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_zones_params(
+                {(self._system_id, zid): {"on": 0} for zid in self._zone_ids}
+            )
             return
 
-        for zid in self._zone_ids:
-            await self.coordinator.async_set_zone_params(
-                self._system_id,
-                zid,
-                request_refresh=False,
-                on=1,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(self._system_id, zid): {"on": 1} for zid in self._zone_ids}
+        )
 
     async def async_turn_on(self) -> None:
-        for zid in self._zone_ids:
-            await self.coordinator.async_set_zone_params(
-                self._system_id,
-                zid,
-                request_refresh=False,
-                on=1,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(self._system_id, zid): {"on": 1} for zid in self._zone_ids}
+        )
 
     async def async_turn_off(self) -> None:
-        for zid in self._zone_ids:
-            await self.coordinator.async_set_zone_params(
-                self._system_id,
-                zid,
-                request_refresh=False,
-                on=0,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(self._system_id, zid): {"on": 0} for zid in self._zone_ids}
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -773,25 +748,15 @@ class AirzoneGroupClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
             return
         value = float(temp)
 
-        for system_id, zone_id in self._members:
-            await self.coordinator.async_set_zone_params(
-                system_id,
-                zone_id,
-                request_refresh=False,
-                setpoint=value,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(system_id, zone_id): {"setpoint": value} for system_id, zone_id in self._members}
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         if hvac_mode == HVACMode.OFF:
-            for system_id, zone_id in self._members:
-                await self.coordinator.async_set_zone_params(
-                    system_id,
-                    zone_id,
-                    request_refresh=False,
-                    on=0,
-                )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_set_zones_params(
+                {(system_id, zone_id): {"on": 0} for system_id, zone_id in self._members}
+            )
             return
 
         code = HVAC_TO_API_MODE.get(hvac_mode)
@@ -799,31 +764,16 @@ class AirzoneGroupClimate(CoordinatorEntity[AirzoneCoordinator], ClimateEntity):
         if code is not None:
             body["mode"] = code
 
-        for system_id, zone_id in self._members:
-            await self.coordinator.async_set_zone_params(
-                system_id,
-                zone_id,
-                request_refresh=False,
-                **body,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(system_id, zone_id): body for system_id, zone_id in self._members}
+        )
 
     async def async_turn_on(self) -> None:
-        for system_id, zone_id in self._members:
-            await self.coordinator.async_set_zone_params(
-                system_id,
-                zone_id,
-                request_refresh=False,
-                on=1,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(system_id, zone_id): {"on": 1} for system_id, zone_id in self._members}
+        )
 
     async def async_turn_off(self) -> None:
-        for system_id, zone_id in self._members:
-            await self.coordinator.async_set_zone_params(
-                system_id,
-                zone_id,
-                request_refresh=False,
-                on=0,
-            )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_zones_params(
+            {(system_id, zone_id): {"on": 0} for system_id, zone_id in self._members}
+        )
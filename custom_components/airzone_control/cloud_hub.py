@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import CLOUD_TIMEOUT_MARGIN, CLOUD_TIMEOUT_MIN, DATA_CLOUD_HUBS, DEFAULT_CLOUD_BASE_URL, DOMAIN
+from .deadline import detached_context, note_failure, request_timeout, wait_within_deadline
+from .telemetry import RequestTelemetry, RttTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timeout of a Cloud request while the RTT is unknown (ceiling of the adaptive one)
+REQUEST_TIMEOUT = 20
+
+
+class CloudApiError(Exception):
+    """Airzone Cloud API error with a stable backend error id when available."""
+
+    def __init__(self, error_id: str | None, message: str | None = None) -> None:
+        self.error_id = error_id or "unknown"
+        self.message = message or self.error_id
+        super().__init__(self.message)
+
+
+async def async_cloud_login(
+    session: aiohttp.ClientSession,
+    email: str,
+    password: str,
+    *,
+    base_url: str = DEFAULT_CLOUD_BASE_URL,
+    timeout: int = 15,
+) -> dict[str, Any]:
+    """Authenticate against Airzone Cloud and return the login payload."""
+    url = f"{base_url.rstrip('/')}/auth/login"
+    async with session.post(
+        url,
+        json={"email": email.strip(), "password": password},
+        timeout=timeout,
+    ) as response:
+        text = await response.text()
+        payload: dict[str, Any] = {}
+        try:
+            parsed = await response.json(content_type=None)
+            if isinstance(parsed, dict):
+                payload = parsed
+        except Exception:
+            payload = {}
+
+        if response.status == 200:
+            return payload
+
+        error_id = payload.get("_id") if isinstance(payload, dict) else None
+        message = payload.get("msg") if isinstance(payload, dict) else text
+        if response.status in (400, 401, 403, 422):
+            raise CloudApiError(str(error_id or "auth_error"), str(message or "Authentication failed"))
+
+        raise aiohttp.ClientError(f"Airzone Cloud login failed: HTTP {response.status}: {text}")
+
+
+class AirzoneCloudHub:
+    """Per-account Airzone Cloud client shared by every config entry of that account.
+
+    Owns the session token, the installation inventory and a de-duplicating
+    status fetcher: a resource requested by several entries is fetched once
+    while it is in flight and then served from a short-lived cache, so API
+    calls scale with unique devices instead of entries x devices.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        email: str,
+        password: str,
+        *,
+        base_url: str = DEFAULT_CLOUD_BASE_URL,
+        user_id: str | None = None,
+    ) -> None:
+        self._session = session
+        self._email = email.strip().lower()
+        self._password = password
+        self.base_url = (base_url or DEFAULT_CLOUD_BASE_URL).rstrip("/")
+        self.user_id = user_id
+        self.token: str | None = None
+        self._refresh_token: str | None = None
+        self._auth_lock = asyncio.Lock()
+        # key -> (monotonic fetch time, result) / in-flight fetch
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._inflight: dict[tuple[Any, ...], asyncio.Future] = {}
+        # entry_id -> password that entry was set up with
+        self.subscribers: dict[str, str] = {}
+        # Request timeouts follow the RTT observed for this account
+        self.rtt = RttTracker(CLOUD_TIMEOUT_MIN, CLOUD_TIMEOUT_MARGIN)
+
+    @staticmethod
+    def hub_key(email: str, base_url: str = DEFAULT_CLOUD_BASE_URL) -> str:
+        return f"{(base_url or DEFAULT_CLOUD_BASE_URL).rstrip('/')}::{email.strip().lower()}"
+
+    # ---------------- Auth ----------------
+
+    async def _login(self) -> None:
+        # The password that last worked first; a stale entry of the account
+        # must not lock out the others, so theirs are tried before failing.
+        candidates = [self._password]
+        candidates += [password for password in self.subscribers.values() if password not in candidates]
+        for password in candidates:
+            try:
+                payload = await async_cloud_login(self._session, self._email, password, base_url=self.base_url)
+            except CloudApiError:
+                if password == candidates[-1]:
+                    raise
+                continue
+            self._password = password
+            break
+        self.token = payload.get("token")
+        self._refresh_token = payload.get("refreshToken")
+        self.user_id = self.user_id or payload.get("_id")
+        if not self.token:
+            raise UpdateFailed("Airzone Cloud login did not return a token")
+
+    async def async_refresh_access_token(self, stale_token: str | None = None) -> None:
+        """Refresh the token, once, even if several entries hit a 401 at the same time."""
+        async with self._auth_lock:
+            if stale_token is not None and self.token != stale_token:
+                return
+            if not self._refresh_token:
+                await self._login()
+                return
+
+            url = f"{self.base_url}/auth/refreshToken/{self._refresh_token}"
+            async with self._session.get(url, timeout=15) as response:
+                text = await response.text()
+                payload: dict[str, Any] = {}
+                try:
+                    parsed = await response.json(content_type=None)
+                    if isinstance(parsed, dict):
+                        payload = parsed
+                except Exception:
+                    payload = {}
+
+                if response.status != 200:
+                    _LOGGER.debug("Cloud token refresh failed: HTTP %s %s", response.status, text)
+                    await self._login()
+                    return
+
+                self.token = payload.get("token") or self.token
+                self._refresh_token = payload.get("refreshToken") or self._refresh_token
+                if not self.token:
+                    await self._login()
+
+    async def async_ensure_authenticated(self) -> None:
+        if self.token:
+            return
+        async with self._auth_lock:
+            if not self.token:
+                await self._login()
+
+    # ---------------- Requests ----------------
+
+    async def async_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        retry_auth: bool = True,
+    ) -> tuple[dict[str, Any] | list[Any], str]:
+        """Perform a Cloud request and return the parsed payload together with the raw body."""
+        await self.async_ensure_authenticated()
+        token = self.token
+        url = f"{self.base_url}{path}"
+        headers = {"Authorization": f"Bearer {token}"}
+        # Attributed to the entry whose poll triggered the request, and bounded
+        # by its cycle deadline (raises DeadlineExceeded once it is spent).
+        telemetry = RequestTelemetry.active()
+        # Only reads follow the RTT: a write cut short by a false timeout may
+        # have been applied by the device anyway.
+        is_read = method == "GET"
+        budget = self.rtt.timeout(REQUEST_TIMEOUT) if is_read else REQUEST_TIMEOUT
+        timeout = request_timeout(budget)
+        started = time.monotonic()
+
+        try:
+            async with self._session.request(
+                method,
+                url,
+                params=params,
+                json=body,
+                headers=headers,
+                timeout=timeout,
+            ) as response:
+                text = await response.text()
+            if is_read:
+                self.rtt.observe(time.monotonic() - started)
+        except Exception as err:
+            note_failure()
+            # A timeout clipped by the cycle deadline says nothing about the RTT
+            if isinstance(err, asyncio.TimeoutError) and is_read and timeout >= budget:
+                self.rtt.observe_timeout(timeout)
+            if telemetry is not None:
+                telemetry.record(
+                    method, path, "cloud", time.monotonic() - started, False,
+                    params=params, body=body, response=repr(err),
+                )
+            raise
+        if telemetry is not None:
+            telemetry.record(
+                method, path, "cloud", time.monotonic() - started, response.status < 400,
+                status=response.status, params=params, body=body, response=text,
+            )
+
+        payload: dict[str, Any] | list[Any] | None = None
+        try:
+            payload = json.loads(text) if text else None
+        except ValueError:
+            payload = None
+
+        if response.status == 401 and retry_auth:
+            await self.async_refresh_access_token(token)
+            return await self.async_request(
+                method,
+                path,
+                params=params,
+                body=body,
+                retry_auth=False,
+            )
+
+        if response.status >= 400:
+            error_id = payload.get("_id") if isinstance(payload, dict) else None
+            message = payload.get("msg") if isinstance(payload, dict) else text
+            raise CloudApiError(str(error_id or f"http_{response.status}"), str(message or text))
+
+        return (payload if payload is not None else {}), text
+
+    async def _shared(
+        self,
+        key: tuple[Any, ...],
+        max_age: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return a result younger than max_age, joining an in-flight fetch if any."""
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        future = self._inflight.get(key)
+        if future is None:
+            # The fetch serves every entry of the account: it runs without the
+            # deadline of the cycle that started it, bounded by the hub timeout.
+            future = detached_context().run(asyncio.ensure_future, fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done, key=key: self._fetch_done(key, done))
+        # Each caller waits at most its own remaining budget; shielded, so a
+        # cancelled or timed-out subscriber does not cancel the shared fetch.
+        return await wait_within_deadline(future)
+
+    def _fetch_done(self, key: tuple[Any, ...], future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._cache[key] = (time.monotonic(), future.result())
+
+    @staticmethod
+    def status_fingerprint(raw: str) -> bytes:
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    # ---------------- Inventory ----------------
+
+    async def _fetch_installations(self) -> list[dict[str, Any]]:
+        first, _text = await self.async_request("GET", "/installations", params={"items": 10, "page": 0})
+        if not isinstance(first, dict):
+            return []
+
+        installations = [item for item in first.get("installations", []) if isinstance(item, dict)]
+        try:
+            total = int(first.get("total") or 0) or len(installations)
+        except (TypeError, ValueError):
+            total = len(installations)
+        if total <= len(installations):
+            return installations
+
+        pages = (total + 9) // 10
+        for page in range(1, pages):
+            chunk, _text = await self.async_request("GET", "/installations", params={"items": 10, "page": page})
+            if not isinstance(chunk, dict):
+                continue
+            for item in chunk.get("installations", []):
+                if isinstance(item, dict):
+                    installations.append(item)
+        return installations
+
+    async def _fetch_installation_detail(self, installation_id: str) -> dict[str, Any] | None:
+        payload, _text = await self.async_request("GET", f"/installations/{installation_id}")
+        return payload if isinstance(payload, dict) else None
+
+    async def async_installations(self, max_age: float) -> list[dict[str, Any]]:
+        return await self._shared(("installations",), max_age, self._fetch_installations)
+
+    async def async_installation_detail(self, installation_id: str, max_age: float) -> dict[str, Any] | None:
+        return await self._shared(
+            ("installation", installation_id),
+            max_age,
+            lambda: self._fetch_installation_detail(installation_id),
+        )
+
+    # ---------------- Statuses ----------------
+
+    async def _fetch_device_status(self, installation_id: str, device_id: str) -> tuple[dict[str, Any] | None, bytes]:
+        payload, text = await self.async_request(
+            "GET",
+            f"/devices/{device_id}/status",
+            params={"installation_id": installation_id},
+        )
+        if not isinstance(payload, dict):
+            return None, b""
+        return payload, self.status_fingerprint(text)
+
+    async def async_device_status(
+        self,
+        installation_id: str,
+        device_id: str,
+        max_age: float,
+    ) -> tuple[dict[str, Any] | None, bytes]:
+        """Return (status payload, raw body fingerprint) for a device."""
+        return await self._shared(
+            ("device", installation_id, device_id),
+            max_age,
+            lambda: self._fetch_device_status(installation_id, device_id),
+        )
+
+    async def _fetch_webserver_status(self, installation_id: str, ws_id: str) -> dict[str, Any] | None:
+        payload, _text = await self.async_request(
+            "GET",
+            f"/devices/ws/{ws_id}/status",
+            params={"installation_id": installation_id},
+        )
+        return payload if isinstance(payload, dict) else None
+
+    async def async_webserver_status(self, installation_id: str, ws_id: str, max_age: float) -> dict[str, Any] | None:
+        return await self._shared(
+            ("ws", installation_id, ws_id),
+            max_age,
+            lambda: self._fetch_webserver_status(installation_id, ws_id),
+        )
+
+    def prune(self, max_age: float) -> None:
+        """Drop cached results older than max_age."""
+        now = time.monotonic()
+        for key in [key for key, (fetched, _result) in self._cache.items() if now - fetched >= max_age]:
+            del self._cache[key]
+
+
+def async_acquire_cloud_hub(
+    hass: HomeAssistant,
+    entry_id: str,
+    email: str,
+    password: str,
+    *,
+    base_url: str = DEFAULT_CLOUD_BASE_URL,
+    user_id: str | None = None,
+) -> AirzoneCloudHub:
+    """Return the account hub for a Cloud entry, creating it on first use."""
+    hubs: dict[str, AirzoneCloudHub] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_CLOUD_HUBS, {})
+    key = AirzoneCloudHub.hub_key(email, base_url)
+    hub = hubs.get(key)
+    if hub is None:
+        hub = AirzoneCloudHub(
+            async_get_clientsession(hass),
+            email,
+            password,
+            base_url=base_url,
+            user_id=user_id,
+        )
+        hubs[key] = hub
+    hub.subscribers[entry_id] = password
+    return hub
+
+
+def async_release_cloud_hub(hass: HomeAssistant, entry_id: str) -> None:
+    """Unsubscribe an entry; the hub is dropped with its last subscriber."""
+    hubs: dict[str, AirzoneCloudHub] = hass.data.get(DOMAIN, {}).get(DATA_CLOUD_HUBS, {})
+    for key, hub in list(hubs.items()):
+        hub.subscribers.pop(entry_id, None)
+        if not hub.subscribers:
+            del hubs[key]
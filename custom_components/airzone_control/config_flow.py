@@ -30,6 +30,7 @@ from .const import (
     CONF_CLOUD_INCLUDE_CATEGORIES,
     CONF_CLOUD_INCLUDE_DEVICE_IDS,
     CONF_CLOUD_PROFILE,
+    CONF_CLOUD_PUSH,
     CONF_CONNECTION_TYPE,
     CONF_EMAIL,
     CONF_GROUPS,
@@ -37,6 +38,8 @@ from .const import (
     CONF_PASSWORD,
     CONF_PORT,
     CONF_SCAN_INTERVAL,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
     CONF_USER_ID,
     DEFAULT_CLOUD_BASE_URL,
     DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES,
@@ -45,13 +48,15 @@ from .const import (
     DEFAULT_CLOUD_INCLUDE_DEVICE_IDS,
     DEFAULT_CLOUD_SCAN_INTERVAL,
     DEFAULT_CLOUD_PROFILE,
+    DEFAULT_CLOUD_PUSH,
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL_MIN,
     DOMAIN,
 )
+from .cloud_hub import CloudApiError, async_cloud_login
 from .coordinator import AirzoneCoordinator
-from .coordinator_cloud import CloudApiError, async_cloud_login
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -657,6 +662,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         is_cloud = self._entry.data.get(CONF_CONNECTION_TYPE, CONNECTION_TYPE_LOCAL) == CONNECTION_TYPE_CLOUD
         default_scan = DEFAULT_CLOUD_SCAN_INTERVAL if is_cloud else DEFAULT_SCAN_INTERVAL
         current_scan = self._entry.options.get(CONF_SCAN_INTERVAL, default_scan)
+        current_scan_min = self._entry.options.get(CONF_SCAN_INTERVAL_MIN, min(DEFAULT_SCAN_INTERVAL_MIN, current_scan))
+        current_scan_max = self._entry.options.get(CONF_SCAN_INTERVAL_MAX, current_scan)
         current_groups = self._entry.options.get(CONF_GROUPS, []) or []
         current_cloud_profile = _infer_cloud_profile(dict(self._entry.options), dict(self._entry.data))
         current_cloud_categories = self._entry.options.get(
@@ -680,6 +687,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             CONF_CLOUD_INCLUDE_DEVICE_IDS,
             self._entry.data.get(CONF_CLOUD_INCLUDE_DEVICE_IDS, DEFAULT_CLOUD_INCLUDE_DEVICE_IDS),
         )
+        current_cloud_push = self._entry.options.get(CONF_CLOUD_PUSH, DEFAULT_CLOUD_PUSH)
         zones_map = await self._load_zones_map()
         cloud_device_options = await self._load_cloud_device_options() if is_cloud else {}
 
@@ -692,6 +700,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             except Exception:
                 errors["scan_interval"] = "invalid_scan_interval"
 
+            # Local API: límites del intervalo adaptativo (mín <= intervalo <= máx)
+            new_scan_min = new_scan_max = None
+            if not is_cloud and not errors:
+                try:
+                    new_scan_min = int(user_input.get(CONF_SCAN_INTERVAL_MIN, current_scan_min))
+                    new_scan_max = int(user_input.get(CONF_SCAN_INTERVAL_MAX, current_scan_max))
+                    if not 2 <= new_scan_min <= new_scan <= new_scan_max <= 300:
+                        errors[CONF_SCAN_INTERVAL_MAX] = "invalid_scan_range"
+                except Exception:
+                    errors[CONF_SCAN_INTERVAL_MAX] = "invalid_scan_range"
+
             groups: list[dict[str, Any]] = []
             raw_json = (user_input.get("groups_json") or "").strip()
             if raw_json:
@@ -730,6 +749,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             if not errors:
                 options = dict(self._entry.options)
                 options[CONF_SCAN_INTERVAL] = new_scan
+                if not is_cloud:
+                    options[CONF_SCAN_INTERVAL_MIN] = new_scan_min
+                    options[CONF_SCAN_INTERVAL_MAX] = new_scan_max
                 options[CONF_GROUPS] = groups
                 if is_cloud:
                     selected_profile = str(user_input.get(CONF_CLOUD_PROFILE) or current_cloud_profile)
@@ -748,6 +770,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         user_input.get(CONF_CLOUD_EXCLUDE_IAQ_NAMES)
                         or DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES
                     ).strip()
+                    options[CONF_CLOUD_PUSH] = bool(user_input.get(CONF_CLOUD_PUSH, DEFAULT_CLOUD_PUSH))
                     if cloud_device_options:
                         if _cloud_profile_needs_device_selection(selected_profile):
                             options[CONF_CLOUD_INCLUDE_DEVICE_IDS] = list(
@@ -779,6 +802,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Required(CONF_SCAN_INTERVAL, default=current_scan): vol.All(int, vol.Range(min=2, max=300)),
         }
 
+        if not is_cloud:
+            schema_dict[
+                vol.Required(CONF_SCAN_INTERVAL_MIN, default=current_scan_min)
+            ] = vol.All(int, vol.Range(min=2, max=300))
+            schema_dict[
+                vol.Required(CONF_SCAN_INTERVAL_MAX, default=current_scan_max)
+            ] = vol.All(int, vol.Range(min=2, max=300))
+
         if is_cloud:
             schema_dict[
                 vol.Optional(
@@ -804,6 +835,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     default=str(current_cloud_exclude_iaq_names or DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES),
                 )
             ] = str
+            schema_dict[
+                vol.Optional(
+                    CONF_CLOUD_PUSH,
+                    default=bool(current_cloud_push),
+                )
+            ] = cv.boolean
             if cloud_device_options:
                 default_device_ids = [
                     str(device_id)
@@ -5,11 +5,46 @@ DEFAULT_PORT = 3000
 # No default host: cada usuario debe introducir la IP real del controlador Airzone.
 DEFAULT_HOST = ""
 DEFAULT_CLOUD_BASE_URL = "https://m.airzonecloud.com/api/v1"
+# Claves sensibles: diagnósticos y volcados de traza
+TO_REDACT = {
+    "ip",
+    "host",
+    "hostname",
+    "url",
+    "base_url",
+    "email",
+    "token",
+    "access_token",
+    "refresh_token",
+    "password",
+    "user_id",
+    "installation_id",
+    "device_id",
+    "ws_id",
+    "cloud_installation_id",
+    "cloud_device_id",
+    "cloud_ws_id",
+    "ssid",
+    "mac",
+    "mac_address",
+    "serial",
+    "serial_number",
+    "unique_id",
+}
+
+# hass.data[DOMAIN][DATA_CLOUD_HUBS]: un hub Cloud por cuenta, compartido entre entradas
+DATA_CLOUD_HUBS = "_cloud_hubs"
+# hass.data[DOMAIN][DATA_CAPACITY_STORE]: capacidad calibrada de cada webserver (helpers.storage)
+DATA_CAPACITY_STORE = "_capacity_store"
+CAPACITY_STORAGE_KEY = f"{DOMAIN}.capacity"
+CAPACITY_STORAGE_VERSION = 1
 
 # User options
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_SCAN_INTERVAL_MIN = "scan_interval_min"  # Local API: intervalo adaptativo
+CONF_SCAN_INTERVAL_MAX = "scan_interval_max"
 CONF_GROUPS = "groups"  # Grupos/Zonas lógicas definidas por el usuario
 CONF_CONNECTION_TYPE = "connection_type"
 CONF_EMAIL = "email"
@@ -20,6 +55,12 @@ CONF_CLOUD_INCLUDE_CATEGORIES = "cloud_include_categories"
 CONF_CLOUD_INCLUDE_DEVICE_IDS = "cloud_include_device_ids"
 CONF_CLOUD_INCLUDE_BOUND_IAQS = "cloud_include_bound_iaqs"
 CONF_CLOUD_EXCLUDE_IAQ_NAMES = "cloud_exclude_iaq_names"
+CONF_CLOUD_PUSH = "cloud_push"
+# Solo desarrollo: apuntar la entrada Cloud a servidores falsos (dev_tools)
+CONF_CLOUD_BASE_URL = "cloud_base_url"
+CONF_CLOUD_PUSH_URL = "cloud_push_url"
+# Local API: MAC del webserver, para que las entradas Cloud no dupliquen sus dispositivos
+CONF_WEBSERVER_MAC = "webserver_mac"
 
 CONNECTION_TYPE_LOCAL = "local"
 CONNECTION_TYPE_CLOUD = "cloud"
@@ -46,6 +87,7 @@ DEFAULT_CLOUD_INCLUDE_BOUND_IAQS = True
 DEFAULT_CLOUD_INCLUDE_DEVICE_IDS: list[str] = []
 DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES = ""
 DEFAULT_CLOUD_PROFILE = CLOUD_PROFILE_FULL
+DEFAULT_CLOUD_PUSH = False
 
 CLOUD_CATEGORY_LABELS: dict[str, str] = {
     CLOUD_CATEGORY_ENERGY: "Energy",
@@ -64,6 +106,46 @@ CLOUD_PROFILE_LABELS: dict[str, str] = {
 # Intervalo de sondeo por defecto (segundos). Cambiable en Opciones.
 DEFAULT_SCAN_INTERVAL = 5
 DEFAULT_CLOUD_SCAN_INTERVAL = 30
+# Mínimo por defecto del intervalo adaptativo de la Local API (segundos); el
+# máximo es el intervalo configurado hasta que el usuario amplía el rango
+DEFAULT_SCAN_INTERVAL_MIN = 2
+# Intervalo adaptativo: ventana rápida (segundos) tras una escritura o un cambio,
+# relajación tras ADAPTIVE_IDLE_CYCLES ciclos sin cambios y estiramiento cuando
+# el webserver da señales de estrés (5xx, lecturas vacías, sondeos lentos)
+ADAPTIVE_FAST_WINDOW = 30
+ADAPTIVE_IDLE_CYCLES = 6
+ADAPTIVE_RELAX_FACTOR = 1.5
+ADAPTIVE_STRESS_FACTOR = 2
+ADAPTIVE_STRESS_MIN_POLL = 1.0
+# Operaciones en bloque (botones hotel, seguir global...) sin calibrar: PUTs de
+# uno en uno y una pausa entre ellos, porque algunos webservers pierden escrituras con carga
+DEFAULT_BULK_CONCURRENCY = 1
+DEFAULT_BULK_PACING = 0.05
+# Calibración de capacidad (servicio airzone_control.calibrate): niveles de
+# concurrencia y pausas probados, pasadas por nivel y latencia tolerada frente
+# a las escrituras de una en una
+CALIBRATION_MAX_CONCURRENCY = 8
+CALIBRATION_PACINGS = (0.0, 0.05, 0.1, 0.25)
+CALIBRATION_ROUNDS = 2
+CALIBRATION_LATENCY_FACTOR = 3
+# Con push activo, el sondeo Cloud queda como reconciliación lenta (segundos).
+CLOUD_PUSH_RECONCILE_INTERVAL = 300
+# Plazo máximo de un ciclo de refresco: POLL_DEADLINE_FACTOR veces el intervalo,
+# nunca menos de POLL_DEADLINE_MIN segundos. Agotado, se conserva el último estado.
+POLL_DEADLINE_FACTOR = 3
+POLL_DEADLINE_MIN = 15
+# Webserver apagado: tras OFFLINE_AFTER_FAILED_CYCLES ciclos sin ninguna respuesta
+# se deja de sondear y solo se prueba la conexión, con backoff exponencial (segundos)
+OFFLINE_AFTER_FAILED_CYCLES = 3
+OFFLINE_PROBE_MIN = 5
+OFFLINE_PROBE_MAX = 300
+OFFLINE_PROBE_TIMEOUT = 3
+# Timeouts derivados del RTT observado (p99 x2 + margen), nunca por debajo del
+# mínimo ni por encima del timeout fijo de cada llamada (segundos)
+LOCAL_TIMEOUT_MIN = 1.5
+LOCAL_TIMEOUT_MARGIN = 1.0
+CLOUD_TIMEOUT_MIN = 5
+CLOUD_TIMEOUT_MARGIN = 3
 
 # Códigos numéricos de la Local API -> etiquetas
 # 0/1=Stop, 2=Cooling, 3=Heating, 4=Fan, 5=Dry, 7=Auto
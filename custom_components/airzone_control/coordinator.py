@@ -2,20 +2,46 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from datetime import timedelta
 from typing import Any, Dict, Tuple, List, Optional
 
-import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL
+from .calibration import WebserverCapacity, async_load_capacity
+from .cassette import CassetteRecorder, RecordingSession
+from .const import (
+    ADAPTIVE_FAST_WINDOW,
+    ADAPTIVE_IDLE_CYCLES,
+    ADAPTIVE_RELAX_FACTOR,
+    ADAPTIVE_STRESS_FACTOR,
+    ADAPTIVE_STRESS_MIN_POLL,
+    DOMAIN,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    OFFLINE_AFTER_FAILED_CYCLES,
+    OFFLINE_PROBE_MAX,
+    OFFLINE_PROBE_MIN,
+    OFFLINE_PROBE_TIMEOUT,
+    POLL_DEADLINE_FACTOR,
+    POLL_DEADLINE_MIN,
+)
+from .deadline import CycleDeadline, deadline_expired, detached_context
+from .profiling import CycleProfiler
+from .telemetry import PhaseTimings, RequestTelemetry
+from .transport import AiohttpTransport, AirzoneTransport
 
 _LOGGER = logging.getLogger(__name__)
 
 # Prefijos candidatos vistos en firmwares reales
 CANDIDATE_PREFIXES: list[str] = ["", "/api/v1", "/airzone/local/api/v1", "/lapi/v1"]
 INTEGRATION_DRIVER = "homeassistant"
+# Campos de zona que delatan actividad (órdenes del usuario o de otro mando),
+# no las lecturas de sensores que cambian solas en cada ciclo
+ACTIVITY_FIELDS = ("on", "mode", "setpoint", "coolsetpoint", "heatsetpoint", "speed", "sleep", "usermode")
 
 class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
     """Coordinador de datos para Airzone Local API (1.76+ → 1.78)."""
@@ -27,12 +53,12 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         port: int = DEFAULT_PORT,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
         api_prefix: str | None = None,
+        transport: AirzoneTransport | None = None,
     ) -> None:
         self._host = host.strip()
         self._port = int(port or DEFAULT_PORT)
-        self._https_port = 3443
-        self._prefix: str | None = api_prefix  # puede venir del config_flow
-        self._prefer_https: Optional[bool] = None  # autodetección en runtime
+        # HTTP (prefijo, fallback http/https); en pruebas puede ser InMemoryTransport
+        self.transport: AirzoneTransport = transport or AiohttpTransport(self._host, self._port, prefix=api_prefix)
 
         super().__init__(
             hass,
@@ -41,8 +67,6 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
             update_interval=timedelta(seconds=max(2, int(scan_interval or DEFAULT_SCAN_INTERVAL))),
         )
 
-        self._session: aiohttp.ClientSession | None = None
-
         # Caches de datos normalizados
         self.webserver: dict | None = None
         self.systems: dict[int, dict] = {}
@@ -58,6 +82,14 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
 
         # Control "seguir global"
         self._follow_master_enabled: set[int] = set()
+        # Tareas en segundo plano (follow-master, refrescos tras un PUT...);
+        # como mucho una pasada de follow-master en curso por sistema
+        self._background_tasks: set[asyncio.Task] = set()
+        self._follow_master_tasks: dict[int, asyncio.Task] = {}
+        # Límites de las operaciones en bloque (servicio airzone_control.calibrate)
+        self.capacity = WebserverCapacity()
+        # Calibración en curso: sondeos en pausa y sin ventana rápida por sus PUTs
+        self.calibrating = False
 
         # API version y WS info
         self.version: str | None = None
@@ -68,23 +100,209 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         self._hvac_empty_reads = 0
         self._iaq_empty_reads = 0
 
+        # Webserver apagado: ciclos seguidos sin ninguna respuesta y sondeo con backoff
+        self._failed_cycles = 0
+        self.offline_since: float | None = None
+        self._probe_attempts = 0
+        self._next_probe_at = 0.0
+
+        # Intervalo adaptativo (None = intervalo fijo): rápido tras una escritura o un
+        # cambio, más lento en reposo y estirado cuando el webserver va justo
+        self.base_interval = self.update_interval.total_seconds()
+        self.interval_range: tuple[float, float] | None = None
+        self._fast_until = 0.0
+        self._idle_cycles = 0
+        self._activity_signature: dict[tuple[int, int], tuple] | None = None
+        self._poll_ewma: float | None = None
+        self._server_errors_seen = 0
+
+        # Cambios del último ciclo para la capa de entidades (None = refrescar todo)
+        self.changed_zone_keys: set[tuple[int, int]] | None = None
+        self.changed_iaq_keys: set[tuple[int, int]] | None = None
+
+        # Contadores y latencias por endpoint (diagnóstico)
+        self.telemetry = RequestTelemetry()
+        self.transport.observer = self.telemetry.record
+        # Tiempos por fase del ciclo (ventana móvil)
+        self.phases = PhaseTimings()
+        # Perfilado bajo demanda (servicio airzone_control.profile)
+        self.profiler: CycleProfiler | None = None
+        # Grabación de intercambios bajo demanda (servicio airzone_control.record)
+        self.recorder: CassetteRecorder | None = None
+        self._recording_holder: Any = None
+
         # Compatibilidad entre varias entradas (p. ej. Local + Cloud simultáneas)
         self.connection_type = "local"
         self.uid_scope = "local"
         self.read_only = False
 
-    # ---------------- bases URL / sesión ----------------
-    def _http_base(self) -> str:
-        return f"http://{self._host}:{self._port}{(self._prefix or '')}"
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Ciclo de refresco con medición de duración y peticiones por ciclo."""
+        profiler = self.profiler
+        if profiler is not None:
+            try:
+                profiler.start()
+            except ValueError as e:
+                # Otro perfilador activo en el hilo (p. ej. la integración Profiler de HA)
+                _LOGGER.error("Airzone profile capture cancelled: %s", e)
+                self.profiler = profiler = None
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.begin_cycle()
+        token = self.telemetry.begin_poll()
+        deadline_token = CycleDeadline(self.poll_deadline).begin()
+        self.phases.begin_cycle()
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            CycleDeadline.end(deadline_token)
+            if profiler is not None and profiler.stop():
+                self.profiler = None
+                self._async_track_task(self._async_write_profile(profiler))
+            if recorder is not None and recorder.end_cycle():
+                self._stop_recording()
+                self._async_track_task(self._async_write_cassette(recorder))
+            self.telemetry.end_poll(token)
+            summary = self.phases.end_cycle()
+            _LOGGER.debug(
+                "%s poll: %s (%s requests)",
+                self.uid_scope if self.connection_type != "local" else self._host,
+                summary,
+                self.telemetry.last_poll_requests,
+            )
+
+    def _async_track_task(self, coro: Any) -> asyncio.Task:
+        """Lanza una tarea en segundo plano que async_close() podrá cancelar."""
+        task = self.hass.async_create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    @property
+    def poll_deadline(self) -> float:
+        """Segundos que puede durar un ciclo completo, escaleras de fallback incluidas."""
+        # Con el intervalo adaptativo, el plazo sigue al intervalo configurado y no al rápido
+        interval = self.update_interval.total_seconds() if self.update_interval else DEFAULT_SCAN_INTERVAL
+        if self.interval_range is not None:
+            interval = max(interval, self.base_interval)
+        return max(POLL_DEADLINE_MIN, interval * POLL_DEADLINE_FACTOR)
+
+    def _keep_last_state(self, step: str) -> dict:
+        """Plazo del ciclo agotado en `step`: se aborta y se conserva el último estado válido."""
+        self.phases.note(f"deadline at {step}")
+        if not self.data:
+            raise UpdateFailed(f"Refresh deadline of {self.poll_deadline:.0f} s exceeded during {step}")
+        _LOGGER.warning(
+            "Refresh deadline of %.0f s exceeded during %s; keeping last valid state",
+            self.poll_deadline,
+            step,
+        )
+        return self.data
+
+    @property
+    def pending_tasks(self) -> int:
+        """Tareas en segundo plano del coordinator que aún no han terminado."""
+        return len(self._background_tasks)
 
-    def _https_base(self) -> str:
-        return f"https://{self._host}:{self._https_port}{(self._prefix or '')}"
+    async def _async_cancel_background_tasks(self) -> None:
+        tasks = [task for task in self._background_tasks if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._follow_master_tasks.clear()
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self._session and not self._session.closed:
-            return self._session
-        self._session = aiohttp.ClientSession()
-        return self._session
+    async def _gather_limited(
+        self, coroutines: list[Any], limit: int | None = None, pacing: float | None = None
+    ) -> list[Any]:
+        """gather con como mucho `limit` peticiones a la vez y `pacing` segundos tras cada una.
+
+        Sin argumentos usa la capacidad del webserver (calibrada o la de por defecto).
+        """
+        semaphore = asyncio.Semaphore(limit or self.capacity.concurrency)
+        pause = self.capacity.pacing if pacing is None else pacing
+
+        async def _run(coro: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await coro
+                finally:
+                    if pause:
+                        await asyncio.sleep(pause)
+
+        return await asyncio.gather(*[_run(coro) for coro in coroutines], return_exceptions=True)
+
+    @property
+    def capacity_key(self) -> str:
+        """Clave del controlador en el almacén de capacidad: la MAC si se conoce."""
+        mac = str((self.webserver or {}).get("mac") or "").strip().lower()
+        return mac or f"{self._host}:{self._port}"
+
+    async def async_load_capacity(self) -> None:
+        """Recupera la capacidad calibrada de este webserver, si la hay."""
+        capacity = await async_load_capacity(self.hass, self.capacity_key)
+        if capacity is not None:
+            self.capacity = capacity
+            _LOGGER.debug(
+                "Airzone %s: bulk operations limited to %s concurrent requests, %.2f s apart",
+                self.capacity_key,
+                capacity.concurrency,
+                capacity.pacing,
+            )
+
+    async def _async_write_profile(self, profiler: CycleProfiler) -> None:
+        try:
+            path = await self.hass.async_add_executor_job(profiler.write)
+        except Exception as e:
+            _LOGGER.error("Could not write Airzone profile %s: %s", profiler.path, e)
+            return
+        _LOGGER.info("Airzone profile of %s cycles written to %s", profiler.cycles, path)
+
+    async def _async_session_holder(self) -> Any:
+        """Objeto cuyo _session hace las peticiones HTTP de este coordinator."""
+        if not isinstance(self.transport, AiohttpTransport):
+            raise ValueError("This transport cannot be recorded")
+        await self.transport.async_ensure_session()
+        return self.transport
+
+    async def async_start_recording(self, recorder: CassetteRecorder) -> None:
+        """Graba los intercambios HTTP de los próximos ciclos en un cassette."""
+        holder = await self._async_session_holder()
+        if isinstance(holder._session, RecordingSession):
+            raise ValueError("HTTP exchanges are already being recorded")
+        self._recording_holder = holder
+        recorder.meta = {
+            "prefix": self.transport.prefix,
+            "scan_interval": self.update_interval.total_seconds() if self.update_interval else None,
+        }
+        holder._session = recorder.wrap(holder._session)
+        self.recorder = recorder
+
+    def _stop_recording(self) -> None:
+        self.recorder = None
+        holder, self._recording_holder = self._recording_holder, None
+        if holder is not None and isinstance(holder._session, RecordingSession):
+            holder._session = holder._session.inner
+
+    async def _async_write_cassette(self, recorder: CassetteRecorder) -> None:
+        try:
+            path = await self.hass.async_add_executor_job(recorder.write)
+        except Exception as e:
+            _LOGGER.error("Could not write Airzone cassette %s: %s", recorder.path, e)
+            return
+        _LOGGER.info(
+            "Airzone cassette with %s exchanges over %s cycles written to %s",
+            len(recorder.records),
+            recorder.cycles,
+            path,
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notifica a las entidades midiendo el coste del fan-out."""
+        started = time.monotonic()
+        super().async_update_listeners()
+        self.phases.add("fanout", time.monotonic() - started)
 
     def scoped_unique_id(self, legacy_unique_id: str) -> str:
         """Devuelve un unique_id estable, preservando los IDs locales actuales."""
@@ -99,39 +317,13 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         return f"{self.uid_scope}::{legacy_identifier}"
 
     async def _detect_prefix(self) -> None:
-        """Detecta prefijo ('', '/api/v1') probando primero el esquema preferido y, si falla, el alternativo."""
-        if self._prefix is not None:
+        """Detecta prefijo ('', '/api/v1'...) probando primero el esquema preferido y, si falla, el alternativo."""
+        if self.transport.prefix is not None:
             return
-        timeout = 6
-        s = await self._ensure_session()
-
-        # Orden de prueba: si ya se decidió https/http, respetarlo; si no, http primero.
-        schemes = ["https", "http"] if self._prefer_https else ["http", "https"]
-
-        for scheme in schemes:
-            for pref in CANDIDATE_PREFIXES:
-                base = (self._https_base() if scheme == "https" else self._http_base()).replace((self._prefix or ""), pref)
-                try:
-                    async with s.get(f"{base}/webserver", timeout=timeout, ssl=(False if scheme == "https" else None)) as r:
-                        if r.status == 200:
-                            self._prefix = pref
-                            self._prefer_https = (scheme == "https")
-                            self.transport_scheme = scheme
-                            _LOGGER.debug("Detected API prefix via GET /webserver: %s (scheme=%s)", pref, scheme)
-                            return
-                except Exception:
-                    pass
-                try:
-                    async with s.post(f"{base}/webserver", json={}, timeout=timeout, ssl=(False if scheme == "https" else None)) as r:
-                        if r.status == 200:
-                            self._prefix = pref
-                            self._prefer_https = (scheme == "https")
-                            self.transport_scheme = scheme
-                            _LOGGER.debug("Detected API prefix via POST /webserver: %s (scheme=%s)", pref, scheme)
-                            return
-                except Exception:
-                    pass
-        # Si no detecta, deja _prefix tal cual (None) y que fallen las llamadas con logs útiles.
+        self.phases.note("prefix detection")
+        if await self.transport.async_detect_prefix(CANDIDATE_PREFIXES):
+            self.transport_scheme = self.transport.scheme
+        # Si no detecta, deja el prefijo en None y que fallen las llamadas con logs útiles.
 
     # ---------------- helpers HTTP genéricos (GET/POST con HTTPS fallback) ----------------
     async def _request_json(
@@ -142,55 +334,11 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         En https no verifica certificado (self-signed de LAPI 1.78).
         """
         await self._detect_prefix()
-        s = await self._ensure_session()
-
-        # Construir candidatos en orden
-        order = ["https", "http"] if self._prefer_https else ["http", "https"]
-        bases = []
-        for scheme in order:
-            base = self._https_base() if scheme == "https" else self._http_base()
-            ssl_opt = (False if scheme == "https" else None)
-            bases.append((scheme, base, ssl_opt))
-
-        last_txt = ""
-        last_status = None
-        for scheme, base, ssl_opt in bases:
-            url = f"{base}{path}"
-            try:
-                if method == "GET":
-                    async with s.get(url, params=params, timeout=timeout, ssl=ssl_opt) as resp:
-                        txt = await resp.text()
-                        if resp.status != 200:
-                            _LOGGER.debug("%s %s %s -> %s %s", method, path, params, resp.status, txt)
-                            last_status, last_txt = resp.status, txt
-                            continue
-                        try:
-                            data = await resp.json(content_type=None)
-                        except Exception:
-                            data = {"raw": txt}
-                else:
-                    async with s.request(method, url, json=(body or {}), timeout=timeout, ssl=ssl_opt) as resp:
-                        txt = await resp.text()
-                        if resp.status != 200:
-                            _LOGGER.debug("%s %s %s -> %s %s", method, path, body, resp.status, txt)
-                            last_status, last_txt = resp.status, txt
-                            continue
-                        try:
-                            data = await resp.json(content_type=None)
-                        except Exception:
-                            data = {"raw": txt}
-
-                # éxito
-                self._prefer_https = (scheme == "https")
-                self.transport_scheme = scheme
-                return data
-            except Exception as e:
-                last_txt = str(e)
-                continue
-
-        if last_status:
-            _LOGGER.debug("%s %s final error -> %s %s", method, path, last_status, last_txt)
-        return None
+        result = await self.transport.async_request(method, path, params=params, body=body, timeout=timeout)
+        if result is None:
+            return None
+        self.transport_scheme = result.scheme
+        return result.json()
 
     async def _get_json(self, path: str, params: dict | None = None) -> dict | list | None:
         return await self._request_json("GET", path, params=params)
@@ -553,6 +701,16 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
     def get_system(self, system_id: int) -> dict | None:
         return self.systems.get(int(system_id))
 
+    def zone_changed(self, system_id: int, zone_id: int) -> bool:
+        """True si la zona cambió en el último ciclo (o si no se sabe)."""
+        keys = self.changed_zone_keys
+        return keys is None or (int(system_id), int(zone_id)) in keys
+
+    def iaq_changed(self, system_id: int, iaq_id: int) -> bool:
+        """True si el IAQ cambió en el último ciclo (o si no se sabe)."""
+        keys = self.changed_iaq_keys
+        return keys is None or (int(system_id), int(iaq_id)) in keys
+
     # --- Zona máster (heurística) ---
     def master_zone_id(self, system_id: int) -> Optional[int]:
         zones = self.zones_of_system(system_id)
@@ -584,10 +742,20 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         sid = int(system_id)
         if enabled:
             self._follow_master_enabled.add(sid)
-            self.hass.async_create_task(self._enforce_follow_master(sid))
+            self._async_schedule_follow_master(sid)
         else:
             self._follow_master_enabled.discard(sid)
 
+    def _async_schedule_follow_master(self, system_id: int) -> None:
+        # Si la pasada anterior sigue en curso (webserver lento), no apilar otra
+        task = self._follow_master_tasks.get(system_id)
+        if task is not None and not task.done():
+            return
+        # Sin el plazo del ciclo que la lanza, igual que las lecturas compartidas de Cloud
+        self._follow_master_tasks[system_id] = detached_context().run(
+            self._async_track_task, self._enforce_follow_master(system_id)
+        )
+
     async def _enforce_follow_master(self, system_id: int) -> None:
         sid = int(system_id)
         if sid not in self._follow_master_enabled:
@@ -607,7 +775,7 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         except Exception:
             pass
 
-        tasks: list[asyncio.Task] = []
+        bodies: dict[tuple[int, int], dict] = {}
         for (s, zid), z in (self.data or {}).items():
             if s != sid:
                 continue
@@ -618,18 +786,21 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
             except Exception:
                 cur_on = 0
             if cur_on != desired_on:
-                tasks.append(asyncio.create_task(self.async_set_zone_params(sid, zid, on=desired_on)))
+                bodies[(sid, zid)] = {"on": desired_on}
                 continue
             if desired_on == 1 and desired_mode is not None:
                 try:
                     cur_mode = int(z.get("mode"))
                     if cur_mode != desired_mode:
-                        tasks.append(asyncio.create_task(self.async_set_zone_params(sid, zid, mode=desired_mode)))
+                        bodies[(sid, zid)] = {"mode": desired_mode}
                 except Exception:
                     pass
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if bodies:
+            # Refresco en segundo plano: esperarlo aquí dejaría esta pasada "en curso"
+            # y el refresco no podría programar la siguiente comprobación
+            await self.async_set_zones_params(bodies, request_refresh=False, return_exceptions=True)
+            self._async_track_task(self.async_request_refresh())
 
     def _known_system_ids(self) -> list[int]:
         """System IDs conocidos a partir del último estado válido."""
@@ -837,11 +1008,129 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
     # ---------------- update ----------------
 
     async def _async_update_data(self) -> dict[Tuple[int,int], dict]:
+        # Calibración en curso: ningún sondeo debe sumarse a las escrituras medidas
+        if self.calibrating and self.data:
+            return self.data
+        # Webserver caído: una sola comprobación barata con backoff en vez de la escalera completa
+        if self.offline_since is not None and not await self._async_offline_probe():
+            raise UpdateFailed(
+                f"Airzone webserver {self._host} is offline; next check in "
+                f"{max(0.0, self._next_probe_at - time.monotonic()):.0f} s"
+            )
+        started = time.monotonic()
+        try:
+            data = await self._async_poll()
+        finally:
+            self._track_reachability(started)
+        if self.interval_range is not None:
+            self._adapt_interval(data, time.monotonic() - started)
+        return data
+
+    def set_interval_range(self, minimum: float, maximum: float) -> None:
+        """Activa el intervalo adaptativo entre `minimum` y `maximum` segundos."""
+        minimum = max(2.0, float(minimum))
+        maximum = max(minimum, float(maximum))
+        self.base_interval = min(max(self.base_interval, minimum), maximum)
+        self.interval_range = (minimum, maximum)
+
+    def _note_activity(self) -> None:
+        """Abre la ventana de sondeo rápido (escritura del usuario o cambio detectado)."""
+        self._fast_until = time.monotonic() + ADAPTIVE_FAST_WINDOW
+        self._idle_cycles = 0
+        if self.interval_range is not None:
+            self.update_interval = timedelta(seconds=self.interval_range[0])
+
+    def _controller_stressed(self, duration: float) -> bool:
+        """5xx, lecturas vacías, plazo agotado o un sondeo mucho más lento de lo habitual."""
+        server_errors = self.transport.server_errors
+        stressed = server_errors > self._server_errors_seen or self._hvac_empty_reads > 0 or deadline_expired()
+        self._server_errors_seen = server_errors
+        ewma = self._poll_ewma
+        if ewma is not None and duration > max(ADAPTIVE_STRESS_MIN_POLL, 2 * ewma):
+            stressed = True
+        # La media no aprende de los ciclos estresados para no normalizar la lentitud
+        if not stressed:
+            self._poll_ewma = duration if ewma is None else 0.8 * ewma + 0.2 * duration
+        return stressed
+
+    def _adapt_interval(self, data: dict, duration: float) -> None:
+        minimum, maximum = self.interval_range
+        signature = {
+            key: tuple(zone.get(field) for field in ACTIVITY_FIELDS) for key, zone in (data or {}).items()
+        }
+        if self._activity_signature is not None and signature != self._activity_signature:
+            self._note_activity()
+        else:
+            self._idle_cycles += 1
+        self._activity_signature = signature
+
+        current = self.update_interval.total_seconds()
+        if self._controller_stressed(duration):
+            interval = min(maximum, max(current, self.base_interval) * ADAPTIVE_STRESS_FACTOR)
+        elif time.monotonic() < self._fast_until:
+            interval = minimum
+        elif self._idle_cycles >= ADAPTIVE_IDLE_CYCLES:
+            interval = min(maximum, max(current, self.base_interval) * ADAPTIVE_RELAX_FACTOR)
+        else:
+            interval = self.base_interval
+        if interval != current:
+            _LOGGER.debug("Airzone %s: scan interval %.1f s -> %.1f s", self._host, current, interval)
+            self.update_interval = timedelta(seconds=interval)
+
+    async def _async_offline_probe(self) -> bool:
+        """True si el webserver vuelve a aceptar conexiones: se reanuda el sondeo en este mismo ciclo."""
+        # Una escritura que ha respondido mientras tanto también vale como prueba
+        answered = (self.transport.last_success or 0) > (self.offline_since or 0)
+        if not answered and time.monotonic() < self._next_probe_at:
+            return False
+        self.phases.note("offline probe")
+        if answered or await self.transport.async_probe(OFFLINE_PROBE_TIMEOUT):
+            _LOGGER.info("Airzone webserver %s answers again; resuming polling", self._host)
+            self.offline_since = None
+            # Un fallo total más vuelve a dejarlo fuera de línea sin esperar otros N ciclos
+            self._failed_cycles = OFFLINE_AFTER_FAILED_CYCLES - 1
+            return True
+        self._schedule_probe()
+        return False
+
+    def _schedule_probe(self) -> None:
+        # Backoff exponencial con "equal jitter" para no sincronizar varios controladores
+        delay = min(OFFLINE_PROBE_MAX, OFFLINE_PROBE_MIN * 2 ** self._probe_attempts)
+        self._probe_attempts += 1
+        self._next_probe_at = time.monotonic() + delay / 2 + random.uniform(0, delay / 2)
+
+    def _track_reachability(self, started: float) -> None:
+        last_success = self.transport.last_success
+        if last_success is not None and last_success >= started:
+            self._failed_cycles = 0
+            self._probe_attempts = 0
+            return
+        self._failed_cycles += 1
+        if self.offline_since is None and self._failed_cycles >= OFFLINE_AFTER_FAILED_CYCLES:
+            self.offline_since = time.monotonic()
+            self._schedule_probe()
+            _LOGGER.warning(
+                "Airzone webserver %s did not answer in %s refreshes; checking it with backoff until it is back",
+                self._host,
+                self._failed_cycles,
+            )
+
+    async def _async_poll(self) -> dict[Tuple[int,int], dict]:
+        # 0) Prefijo de la API (solo hace peticiones la primera vez)
+        self.phases.lap("setup")
+        await self._detect_prefix()
+        self.phases.lap("prefix")
+        if deadline_expired():
+            return self._keep_last_state("prefix")
+
         # 1) HVAC (todas las zonas)
         try:
             hvac_payload = await self._fetch_hvac_all()
         except Exception as e:
             raise UpdateFailed(f"HVAC fetch error: {e}") from e
+        # Una lectura cortada por el plazo puede estar incompleta: no se usa
+        if deadline_expired():
+            return self._keep_last_state("hvac")
 
         extracted_zones = self._extract_zone_list(hvac_payload) or []
         mapped = self._map_zones(extracted_zones)
@@ -872,6 +1161,8 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         for sid in {sid for (sid, _zid) in mapped.keys()}:
             systems.setdefault(int(sid), {"systemID": int(sid)})
         self.systems = systems
+        self.phases.note(f"hvac {self.transport_hvac}")
+        self.phases.lap("hvac")
 
         # 2) Webserver info (GET con fallback a POST)
         try:
@@ -896,10 +1187,16 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
             if detected_version:
                 self.version = detected_version
 
-        await self._ensure_integration_driver()
+        if not deadline_expired():
+            # Solo se comprueba una vez: no gastarla en un ciclo ya sin plazo
+            await self._ensure_integration_driver()
+        self.phases.lap("webserver")
 
-        # 3) IAQ
-        iaq_items = await self._fetch_iaq_all()
+        # 3) IAQ; sin plazo restante, o cortada a medias, se conservan las anteriores
+        iaq_items = [] if deadline_expired() else await self._fetch_iaq_all()
+        if deadline_expired():
+            self.phases.note("deadline at iaq")
+            iaq_items = list(self.iaqs.values())
         new_iaqs: dict[tuple[int, int], dict] = {}
         for item in iaq_items:
             try:
@@ -921,6 +1218,8 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
             )
         else:
             self.iaqs = {}
+        self.phases.note(f"iaq {self.transport_iaq}")
+        self.phases.lap("iaq")
 
         # 4) Perfiles de sistema
         system_ids = sorted({sid for (sid, _z) in mapped.keys()})
@@ -930,10 +1229,11 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
             prof["zone_count"] = len([1 for (s, _z) in mapped.keys() if s == sid])
             prof["iaq_count"] = len([1 for (s, _i) in self.iaqs.keys() if s == sid]) or (1 if sid in self.iaq_fallback else 0)
             self.system_profiles[sid] = prof
+        self.phases.lap("profiles")
 
         # 5) Enforce follow-master en segundo plano
         for sid in list(self._follow_master_enabled):
-            self.hass.async_create_task(self._enforce_follow_master(sid))
+            self._async_schedule_follow_master(sid)
 
         return mapped
 
@@ -944,65 +1244,62 @@ class AirzoneCoordinator(DataUpdateCoordinator[dict[Tuple[int,int], dict]]):
         body = {"systemID": int(system_id), "zoneID": int(zone_id)}
         body.update(kwargs)
         await self._detect_prefix()
-        s = await self._ensure_session()
-
-        # Intentar PUT por esquema preferido y fallback
-        for scheme in (["https","http"] if self._prefer_https else ["http","https"]):
-            base = self._https_base() if scheme == "https" else self._http_base()
-            url = f"{base}/hvac"
-            try:
-                async with s.put(url, json=body, timeout=6, ssl=(False if scheme == "https" else None)) as resp:
-                    txt = await resp.text()
-                    if resp.status != 200:
-                        _LOGGER.error("PUT /hvac %s -> %s %s", body, resp.status, txt)
-                        continue
-                    try:
-                        data = await resp.json(content_type=None)
-                    except Exception:
-                        data = {"raw": txt}
-                    # refresco sin bloquear
-                    if request_refresh:
-                        self.hass.async_create_task(self.async_request_refresh())
-                    self._prefer_https = (scheme == "https")
-                    self.transport_scheme = scheme
-                    return data
-            except Exception as e:
-                _LOGGER.debug("PUT /hvac %s failed on %s: %s", body, scheme, e)
-                continue
 
-        raise UpdateFailed("PUT /hvac failed on both http/https")
+        # PUT por esquema preferido y fallback
+        result = await self.transport.async_request("PUT", "/hvac", body=body, timeout=6, failure_level=logging.ERROR)
+        if result is None:
+            raise UpdateFailed("PUT /hvac failed on both http/https")
+        self.transport_scheme = result.scheme
+        if not self.calibrating:
+            self._note_activity()
+        # refresco sin bloquear
+        if request_refresh:
+            self._async_track_task(self.async_request_refresh())
+        return result.json()
+
+    async def async_set_zones_params(
+        self,
+        bodies: dict[tuple[int, int], dict],
+        *,
+        request_refresh: bool = True,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """PUT /hvac a varias zonas dentro de la capacidad del webserver y un solo refresco.
+
+        Con return_exceptions=False se lanza el primer error, pero solo después
+        de intentar todas las zonas y refrescar.
+        """
+        results = await self._gather_limited(
+            [
+                self.async_set_zone_params(sid, zid, request_refresh=False, **body)
+                for (sid, zid), body in bodies.items()
+            ]
+        )
+        if request_refresh:
+            await self.async_request_refresh()
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
 
     async def async_set_iaq_params(self, system_id: int, iaq_id: int, **kwargs) -> dict | None:
         """PUT /iaq con refresco inmediato (no bloqueante)."""
         body = {"systemID": int(system_id), "iaqsensorID": int(iaq_id)}
         body.update(kwargs)
         await self._detect_prefix()
-        s = await self._ensure_session()
-
-        for scheme in (["https","http"] if self._prefer_https else ["http","https"]):
-            base = self._https_base() if scheme == "https" else self._http_base()
-            url = f"{base}/iaq"
-            try:
-                async with s.put(url, json=body, timeout=6, ssl=(False if scheme == "https" else None)) as resp:
-                    txt = await resp.text()
-                    if resp.status != 200:
-                        _LOGGER.error("PUT /iaq %s -> %s %s", body, resp.status, txt)
-                        continue
-                    try:
-                        data = await resp.json(content_type=None)
-                    except Exception:
-                        data = {"raw": txt}
-                    self.hass.async_create_task(self.async_request_refresh())
-                    self._prefer_https = (scheme == "https")
-                    self.transport_scheme = scheme
-                    return data
-            except Exception as e:
-                _LOGGER.debug("PUT /iaq %s failed on %s: %s", body, scheme, e)
-                continue
 
-        raise UpdateFailed("PUT /iaq failed on both http/https")
+        result = await self.transport.async_request("PUT", "/iaq", body=body, timeout=6, failure_level=logging.ERROR)
+        if result is None:
+            raise UpdateFailed("PUT /iaq failed on both http/https")
+        self.transport_scheme = result.scheme
+        if not self.calibrating:
+            self._note_activity()
+        self._async_track_task(self.async_request_refresh())
+        return result.json()
 
     async def async_close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        if self.recorder is not None:
+            self._stop_recording()
+        await self._async_cancel_background_tasks()
+        await self.transport.async_close()
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import json
 import logging
-from typing import Any
+import time
+from datetime import timedelta
+from typing import Any, Callable
 
 import aiohttp
 from homeassistant.core import HomeAssistant
@@ -11,21 +14,31 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from .calibration import WebserverCapacity
 from .const import (
+    CLOUD_PUSH_RECONCILE_INTERVAL,
     CLOUD_CATEGORY_ACS,
     CLOUD_CATEGORY_AUX,
     CLOUD_CATEGORY_CLIMATE_ZONES,
     CLOUD_CATEGORY_ENERGY,
     CLOUD_CATEGORY_IAQ,
+    CLOUD_PROFILE_COMPLEMENT_LOCAL,
+    CONF_CONNECTION_TYPE,
+    CONF_WEBSERVER_MAC,
     CONNECTION_TYPE_CLOUD,
+    CONNECTION_TYPE_LOCAL,
     DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES,
     DEFAULT_CLOUD_BASE_URL,
     DEFAULT_CLOUD_INCLUDE_CATEGORIES,
     DEFAULT_CLOUD_INCLUDE_BOUND_IAQS,
     DEFAULT_CLOUD_INCLUDE_DEVICE_IDS,
+    DEFAULT_BULK_CONCURRENCY,
     DEFAULT_CLOUD_SCAN_INTERVAL,
+    DOMAIN,
 )
+from .cloud_hub import AirzoneCloudHub, CloudApiError
 from .coordinator import AirzoneCoordinator
+from .deadline import DeadlineExceeded, deadline_expired
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,49 +57,344 @@ SUPPORTED_STATUS_DEVICE_TYPES = (
     | AUX_DEVICE_TYPES
 )
 
+# Webserver status (firmware, Wi-Fi quality...) changes slowly; refresh it
+# every 10 minutes instead of on every poll.
+CLOUD_WS_STATUS_REFRESH_INTERVAL = 600
 
-class CloudApiError(Exception):
-    """Airzone Cloud API error with a stable backend error id when available."""
+# Realtime device-state stream (Socket.IO over websocket, relative to the API base URL).
+CLOUD_PUSH_PATH = "/websockets/connect"
+CLOUD_PUSH_MAX_BACKOFF = 300
 
-    def __init__(self, error_id: str | None, message: str | None = None) -> None:
-        self.error_id = error_id or "unknown"
-        self.message = message or self.error_id
-        super().__init__(self.message)
+# Shared hub results older than this are dropped (entries never accept them).
+CLOUD_HUB_CACHE_MAX_AGE = 900
 
 
-async def async_cloud_login(
-    session: aiohttp.ClientSession,
-    email: str,
-    password: str,
+# ---------------- Cloud -> Local API normalization tables ----------------
+#
+# Everything the Cloud normalizers need is precompiled here once, at import
+# time, so a poll only does dict lookups and conversions per device.
+
+
+def _to_number(value: Any) -> int | float | None:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        num = float(value)
+    except Exception:
+        return None
+    return int(num) if num.is_integer() else num
+
+
+def _to_int(value: Any) -> int | None:
+    num = _to_number(value)
+    if num is None:
+        return None
+    try:
+        return int(num)
+    except Exception:
+        return None
+
+
+def _bool_to_int(value: Any) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 1 if value else 0
+    if isinstance(value, (int, float)):
+        return 1 if int(value) else 0
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "on"):
+        return 1
+    if text in ("0", "false", "no", "off"):
+        return 0
+    return None
+
+
+def _temp_celsius(value: Any) -> float | None:
+    if isinstance(value, dict):
+        for key in ("celsius", "cel", "value"):
+            if key in value and value.get(key) is not None:
+                try:
+                    return float(value[key])
+                except Exception:
+                    return None
+        return None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _int_list(value: Any) -> list[int]:
+    if not isinstance(value, list):
+        return []
+    out: list[int] = []
+    for item in value:
+        num = _to_int(item)
+        if num is not None:
+            out.append(num)
+    return out
+
+
+# Cloud mode code -> Local API mode code (0=Stop, 2=Cool, 3=Heat, 4=Fan, 5=Dry, 7=Auto)
+_CLOUD_MODE_MAP: dict[int, int] = {
+    0: 0,
+    1: 7,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+    6: 3,
+    7: 3,
+    8: 3,
+    9: 3,
+    10: 2,
+    11: 2,
+    12: 2,
+}
+
+
+def _canonical_mode(cloud_mode: Any) -> int | None:
+    if type(cloud_mode) is int:
+        return _CLOUD_MODE_MAP.get(cloud_mode)
+    try:
+        code = int(cloud_mode)
+    except Exception:
+        return None
+    return _CLOUD_MODE_MAP.get(code)
+
+
+def _canonical_modes(modes: Any) -> list[int]:
+    if not isinstance(modes, list):
+        return []
+    out: list[int] = []
+    for value in modes:
+        mapped = _canonical_mode(value)
+        if mapped is None:
+            continue
+        if mapped not in out:
+            out.append(mapped)
+    return out
+
+
+def _mode_key_table(
+    per_mode: dict[int, tuple[str, ...]],
+    fallback: tuple[str, ...],
     *,
-    base_url: str = DEFAULT_CLOUD_BASE_URL,
-    timeout: int = 15,
-) -> dict[str, Any]:
-    """Authenticate against Airzone Cloud and return the login payload."""
-    url = f"{base_url.rstrip('/')}/auth/login"
-    async with session.post(
-        url,
-        json={"email": email.strip(), "password": password},
-        timeout=timeout,
-    ) as response:
-        text = await response.text()
-        payload: dict[str, Any] = {}
-        try:
-            parsed = await response.json(content_type=None)
-            if isinstance(parsed, dict):
-                payload = parsed
-        except Exception:
-            payload = {}
+    first: tuple[str, ...] = (),
+) -> dict[int | None, tuple[str, ...]]:
+    """Precompute, per canonical mode, the ordered keys to try: mode keys then fallback."""
+    table: dict[int | None, tuple[str, ...]] = {}
+    for mode, keys in per_mode.items():
+        ordered = first + keys
+        table[mode] = ordered + tuple(key for key in fallback if key not in ordered)
+    table[None] = first + tuple(key for key in fallback if key not in first)
+    return table
+
+
+_SETPOINT_KEYS = _mode_key_table(
+    {
+        3: ("setpoint_air_heat", "setpoint_air_emerheat"),
+        2: ("setpoint_air_cool",),
+        4: ("setpoint_air_vent",),
+        5: ("setpoint_air_dry",),
+        7: ("setpoint_air_auto",),
+        0: ("setpoint_air_stop",),
+    },
+    (
+        "setpoint_air_heat",
+        "setpoint_air_cool",
+        "setpoint_air_auto",
+        "setpoint_air_dry",
+        "setpoint_air_vent",
+        "setpoint_air_stop",
+    ),
+    first=("setpoint",),
+)
 
-        if response.status == 200:
-            return payload
+_MIN_TEMP_KEYS = _mode_key_table(
+    {
+        3: ("range_sp_hot_air_min", "range_sp_emerheat_air_min"),
+        2: ("range_sp_cool_air_min",),
+        4: ("range_sp_vent_air_min",),
+        5: ("range_sp_dry_air_min",),
+        7: ("range_sp_auto_air_min",),
+        0: ("range_sp_stop_air_min",),
+    },
+    (
+        "range_sp_hot_air_min",
+        "range_sp_cool_air_min",
+        "range_sp_auto_air_min",
+        "range_sp_dry_air_min",
+        "range_sp_vent_air_min",
+        "range_sp_stop_air_min",
+    ),
+)
 
-        error_id = payload.get("_id") if isinstance(payload, dict) else None
-        message = payload.get("msg") if isinstance(payload, dict) else text
-        if response.status in (400, 401, 403, 422):
-            raise CloudApiError(str(error_id or "auth_error"), str(message or "Authentication failed"))
+_MAX_TEMP_KEYS = _mode_key_table(
+    {
+        3: ("range_sp_hot_air_max", "range_sp_emerheat_air_max"),
+        2: ("range_sp_cool_air_max",),
+        4: ("range_sp_vent_air_max",),
+        5: ("range_sp_dry_air_max",),
+        7: ("range_sp_auto_air_max",),
+        0: ("range_sp_stop_air_max",),
+    },
+    (
+        "range_sp_hot_air_max",
+        "range_sp_cool_air_max",
+        "range_sp_auto_air_max",
+        "range_sp_dry_air_max",
+        "range_sp_vent_air_max",
+        "range_sp_stop_air_max",
+    ),
+)
 
-        raise aiohttp.ClientError(f"Airzone Cloud login failed: HTTP {response.status}: {text}")
+
+def _first_temp(status: dict[str, Any], table: dict[int | None, tuple[str, ...]], mode: int | None) -> float | None:
+    for key in table.get(mode, table[None]):
+        if key not in status:
+            continue
+        val = _temp_celsius(status[key])
+        if val is not None:
+            return val
+    return None
+
+
+# Declarative field specs: (target key, Cloud source key, converter).
+_ZONE_FIELD_SPEC: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("on", "power", _bool_to_int),
+    ("roomTemp", "local_temp", _temp_celsius),
+    ("workTemp", "zone_work_temp", _temp_celsius),
+    ("heatsetpoint", "setpoint_air_heat", _temp_celsius),
+    ("coolsetpoint", "setpoint_air_cool", _temp_celsius),
+    ("sleep", "sleep", _to_int),
+    ("humidity", "humidity", _to_number),
+    ("cloud_mode", "mode", _to_int),
+    ("ws_connected", "ws_connected", _bool_to_int),
+    ("isConnected", "isConnected", _bool_to_int),
+)
+
+_SYSTEM_FIELD_SPEC: tuple[tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("mc_connected", "isConnected", _bool_to_int),
+    ("ws_connected", "ws_connected", _bool_to_int),
+)
+
+# Cloud keys copied verbatim when present.
+_ZONE_PASSTHROUGH_KEYS: tuple[str, ...] = (
+    "aq_mode_conf",
+    "aq_mode_values",
+    "aq_active",
+    "aqpm1_0",
+    "aqpm2_5",
+    "aqpm10",
+    "sleep_values",
+    "usermode_conf",
+    "usermode_values",
+    "eco_conf",
+    "eco_values",
+    "timer_values",
+    "slats_v_values",
+    "slats_h_values",
+    "slats_vertical",
+    "slats_horizontal",
+    "slats_vswing",
+    "slats_hswing",
+    "erv_mode",
+    "erv_mode_values",
+    "local_vent",
+)
+
+_SYSTEM_PASSTHROUGH_KEYS: tuple[str, ...] = (
+    "timer_values",
+    "sleep_values",
+    "aqpm1_0",
+    "aqpm2_5",
+    "aqpm10",
+    "aq_present",
+    "aq_mode_values",
+    "eco_values",
+    "usermode_values",
+    "ws_sched_available",
+    "ws_sched_calendar_available",
+    "ws_sched_param_indep",
+    "warnings",
+    "errors",
+)
+
+_ENERGY_NUMERIC_KEYS: tuple[str, ...] = (
+    "energy_hour_latest",
+    "energy_day_latest",
+    "energy_day_current",
+    "energy_month_latest",
+    "energy_month_current",
+    "energy_year_latest",
+    "energy_year_current",
+    "energy_total",
+    "total_energy",
+    "energy_accumulated",
+    "energy_consumed",
+    "consumption",
+    "energy_acc",
+    "energy_ret",
+    "energy1_acc",
+    "energy1_ret",
+    "energy2_acc",
+    "energy2_ret",
+    "energy3_acc",
+    "energy3_ret",
+    "power",
+    "active_power",
+    "power_latest",
+    "power_total",
+    "power_p1",
+    "power_p2",
+    "power_p3",
+    "current",
+    "current_total",
+    "current_p1",
+    "current_p2",
+    "current_p3",
+    "voltage",
+    "voltage_total",
+    "voltage_p1",
+    "voltage_p2",
+    "voltage_p3",
+)
+
+_ENERGY_TEXT_KEYS: tuple[str, ...] = (
+    "energy_period_end_dt",
+    "energy1_period_end_dt",
+    "energy2_period_end_dt",
+    "energy3_period_end_dt",
+)
+
+# IAQ target key -> Cloud source keys, first numeric value wins.
+_IAQ_NUMERIC_SPEC: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("iaq_score", ("aq_score", "iaq_score")),
+    ("co2_value", ("aq_co2", "co2_value", "co2")),
+    ("tvoc_value", ("aq_tvoc", "tvoc_value", "tvoc")),
+    ("pressure_value", ("aq_pressure", "pressure_value", "pressure")),
+    ("pm1_0_value", ("aqpm1_0", "pm1_0_value", "pm1_value")),
+    ("pm2_5_value", ("aqpm2_5", "pm2_5_value", "pm25_value")),
+    ("pm10_value", ("aqpm10", "pm10_value")),
+    ("humidity", ("humidity", "aq_humidity")),
+    ("temperature", ("temperature", "aq_temperature")),
+)
+
+_IAQ_PASSTHROUGH_KEYS: tuple[str, ...] = (
+    "aqi_pm_category",
+    "aqi_pm_cat",
+    "aqi_pm_partial",
+    "iaq_index_text",
+    "iaq_text",
+    "needs_ventilation",
+    "need_ventilation",
+)
 
 
 class AirzoneCloudCoordinator(AirzoneCoordinator):
@@ -105,6 +413,10 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
         include_device_ids: list[str] | tuple[str, ...] | set[str] | None = None,
         require_device_selection: bool = False,
         exclude_iaq_names: str | list[str] | tuple[str, ...] | set[str] = DEFAULT_CLOUD_EXCLUDE_IAQ_NAMES,
+        base_url: str = DEFAULT_CLOUD_BASE_URL,
+        push: bool = False,
+        push_url: str | None = None,
+        hub: AirzoneCloudHub | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -114,18 +426,59 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             api_prefix=None,
         )
         self._email = email.strip().lower()
-        self._password = password
-        self._user_id = user_id
-        self._base_url = DEFAULT_CLOUD_BASE_URL.rstrip("/")
-        self._token: str | None = None
-        self._refresh_token: str | None = None
+        self._base_url = (base_url or DEFAULT_CLOUD_BASE_URL).rstrip("/")
         self._session = async_get_clientsession(hass)
+        # Auth, inventory and status fetches go through the account hub, which
+        # may be shared with other entries of the same account.
+        self._hub = hub or AirzoneCloudHub(
+            self._session,
+            email,
+            password,
+            base_url=self._base_url,
+            user_id=user_id,
+        )
         self._include_categories = self._normalize_include_categories(include_categories)
         self._include_bound_iaqs = bool(include_bound_iaqs)
         self._include_device_ids = self._normalize_include_device_ids(include_device_ids)
         self._require_device_selection = bool(require_device_selection)
         self._exclude_iaq_names = self._normalize_exclude_iaq_names(exclude_iaq_names)
+        # The Cloud API is not a local webserver: no calibration, bulk writes
+        # stay one at a time and reads pass their own limits without pacing.
+        self.capacity = WebserverCapacity(DEFAULT_BULK_CONCURRENCY, 0.0)
         self.cloud_energy_meters: dict[str, dict[str, Any]] = {}
+        # cloud_device_id -> (systemID, iaqsensorID) of the IAQ published last cycle
+        self._cloud_iaq_keys: dict[str, tuple[int, int]] = {}
+        # cloud_device_id -> (metadata signature, systemID, zoneID/iaqsensorID)
+        self._cloud_entry_ids: dict[str, tuple[tuple[Any, ...], int, int]] = {}
+        # Raw status fingerprints of the current cycle and the normalized
+        # record produced for each device last time it changed.
+        self._status_fingerprints: dict[str, bytes] = {}
+        self._cloud_status_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        self.changed_energy_meter_ids: set[str] | None = None
+        # ws_id -> last /devices/ws/{ws_id}/status payload (slow refresh)
+        self._ws_status_cache: dict[str, dict[str, Any]] = {}
+        self._ws_status_fetched_at: float | None = None
+
+        # Push mode: polling becomes a slow reconciliation safety net and the
+        # realtime stream applies incremental updates in between.
+        self._push_enabled = bool(push)
+        self._push_url = push_url
+        self._push_task: asyncio.Task | None = None
+        self.push_connected = False
+        self._cloud_installation_ids: list[str] = []
+        self._cloud_device_entries: dict[str, dict[str, Any]] = {}
+        self._cloud_raw_statuses: dict[str, dict[str, Any]] = {}
+
+        # complement_local: Cloud devices whose webserver is configured as a
+        # Local API entry; the entry reloads when that set of webservers changes.
+        self._local_webservers_seen: frozenset[str] | None = None
+        self._locally_served_devices: set[str] = set()
+        # Push mode only slows polling down once the stream is subscribed; until
+        # then (wrong URL, auth loop, dropped socket) the configured interval holds.
+        self._scan_interval = self.update_interval
+        self._reconcile_interval = timedelta(
+            seconds=max(int(scan_interval or DEFAULT_CLOUD_SCAN_INTERVAL), CLOUD_PUSH_RECONCILE_INTERVAL)
+        )
 
         self.connection_type = CONNECTION_TYPE_CLOUD
         self.uid_scope = f"cloud_{self._stable_scope_id(user_id or self._email)}"
@@ -204,215 +557,44 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
         value = int(digest[:8], 16) & 0x7FFFFFFF
         return value or 1
 
-    @staticmethod
-    def _to_number(value: Any) -> int | float | None:
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return value
-        try:
-            num = float(value)
-        except Exception:
-            return None
-        return int(num) if num.is_integer() else num
+    _to_number = staticmethod(_to_number)
+    _to_int = staticmethod(_to_int)
+    _bool_to_int = staticmethod(_bool_to_int)
+    _temp_celsius = staticmethod(_temp_celsius)
+    _canonical_mode = staticmethod(_canonical_mode)
+    _canonical_modes = staticmethod(_canonical_modes)
 
     @staticmethod
-    def _to_int(value: Any) -> int | None:
-        num = AirzoneCloudCoordinator._to_number(value)
-        if num is None:
-            return None
-        try:
-            return int(num)
-        except Exception:
-            return None
+    def _current_setpoint(status: dict[str, Any], canonical_mode: int | None) -> float | None:
+        return _first_temp(status, _SETPOINT_KEYS, canonical_mode)
 
     @staticmethod
-    def _bool_to_int(value: Any) -> int | None:
-        if value is None:
-            return None
-        if isinstance(value, bool):
-            return 1 if value else 0
-        if isinstance(value, (int, float)):
-            return 1 if int(value) else 0
-        text = str(value).strip().lower()
-        if text in ("1", "true", "yes", "on"):
-            return 1
-        if text in ("0", "false", "no", "off"):
-            return 0
-        return None
+    def _current_min_temp(status: dict[str, Any], canonical_mode: int | None) -> float | None:
+        return _first_temp(status, _MIN_TEMP_KEYS, canonical_mode)
 
     @staticmethod
-    def _temp_celsius(value: Any) -> float | None:
-        if isinstance(value, dict):
-            for key in ("celsius", "cel", "value"):
-                if key in value and value.get(key) is not None:
-                    try:
-                        return float(value[key])
-                    except Exception:
-                        return None
-            return None
-        if value is None:
-            return None
-        try:
-            return float(value)
-        except Exception:
-            return None
+    def _current_max_temp(status: dict[str, Any], canonical_mode: int | None) -> float | None:
+        return _first_temp(status, _MAX_TEMP_KEYS, canonical_mode)
 
-    @classmethod
-    def _canonical_mode(cls, cloud_mode: Any) -> int | None:
-        try:
-            code = int(cloud_mode)
-        except Exception:
-            return None
-        mapping = {
-            0: 0,
-            1: 7,
-            2: 2,
-            3: 3,
-            4: 4,
-            5: 5,
-            6: 3,
-            7: 3,
-            8: 3,
-            9: 3,
-            10: 2,
-            11: 2,
-            12: 2,
-        }
-        return mapping.get(code)
-
-    @classmethod
-    def _canonical_modes(cls, modes: Any) -> list[int]:
-        if not isinstance(modes, list):
-            return []
-        out: list[int] = []
-        for value in modes:
-            mapped = cls._canonical_mode(value)
-            if mapped is None:
-                continue
-            if mapped not in out:
-                out.append(mapped)
-        return out
+    @property
+    def _token(self) -> str | None:
+        return self._hub.token
 
-    @classmethod
-    def _current_setpoint(cls, status: dict[str, Any], canonical_mode: int | None) -> float | None:
-        if "setpoint" in status:
-            val = cls._temp_celsius(status.get("setpoint"))
-            if val is not None:
-                return val
-
-        key_map: dict[int | None, tuple[str, ...]] = {
-            3: ("setpoint_air_heat", "setpoint_air_emerheat"),
-            2: ("setpoint_air_cool",),
-            4: ("setpoint_air_vent",),
-            5: ("setpoint_air_dry",),
-            7: ("setpoint_air_auto",),
-            0: ("setpoint_air_stop",),
-            None: (
-                "setpoint_air_heat",
-                "setpoint_air_cool",
-                "setpoint_air_auto",
-                "setpoint_air_dry",
-                "setpoint_air_vent",
-                "setpoint_air_stop",
-            ),
-        }
-        for key in key_map.get(canonical_mode, ()) + key_map[None]:
-            if key not in status:
-                continue
-            val = cls._temp_celsius(status.get(key))
-            if val is not None:
-                return val
-        return None
+    @property
+    def _user_id(self) -> str | None:
+        return self._hub.user_id
 
-    @classmethod
-    def _current_min_temp(cls, status: dict[str, Any], canonical_mode: int | None) -> float | None:
-        key_map: dict[int | None, tuple[str, ...]] = {
-            3: ("range_sp_hot_air_min", "range_sp_emerheat_air_min"),
-            2: ("range_sp_cool_air_min",),
-            4: ("range_sp_vent_air_min",),
-            5: ("range_sp_dry_air_min",),
-            7: ("range_sp_auto_air_min",),
-            0: ("range_sp_stop_air_min",),
-            None: (
-                "range_sp_hot_air_min",
-                "range_sp_cool_air_min",
-                "range_sp_auto_air_min",
-                "range_sp_dry_air_min",
-                "range_sp_vent_air_min",
-                "range_sp_stop_air_min",
-            ),
-        }
-        for key in key_map.get(canonical_mode, ()) + key_map[None]:
-            val = cls._temp_celsius(status.get(key))
-            if val is not None:
-                return val
-        return None
-
-    @classmethod
-    def _current_max_temp(cls, status: dict[str, Any], canonical_mode: int | None) -> float | None:
-        key_map: dict[int | None, tuple[str, ...]] = {
-            3: ("range_sp_hot_air_max", "range_sp_emerheat_air_max"),
-            2: ("range_sp_cool_air_max",),
-            4: ("range_sp_vent_air_max",),
-            5: ("range_sp_dry_air_max",),
-            7: ("range_sp_auto_air_max",),
-            0: ("range_sp_stop_air_max",),
-            None: (
-                "range_sp_hot_air_max",
-                "range_sp_cool_air_max",
-                "range_sp_auto_air_max",
-                "range_sp_dry_air_max",
-                "range_sp_vent_air_max",
-                "range_sp_stop_air_max",
-            ),
-        }
-        for key in key_map.get(canonical_mode, ()) + key_map[None]:
-            val = cls._temp_celsius(status.get(key))
-            if val is not None:
-                return val
-        return None
-
-    async def _login(self) -> None:
-        session = await self._ensure_session()
-        payload = await async_cloud_login(session, self._email, self._password, base_url=self._base_url)
-        self._token = payload.get("token")
-        self._refresh_token = payload.get("refreshToken")
-        self._user_id = self._user_id or payload.get("_id")
-        if not self._token:
-            raise UpdateFailed("Airzone Cloud login did not return a token")
+    @property
+    def _max_age(self) -> float:
+        """Oldest shared result this entry accepts: half of its polling interval."""
+        interval = self.update_interval.total_seconds() if self.update_interval else DEFAULT_CLOUD_SCAN_INTERVAL
+        return interval / 2
 
     async def _refresh_access_token(self) -> None:
-        if not self._refresh_token:
-            await self._login()
-            return
-
-        session = await self._ensure_session()
-        url = f"{self._base_url}/auth/refreshToken/{self._refresh_token}"
-        async with session.get(url, timeout=15) as response:
-            text = await response.text()
-            payload: dict[str, Any] = {}
-            try:
-                parsed = await response.json(content_type=None)
-                if isinstance(parsed, dict):
-                    payload = parsed
-            except Exception:
-                payload = {}
-
-            if response.status != 200:
-                _LOGGER.debug("Cloud token refresh failed: HTTP %s %s", response.status, text)
-                await self._login()
-                return
-
-            self._token = payload.get("token") or self._token
-            self._refresh_token = payload.get("refreshToken") or self._refresh_token
-            if not self._token:
-                await self._login()
+        await self._hub.async_refresh_access_token(self._hub.token)
 
     async def _ensure_authenticated(self) -> None:
-        if self._token:
-            return
-        await self._login()
+        await self._hub.async_ensure_authenticated()
 
     async def _cloud_request_json(
         self,
@@ -423,91 +605,48 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
         body: dict[str, Any] | None = None,
         retry_auth: bool = True,
     ) -> dict[str, Any] | list[Any] | None:
-        await self._ensure_authenticated()
-        session = await self._ensure_session()
-        url = f"{self._base_url}{path}"
-        headers = {"Authorization": f"Bearer {self._token}"}
-
-        async with session.request(
+        payload, _text = await self._cloud_request(
             method,
-            url,
+            path,
             params=params,
-            json=body,
-            headers=headers,
-            timeout=20,
-        ) as response:
-            text = await response.text()
-            payload: dict[str, Any] | list[Any] | None = None
-            try:
-                payload = await response.json(content_type=None)
-            except Exception:
-                payload = None
-
-            if response.status == 401 and retry_auth:
-                await self._refresh_access_token()
-                return await self._cloud_request_json(
-                    method,
-                    path,
-                    params=params,
-                    body=body,
-                    retry_auth=False,
-                )
-
-            if response.status >= 400:
-                error_id = payload.get("_id") if isinstance(payload, dict) else None
-                message = payload.get("msg") if isinstance(payload, dict) else text
-                raise CloudApiError(str(error_id or f"http_{response.status}"), str(message or text))
+            body=body,
+            retry_auth=retry_auth,
+        )
+        return payload
 
-            return payload if payload is not None else {}
+    async def _cloud_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        retry_auth: bool = True,
+    ) -> tuple[dict[str, Any] | list[Any], str]:
+        """Perform a Cloud request and return the parsed payload together with the raw body."""
+        return await self._hub.async_request(
+            method,
+            path,
+            params=params,
+            body=body,
+            retry_auth=retry_auth,
+        )
 
     async def _get_installations(self) -> list[dict[str, Any]]:
-        first = await self._cloud_request_json("GET", "/installations", params={"items": 10, "page": 0})
-        if not isinstance(first, dict):
-            return []
-
-        installations = [item for item in first.get("installations", []) if isinstance(item, dict)]
-        total = self._to_int(first.get("total")) or len(installations)
-        if total <= len(installations):
-            return installations
-
-        pages = (total + 9) // 10
-        for page in range(1, pages):
-            chunk = await self._cloud_request_json("GET", "/installations", params={"items": 10, "page": page})
-            if not isinstance(chunk, dict):
-                continue
-            for item in chunk.get("installations", []):
-                if isinstance(item, dict):
-                    installations.append(item)
-        return installations
+        return await self._hub.async_installations(self._max_age)
 
     async def _get_installation_detail(self, installation_id: str) -> dict[str, Any] | None:
-        payload = await self._cloud_request_json("GET", f"/installations/{installation_id}")
-        return payload if isinstance(payload, dict) else None
+        return await self._hub.async_installation_detail(installation_id, self._max_age)
 
     async def _get_webserver_status(self, installation_id: str, ws_id: str) -> dict[str, Any] | None:
-        payload = await self._cloud_request_json(
-            "GET",
-            f"/devices/ws/{ws_id}/status",
-            params={"installation_id": installation_id},
-        )
-        return payload if isinstance(payload, dict) else None
+        return await self._hub.async_webserver_status(installation_id, ws_id, self._max_age)
 
     async def _get_device_status(self, installation_id: str, device_id: str) -> dict[str, Any] | None:
-        payload = await self._cloud_request_json(
-            "GET",
-            f"/devices/{device_id}/status",
-            params={"installation_id": installation_id},
-        )
-        return payload if isinstance(payload, dict) else None
-
-    async def _gather_limited(self, coroutines: list[Any], limit: int = 6) -> list[Any]:
-        semaphore = asyncio.Semaphore(limit)
-
-        async def _run(coro: Any) -> Any:
-            async with semaphore:
-                return await coro
-
-        return await asyncio.gather(*[_run(coro) for coro in coroutines], return_exceptions=True)
+        payload, fingerprint = await self._hub.async_device_status(installation_id, device_id, self._max_age)
+        if payload is None:
+            return None
+        self._status_fingerprints[device_id] = fingerprint
+        return payload
 
     def _system_id_for_entry(self, entry: dict[str, Any]) -> int:
         installation_id = str(entry.get("installation_id") or "")
@@ -523,67 +662,86 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             return zone_number
         return self._stable_int("cloud-zone", str(entry.get("device_id") or ""))
 
+    @staticmethod
+    def _entry_id_signature(entry: dict[str, Any]) -> tuple[Any, ...]:
+        return (
+            entry.get("device_type"),
+            entry.get("installation_id"),
+            entry.get("ws_id"),
+            entry.get("system_number"),
+            entry.get("zone_number"),
+            entry.get("iaqsensor_id"),
+            entry.get("iaq_number"),
+            entry.get("airqsensor_id"),
+        )
+
+    def _derive_cloud_ids(self, entry: dict[str, Any]) -> tuple[int, int]:
+        """Derive (systemID, zoneID/iaqsensorID) for an inventory entry.
+
+        Devices that are neither zones nor IAQ sensors only need a systemID.
+        """
+        sid = self._system_id_for_entry(entry)
+        device_type = entry.get("device_type")
+        if device_type in ZONE_DEVICE_TYPES:
+            return sid, self._zone_id_for_entry(entry)
+        if device_type in IAQ_DEVICE_TYPES:
+            return sid, self._iaq_id_for_entry(entry)
+        return sid, 0
+
+    def _index_cloud_ids(self, inventory_by_device: dict[str, dict[str, Any]]) -> None:
+        """Build the device_id -> IDs table, rehashing only entries whose metadata changed."""
+        previous = self._cloud_entry_ids
+        table: dict[str, tuple[tuple[Any, ...], int, int]] = {}
+        for device_id, entry in inventory_by_device.items():
+            signature = self._entry_id_signature(entry)
+            cached = previous.get(device_id)
+            if cached is not None and cached[0] == signature:
+                table[device_id] = cached
+                continue
+            sid, local_id = self._derive_cloud_ids(entry)
+            table[device_id] = (signature, sid, local_id)
+        self._cloud_entry_ids = table
+
+    def _cloud_ids(self, entry: dict[str, Any]) -> tuple[int, int]:
+        cached = self._cloud_entry_ids.get(str(entry.get("device_id") or ""))
+        if cached is not None:
+            return cached[1], cached[2]
+        return self._derive_cloud_ids(entry)
+
     def _normalize_zone_status(self, entry: dict[str, Any], status: dict[str, Any]) -> dict[str, Any]:
-        mode = self._canonical_mode(status.get("mode"))
-        modes = self._canonical_modes(status.get("mode_available"))
-        speed_values = [int(v) for v in status.get("speed_values", []) if self._to_int(v) is not None] if isinstance(status.get("speed_values"), list) else []
+        sid, zid = self._cloud_ids(entry)
+        mode = _canonical_mode(status.get("mode"))
+        modes = _canonical_modes(status.get("mode_available"))
+        speed_values = _int_list(status.get("speed_values"))
         zone: dict[str, Any] = {
-            "systemID": self._system_id_for_entry(entry),
-            "zoneID": self._zone_id_for_entry(entry),
+            "systemID": sid,
+            "zoneID": zid,
             "name": status.get("name") or entry.get("name") or f"Zone {entry.get('zone_number') or entry.get('device_id')}",
-            "on": self._bool_to_int(status.get("power")),
             "mode": mode,
             "modes": modes,
             "sys_modes": modes,
-            "roomTemp": self._temp_celsius(status.get("local_temp")),
-            "workTemp": self._temp_celsius(status.get("zone_work_temp")),
-            "setpoint": self._current_setpoint(status, mode),
-            "heatsetpoint": self._temp_celsius(status.get("setpoint_air_heat")),
-            "coolsetpoint": self._temp_celsius(status.get("setpoint_air_cool")),
-            "minTemp": self._current_min_temp(status, mode),
-            "maxTemp": self._current_max_temp(status, mode),
-            "double_sp": self._bool_to_int(status.get("double_sp")) or 0,
-            "speed": self._to_int(status.get("speed_conf") or status.get("pspeed") or status.get("speed")),
+            "setpoint": _first_temp(status, _SETPOINT_KEYS, mode),
+            "minTemp": _first_temp(status, _MIN_TEMP_KEYS, mode),
+            "maxTemp": _first_temp(status, _MAX_TEMP_KEYS, mode),
+            "double_sp": _bool_to_int(status.get("double_sp")) or 0,
+            "speed": _to_int(status.get("speed_conf") or status.get("pspeed") or status.get("speed")),
             "speeds": max(len(speed_values) - 1, 0) if speed_values else 0,
             "speed_values": speed_values,
-            "sleep": self._to_int(status.get("sleep")),
-            "sleep_values": [int(v) for v in status.get("sleep_values", []) if self._to_int(v) is not None] if isinstance(status.get("sleep_values"), list) else [],
-            "humidity": self._to_number(status.get("humidity")),
+            "sleep_values": _int_list(status.get("sleep_values")),
             "manufacturer": "Airzone Cloud",
             "cloud_installation_id": entry.get("installation_id"),
             "cloud_ws_id": entry.get("ws_id"),
             "cloud_device_id": entry.get("device_id"),
             "cloud_device_type": entry.get("device_type"),
-            "cloud_mode": self._to_int(status.get("mode")),
-            "ws_connected": self._bool_to_int(status.get("ws_connected")),
-            "isConnected": self._bool_to_int(status.get("isConnected")),
         }
 
-        for key in (
-            "aq_mode_conf",
-            "aq_mode_values",
-            "aq_active",
-            "aqpm1_0",
-            "aqpm2_5",
-            "aqpm10",
-            "sleep_values",
-            "usermode_conf",
-            "usermode_values",
-            "eco_conf",
-            "eco_values",
-            "timer_values",
-            "slats_v_values",
-            "slats_h_values",
-            "slats_vertical",
-            "slats_horizontal",
-            "slats_vswing",
-            "slats_hswing",
-            "erv_mode",
-            "erv_mode_values",
-            "local_vent",
-        ):
+        for target_key, source_key, convert in _ZONE_FIELD_SPEC:
+            if source_key in status:
+                zone[target_key] = convert(status[source_key])
+
+        for key in _ZONE_PASSTHROUGH_KEYS:
             if key in status:
-                zone[key] = status.get(key)
+                zone[key] = status[key]
 
         aq_quality = status.get("aq_quality")
         if isinstance(aq_quality, (int, float)):
@@ -593,38 +751,25 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
 
     def _normalize_system_status(self, entry: dict[str, Any], status: dict[str, Any]) -> dict[str, Any]:
         system: dict[str, Any] = {
-            "systemID": self._system_id_for_entry(entry),
+            "systemID": self._cloud_ids(entry)[0],
             "manufacturer": "Airzone Cloud",
-            "mc_connected": self._bool_to_int(status.get("isConnected")),
-            "mode": self._canonical_mode(status.get("mode")),
-            "modes": self._canonical_modes(status.get("mode_available")),
-            "speed": self._to_int(status.get("speed_conf") or status.get("speed")),
-            "speed_values": [int(v) for v in status.get("speed_values", []) if self._to_int(v) is not None] if isinstance(status.get("speed_values"), list) else [],
+            "mode": _canonical_mode(status.get("mode")),
+            "modes": _canonical_modes(status.get("mode_available")),
+            "speed": _to_int(status.get("speed_conf") or status.get("speed")),
+            "speed_values": _int_list(status.get("speed_values")),
             "cloud_installation_id": entry.get("installation_id"),
             "cloud_ws_id": entry.get("ws_id"),
             "cloud_device_id": entry.get("device_id"),
             "cloud_device_type": entry.get("device_type"),
-            "ws_connected": self._bool_to_int(status.get("ws_connected")),
         }
 
-        for key in (
-            "timer_values",
-            "sleep_values",
-            "aqpm1_0",
-            "aqpm2_5",
-            "aqpm10",
-            "aq_present",
-            "aq_mode_values",
-            "eco_values",
-            "usermode_values",
-            "ws_sched_available",
-            "ws_sched_calendar_available",
-            "ws_sched_param_indep",
-            "warnings",
-            "errors",
-        ):
+        for target_key, source_key, convert in _SYSTEM_FIELD_SPEC:
+            if source_key in status:
+                system[target_key] = convert(status[source_key])
+
+        for key in _SYSTEM_PASSTHROUGH_KEYS:
             if key in status:
-                system[key] = status.get(key)
+                system[key] = status[key]
 
         aq_quality = status.get("aq_quality")
         if isinstance(aq_quality, (int, float)):
@@ -644,59 +789,15 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             "system_number": entry.get("system_number"),
         }
 
-        candidate_keys = (
-            "energy_hour_latest",
-            "energy_day_latest",
-            "energy_day_current",
-            "energy_month_latest",
-            "energy_month_current",
-            "energy_year_latest",
-            "energy_year_current",
-            "energy_total",
-            "total_energy",
-            "energy_accumulated",
-            "energy_consumed",
-            "consumption",
-            "energy_acc",
-            "energy_ret",
-            "energy1_acc",
-            "energy1_ret",
-            "energy2_acc",
-            "energy2_ret",
-            "energy3_acc",
-            "energy3_ret",
-            "power",
-            "active_power",
-            "power_latest",
-            "power_total",
-            "power_p1",
-            "power_p2",
-            "power_p3",
-            "current",
-            "current_total",
-            "current_p1",
-            "current_p2",
-            "current_p3",
-            "voltage",
-            "voltage_total",
-            "voltage_p1",
-            "voltage_p2",
-            "voltage_p3",
-        )
-        for key in candidate_keys:
+        for key in _ENERGY_NUMERIC_KEYS:
             if key in status:
-                value = self._to_number(status.get(key))
+                value = _to_number(status[key])
                 if value is not None:
                     meter[key] = value
 
-        for key in (
-            "energy_period_end_dt",
-            "energy1_period_end_dt",
-            "energy2_period_end_dt",
-            "energy3_period_end_dt",
-        ):
-            if key in status and status.get(key):
-                meter[key] = status.get(key)
+        for key in _ENERGY_TEXT_KEYS:
+            if status.get(key):
+                meter[key] = status[key]
 
         return {key: value for key, value in meter.items() if value is not None}
 
@@ -707,6 +808,50 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
                 return value
         return self._stable_int("cloud-iaq", str(entry.get("device_id") or ""))
 
+    @staticmethod
+    def _normalize_mac(value: Any) -> str:
+        return "".join(ch for ch in str(value or "") if ch.isalnum()).upper()
+
+    def _local_webservers(self) -> frozenset[str]:
+        """MACs of the webservers configured as Local API entries."""
+        macs = {
+            self._normalize_mac(config_entry.data.get(CONF_WEBSERVER_MAC))
+            for config_entry in self.hass.config_entries.async_entries(DOMAIN)
+            if config_entry.data.get(CONF_CONNECTION_TYPE, CONNECTION_TYPE_LOCAL) == CONNECTION_TYPE_LOCAL
+        }
+        macs.discard("")
+        return frozenset(macs)
+
+    def _served_locally(self, entry: dict[str, Any], webservers: frozenset[str]) -> bool:
+        # A Local API entry reads every system of its webserver
+        if entry.get("device_type") not in ZONE_DEVICE_TYPES | SYSTEM_DEVICE_TYPES | IAQ_DEVICE_TYPES:
+            return False
+        return self._normalize_mac(entry.get("ws_id")) in webservers
+
+    def _update_locally_served(self, inventory_by_device: dict[str, dict[str, Any]]) -> None:
+        """Refresh the set of Cloud devices a configured Local API entry already covers."""
+        if getattr(self, "cloud_profile", None) != CLOUD_PROFILE_COMPLEMENT_LOCAL:
+            self._locally_served_devices = set()
+            return
+
+        # Based on configuration, not on whether the Local entry is up right now:
+        # entities are created once from the first refresh, so a set that moved
+        # with Local availability would leave duplicates or gaps behind.
+        webservers = self._local_webservers()
+        if self._local_webservers_seen is not None and webservers != self._local_webservers_seen:
+            config_entry = getattr(self, "config_entry", None)
+            if config_entry is not None:
+                _LOGGER.info("Local API entries changed; reloading Airzone Cloud entry %s", config_entry.title)
+                self.hass.async_create_task(self.hass.config_entries.async_reload(config_entry.entry_id))
+        self._local_webservers_seen = webservers
+        self._locally_served_devices = {
+            device_id for device_id, entry in inventory_by_device.items() if self._served_locally(entry, webservers)
+        }
+        _LOGGER.debug(
+            "Cloud complement_local: %s devices already served by Local API entries",
+            len(self._locally_served_devices),
+        )
+
     def _cloud_iaq_should_expose(self, entry: dict[str, Any]) -> bool:
         name = str(entry.get("name") or "").strip().casefold()
         if name and name in self._exclude_iaq_names:
@@ -721,8 +866,7 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
         return not (entry.get("system_number") or entry.get("zone_number"))
 
     def _normalize_iaq_status(self, entry: dict[str, Any], status: dict[str, Any]) -> dict[str, Any]:
-        sid = self._system_id_for_entry(entry)
-        iid = self._iaq_id_for_entry(entry)
+        sid, iid = self._cloud_ids(entry)
         iaq: dict[str, Any] = {
             "systemID": sid,
             "iaqsensorID": iid,
@@ -736,22 +880,11 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             "zone_number": entry.get("zone_number"),
         }
 
-        numeric_map = {
-            "iaq_score": ("aq_score", "iaq_score"),
-            "co2_value": ("aq_co2", "co2_value", "co2"),
-            "tvoc_value": ("aq_tvoc", "tvoc_value", "tvoc"),
-            "pressure_value": ("aq_pressure", "pressure_value", "pressure"),
-            "pm1_0_value": ("aqpm1_0", "pm1_0_value", "pm1_value"),
-            "pm2_5_value": ("aqpm2_5", "pm2_5_value", "pm25_value"),
-            "pm10_value": ("aqpm10", "pm10_value"),
-            "humidity": ("humidity", "aq_humidity"),
-            "temperature": ("temperature", "aq_temperature"),
-        }
-        for target_key, source_keys in numeric_map.items():
+        for target_key, source_keys in _IAQ_NUMERIC_SPEC:
             for source_key in source_keys:
                 if source_key not in status:
                     continue
-                value = self._to_number(status.get(source_key))
+                value = _to_number(status[source_key])
                 if value is not None:
                     iaq[target_key] = value
                     break
@@ -762,39 +895,64 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             iaq["air_quality_text"] = text
             iaq["iaq_quality_text"] = text
         else:
-            value = self._to_int(aq_quality)
+            value = _to_int(aq_quality)
             if value is not None:
                 iaq["iaq_index"] = value
 
-        for source_key, target_key in (
-            ("aqi_pm_category", "aqi_pm_category"),
-            ("aqi_pm_cat", "aqi_pm_cat"),
-            ("aqi_pm_partial", "aqi_pm_partial"),
-            ("iaq_index_text", "iaq_index_text"),
-            ("iaq_text", "iaq_text"),
-            ("needs_ventilation", "needs_ventilation"),
-            ("need_ventilation", "need_ventilation"),
-        ):
-            if source_key in status and status.get(source_key) is not None:
-                iaq[target_key] = status.get(source_key)
+        for key in _IAQ_PASSTHROUGH_KEYS:
+            if status.get(key) is not None:
+                iaq[key] = status[key]
 
         return {key: value for key, value in iaq.items() if value is not None}
 
-    @staticmethod
+    def _normalize_cloud_status(self, entry: dict[str, Any], status: dict[str, Any]) -> dict[str, Any]:
+        device_type = entry.get("device_type")
+        if device_type in SYSTEM_DEVICE_TYPES:
+            return self._normalize_system_status(entry, status)
+        if device_type in ZONE_DEVICE_TYPES:
+            return self._normalize_zone_status(entry, status)
+        if device_type in ENERGY_DEVICE_TYPES:
+            return self._normalize_energy_meter_status(entry, status)
+        return self._normalize_iaq_status(entry, status)
+
     def _previous_cloud_iaq(
+        self,
         previous_iaqs: dict[tuple[int, int], dict[str, Any]],
         entry: dict[str, Any],
     ) -> tuple[tuple[int, int], dict[str, Any]] | tuple[None, None]:
         device_id = str(entry.get("device_id") or "")
         if not device_id:
             return None, None
-        for key, iaq in previous_iaqs.items():
-            if str(iaq.get("cloud_device_id") or "") == device_id:
-                return key, iaq
-        return None, None
+        key = self._cloud_iaq_keys.get(device_id)
+        if key is None:
+            return None, None
+        iaq = previous_iaqs.get(key)
+        if iaq is None:
+            return None, None
+        return key, iaq
+
+    def _keep_previous_cloud_state(
+        self,
+        entry: dict[str, Any],
+        previous_energy_meters: dict[str, dict[str, Any]],
+        previous_iaqs: dict[tuple[int, int], dict[str, Any]],
+        energy_meters: dict[str, dict[str, Any]],
+        iaqs: dict[tuple[int, int], dict[str, Any]],
+        seen_iaq_devices: set[str],
+    ) -> None:
+        """Keep the last valid energy/IAQ state when a device status fetch fails."""
+        device_id = str(entry.get("device_id") or "")
+        device_type = entry.get("device_type")
+        if device_type in ENERGY_DEVICE_TYPES and device_id in previous_energy_meters:
+            energy_meters[device_id] = previous_energy_meters[device_id]
+        elif device_type in IAQ_DEVICE_TYPES:
+            previous_key, previous_iaq = self._previous_cloud_iaq(previous_iaqs, entry)
+            if previous_key is not None and previous_iaq is not None:
+                iaqs[previous_key] = previous_iaq
+                seen_iaq_devices.add(device_id)
 
     def _merge_aux_status_into_system(self, systems: dict[int, dict[str, Any]], entry: dict[str, Any], status: dict[str, Any]) -> None:
-        sid = self._system_id_for_entry(entry)
+        sid = self._cloud_ids(entry)[0]
         target = systems.setdefault(sid, {"systemID": sid, "manufacturer": "Airzone Cloud"})
         device_type = entry.get("device_type")
 
@@ -807,6 +965,75 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             if energy is not None:
                 target["energy_consump"] = energy
 
+    def _wanted_webservers(
+        self,
+        installations: list[dict[str, Any]],
+        device_entries: list[dict[str, Any]],
+    ) -> dict[str, str]:
+        """Webservers (ws_id -> installation_id) backing the devices this entry exposes."""
+        ws_ids_by_installation: dict[str, list[str]] = {}
+        for item in installations:
+            installation_id = str(item.get("installation_id") or "")
+            if installation_id:
+                ws_ids_by_installation[installation_id] = [str(ws_id) for ws_id in item.get("ws_ids", []) or [] if ws_id]
+
+        wanted: dict[str, str] = {}
+        for entry in device_entries:
+            installation_id = str(entry.get("installation_id") or "")
+            ws_id = entry.get("ws_id")
+            if ws_id:
+                wanted.setdefault(str(ws_id), installation_id)
+                continue
+            for fallback_ws_id in ws_ids_by_installation.get(installation_id, []):
+                wanted.setdefault(fallback_ws_id, installation_id)
+        return wanted
+
+    async def _async_webserver_statuses(
+        self,
+        installations: list[dict[str, Any]],
+        device_entries: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return webserver status payloads, refreshed on a slow schedule.
+
+        Webserver status only feeds the webserver entities, so nothing is
+        fetched when those are not exposed. Otherwise statuses are refreshed
+        every CLOUD_WS_STATUS_REFRESH_INTERVAL seconds; in between, only
+        webservers that are not cached yet are fetched.
+        """
+        if not self.expose_webserver_entities:
+            self._ws_status_cache = {}
+            return []
+
+        wanted = self._wanted_webservers(installations, device_entries)
+        now = time.monotonic()
+        stale = (
+            self._ws_status_fetched_at is None
+            or now - self._ws_status_fetched_at >= CLOUD_WS_STATUS_REFRESH_INTERVAL
+        )
+        to_fetch = [
+            (installation_id, ws_id)
+            for ws_id, installation_id in wanted.items()
+            if stale or ws_id not in self._ws_status_cache
+        ]
+
+        cache = {ws_id: payload for ws_id, payload in self._ws_status_cache.items() if ws_id in wanted}
+        if to_fetch:
+            self.phases.note(f"{len(to_fetch)} webserver statuses fetched")
+            results = await self._gather_limited(
+                [self._get_webserver_status(installation_id, ws_id) for installation_id, ws_id in to_fetch],
+                limit=4,
+            )
+            for (_installation_id, ws_id), payload in zip(to_fetch, results, strict=False):
+                if isinstance(payload, dict):
+                    cache[ws_id] = payload
+                elif isinstance(payload, Exception):
+                    _LOGGER.debug("Cloud webserver status fetch failed for %s: %s", ws_id, payload)
+            if stale:
+                self._ws_status_fetched_at = now
+
+        self._ws_status_cache = cache
+        return [cache[ws_id] for ws_id in wanted if ws_id in cache]
+
     def _build_webserver_summary(
         self,
         installations: list[dict[str, Any]],
@@ -848,13 +1075,23 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
         return summary
 
     async def _async_update_data(self) -> dict[tuple[int, int], dict[str, Any]]:
+        # Unknown until this cycle completes: a failed or deadline-cut cycle must
+        # not leave the narrow sets of the last poll or push event behind.
+        self.changed_zone_keys = None
+        self.changed_iaq_keys = None
+        self.changed_energy_meter_ids = None
+        self.phases.lap("setup")
         try:
             installations = await self._get_installations()
+        except DeadlineExceeded:
+            return self._keep_last_state("installations")
         except CloudApiError as err:
             raise UpdateFailed(f"Cloud installations fetch failed: {err.error_id}") from err
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Cloud connection failed: {err}") from err
 
+        self.phases.lap("installations")
+
         detail_results = await self._gather_limited(
             [self._get_installation_detail(str(item.get("installation_id"))) for item in installations if item.get("installation_id")],
             limit=4,
@@ -867,16 +1104,9 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
                 continue
             if isinstance(detail, dict) and detail.get("installation_id"):
                 details_by_installation[str(detail.get("installation_id"))] = detail
-
-        ws_tasks: list[Any] = []
-        for item in installations:
-            installation_id = item.get("installation_id")
-            if not installation_id:
-                continue
-            for ws_id in item.get("ws_ids", []) or []:
-                ws_tasks.append(self._get_webserver_status(str(installation_id), str(ws_id)))
-        ws_results = await self._gather_limited(ws_tasks, limit=4)
-        ws_payloads = [payload for payload in ws_results if isinstance(payload, dict)]
+        # A partial inventory would drop the devices of the missing installations
+        if deadline_expired() or any(isinstance(detail, DeadlineExceeded) for detail in detail_results):
+            return self._keep_last_state("inventory")
 
         inventory_by_device: dict[str, dict[str, Any]] = {}
         for item in installations:
@@ -905,12 +1135,20 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
                         "airqsensor_id": meta.get("airqsensor_id") or meta.get("airqsensorID"),
                     }
 
+        self._index_cloud_ids(inventory_by_device)
+        self._update_locally_served(inventory_by_device)
+
         device_entries = [
             entry
             for entry in inventory_by_device.values()
             if entry.get("device_type") in SUPPORTED_STATUS_DEVICE_TYPES
             and self._entry_enabled(entry)
+            and entry["device_id"] not in self._locally_served_devices
         ]
+        self.phases.lap("inventory")
+        ws_payloads = await self._async_webserver_statuses(installations, device_entries)
+        self.phases.lap("webservers")
+
         device_status_results = await self._gather_limited(
             [
                 self._get_device_status(str(entry.get("installation_id")), str(entry.get("device_id")))
@@ -918,72 +1156,120 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             ],
             limit=6,
         )
+        self.phases.lap("statuses")
 
         systems: dict[int, dict[str, Any]] = {}
         zones: list[dict[str, Any]] = []
         energy_meters: dict[str, dict[str, Any]] = {}
         iaqs: dict[tuple[int, int], dict[str, Any]] = {}
-        previous_energy_meters = dict(self.cloud_energy_meters or {})
-        previous_iaqs = dict(self.iaqs or {})
+        # Both previous maps are replaced (never mutated) at the end of the
+        # cycle, so they can be read directly without a defensive copy.
+        previous_energy_meters = self.cloud_energy_meters or {}
+        previous_iaqs = self.iaqs or {}
+        seen_iaq_devices: set[str] = set()
+        previous_cache = self._cloud_status_cache
+        status_cache: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        raw_statuses: dict[str, dict[str, Any]] = {}
+        changed_devices: set[str] = set()
+        changed_system_ids: set[int] = set()
+        changed_zone_keys: set[tuple[int, int]] = set()
+        changed_iaq_keys: set[tuple[int, int]] = set()
 
         for entry, status in zip(device_entries, device_status_results, strict=False):
-            if isinstance(status, Exception):
-                _LOGGER.debug("Cloud device status fetch failed for %s: %s", entry.get("device_id"), status)
-                device_id = str(entry.get("device_id") or "")
-                device_type = entry.get("device_type")
-                if device_type in ENERGY_DEVICE_TYPES and device_id in previous_energy_meters:
-                    energy_meters[device_id] = previous_energy_meters[device_id]
-                elif device_type in IAQ_DEVICE_TYPES:
-                    previous_key, previous_iaq = self._previous_cloud_iaq(previous_iaqs, entry)
-                    if previous_key is not None and previous_iaq is not None:
-                        iaqs[previous_key] = previous_iaq
-                continue
-            if not isinstance(status, dict):
-                device_id = str(entry.get("device_id") or "")
-                device_type = entry.get("device_type")
-                if device_type in ENERGY_DEVICE_TYPES and device_id in previous_energy_meters:
-                    energy_meters[device_id] = previous_energy_meters[device_id]
-                elif device_type in IAQ_DEVICE_TYPES:
-                    previous_key, previous_iaq = self._previous_cloud_iaq(previous_iaqs, entry)
-                    if previous_key is not None and previous_iaq is not None:
-                        iaqs[previous_key] = previous_iaq
+            device_id = str(entry.get("device_id") or "")
+            raw_fingerprint = self._status_fingerprints.pop(device_id, None)
+            if isinstance(status, Exception) or not isinstance(status, dict):
+                if isinstance(status, Exception):
+                    _LOGGER.debug("Cloud device status fetch failed for %s: %s", entry.get("device_id"), status)
+                self._keep_previous_cloud_state(
+                    entry,
+                    previous_energy_meters,
+                    previous_iaqs,
+                    energy_meters,
+                    iaqs,
+                    seen_iaq_devices,
+                )
+                if device_id in previous_cache:
+                    status_cache[device_id] = previous_cache[device_id]
+                if self._push_enabled and device_id in self._cloud_raw_statuses:
+                    raw_statuses[device_id] = self._cloud_raw_statuses[device_id]
                 continue
 
+            if self._push_enabled:
+                raw_statuses[device_id] = status
             device_type = entry.get("device_type")
+            if device_type in AUX_DEVICE_TYPES or device_type in ACS_DEVICE_TYPES:
+                self._merge_aux_status_into_system(systems, entry, status)
+                continue
+
+            if device_type in IAQ_DEVICE_TYPES and not self._cloud_iaq_should_expose(entry):
+                _LOGGER.debug(
+                    "Skipping cloud IAQ %s in complementary mode because it is bound to system/zone metadata",
+                    entry.get("device_id"),
+                )
+                continue
+
+            # Reuse the previous normalized record while neither the raw
+            # payload nor the inventory metadata of the device changed.
+            fingerprint = (self._entry_id_signature(entry), entry.get("name"), raw_fingerprint)
+            cached = previous_cache.get(device_id)
+            changed = raw_fingerprint is None or cached is None or cached[0] != fingerprint
+            if changed:
+                normalized = self._normalize_cloud_status(entry, status)
+                changed_devices.add(device_id)
+            else:
+                normalized = cached[1]
+            status_cache[device_id] = (fingerprint, normalized)
+
             if device_type in SYSTEM_DEVICE_TYPES:
-                sid = self._system_id_for_entry(entry)
+                sid = self._cloud_ids(entry)[0]
                 merged = systems.setdefault(sid, {"systemID": sid, "manufacturer": "Airzone Cloud"})
-                merged.update(self._normalize_system_status(entry, status))
+                merged.update(normalized)
+                if changed:
+                    changed_system_ids.add(sid)
                 continue
 
             if device_type in ZONE_DEVICE_TYPES:
-                zones.append(self._normalize_zone_status(entry, status))
+                zones.append(normalized)
+                if changed:
+                    changed_zone_keys.add(self._cloud_ids(entry))
                 continue
 
             if device_type in ENERGY_DEVICE_TYPES:
-                meter = self._normalize_energy_meter_status(entry, status)
-                meter_id = str(meter.get("id") or entry.get("device_id") or "")
+                meter_id = str(normalized.get("id") or device_id)
                 if meter_id:
-                    energy_meters[meter_id] = {**(previous_energy_meters.get(meter_id) or {}), **meter}
+                    previous_meter = previous_energy_meters.get(meter_id)
+                    if changed or previous_meter is None:
+                        energy_meters[meter_id] = {**(previous_meter or {}), **normalized}
+                    else:
+                        energy_meters[meter_id] = previous_meter
                 continue
 
-            if device_type in IAQ_DEVICE_TYPES:
-                if self._cloud_iaq_should_expose(entry):
-                    iaq = self._normalize_iaq_status(entry, status)
-                    sid = self._to_int(iaq.get("systemID"))
-                    iid = self._to_int(iaq.get("iaqsensorID"))
-                    if sid is not None and iid is not None:
-                        _previous_key, previous_iaq = self._previous_cloud_iaq(previous_iaqs, entry)
-                        iaqs[(sid, iid)] = {**(previous_iaq or {}), **iaq}
+            sid = self._to_int(normalized.get("systemID"))
+            iid = self._to_int(normalized.get("iaqsensorID"))
+            if sid is not None and iid is not None:
+                _previous_key, previous_iaq = self._previous_cloud_iaq(previous_iaqs, entry)
+                if changed or previous_iaq is None or _previous_key != (sid, iid):
+                    iaqs[(sid, iid)] = {**(previous_iaq or {}), **normalized}
+                    changed_iaq_keys.add((sid, iid))
                 else:
-                    _LOGGER.debug(
-                        "Skipping cloud IAQ %s in complementary mode because it is bound to system/zone metadata",
-                        entry.get("device_id"),
-                    )
-                continue
-
-            self._merge_aux_status_into_system(systems, entry, status)
+                    iaqs[(sid, iid)] = previous_iaq
+                if device_id:
+                    self._cloud_iaq_keys[device_id] = (sid, iid)
+                    seen_iaq_devices.add(device_id)
+
+        for stale_device_id in self._cloud_iaq_keys.keys() - seen_iaq_devices:
+            del self._cloud_iaq_keys[stale_device_id]
+        self._cloud_status_cache = status_cache
+        self._status_fingerprints.clear()
+        self._cloud_raw_statuses = raw_statuses
+        self._cloud_device_entries = {str(entry.get("device_id")): entry for entry in device_entries}
+        self._cloud_installation_ids = [
+            str(item.get("installation_id")) for item in installations if item.get("installation_id")
+        ]
+        self._hub.prune(CLOUD_HUB_CACHE_MAX_AGE)
 
+        previous_mapped_keys = set((self.data or {}).keys())
         if self._cloud_category_enabled(CLOUD_CATEGORY_CLIMATE_ZONES):
             mapped = self._map_zones(zones)
             if mapped:
@@ -1014,6 +1300,25 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             if "modes" in system and "sys_modes" not in zone:
                 zone["sys_modes"] = system.get("modes")
 
+        # Change-sets for the entity layer: devices whose normalized record
+        # changed, plus anything that disappeared. None means "refresh all".
+        if previous_cache and self.last_update_success:
+            changed_zone_keys |= previous_mapped_keys - mapped.keys()
+            changed_zone_keys |= {key for key in mapped.keys() if key[0] in changed_system_ids}
+            changed_iaq_keys |= previous_iaqs.keys() - iaqs.keys()
+            self.changed_zone_keys = changed_zone_keys
+            self.changed_iaq_keys = changed_iaq_keys
+            self.changed_energy_meter_ids = {
+                meter_id
+                for meter_id in energy_meters.keys() | previous_energy_meters.keys()
+                if energy_meters.get(meter_id) is not previous_energy_meters.get(meter_id)
+            }
+        _LOGGER.debug(
+            "Cloud statuses: %s devices, %s changed since last poll",
+            len(device_entries),
+            len(changed_devices),
+        )
+
         self.systems = systems
         self.cloud_energy_meters = energy_meters
         self.webserver = self._build_webserver_summary(installations, ws_payloads)
@@ -1035,6 +1340,8 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
             prof["zone_count"] = len([1 for (sys_id, _zid) in mapped.keys() if sys_id == sid])
             prof["iaq_count"] = len([1 for (sys_id, _iid) in iaqs.keys() if sys_id == sid])
             self.system_profiles[sid] = prof
+        self.phases.note(f"{len(changed_devices)}/{len(device_entries)} devices changed")
+        self.phases.lap("normalize")
 
         return mapped
 
@@ -1044,6 +1351,222 @@ class AirzoneCloudCoordinator(AirzoneCoordinator):
     async def async_set_iaq_params(self, system_id: int, iaq_id: int, **kwargs) -> dict | None:
         raise HomeAssistantError("Cloud API write support is not enabled yet in this phase.")
 
+    # ---------------- Push (realtime device-state stream) ----------------
+
+    async def _async_session_holder(self) -> Any:
+        # Requests go through the account hub; recording it also captures
+        # other entries of the same account polling in the meantime.
+        return self._hub
+
+    def _push_endpoint(self) -> str:
+        if self._push_url:
+            return self._push_url
+        base = self._base_url
+        if base.startswith("https://"):
+            base = "wss://" + base[len("https://"):]
+        elif base.startswith("http://"):
+            base = "ws://" + base[len("http://"):]
+        return f"{base}{CLOUD_PUSH_PATH}"
+
+    def async_start_push(self) -> None:
+        """Start listening to the realtime stream when push mode is enabled."""
+        if not self._push_enabled or self._push_task is not None:
+            return
+        self._push_task = self.hass.async_create_background_task(
+            self._async_push_loop(),
+            name=f"{DOMAIN} cloud push {self.uid_scope}",
+        )
+
+    def _set_push_connected(self, connected: bool) -> None:
+        """Track the stream state and switch between reconcile and scan polling."""
+        was_connected, self.push_connected = self.push_connected, connected
+        self.update_interval = self._reconcile_interval if connected else self._scan_interval
+        if connected and not was_connected:
+            _LOGGER.info(
+                "Cloud push connected; polling every %s s as a safety net",
+                int(self._reconcile_interval.total_seconds()),
+            )
+        elif was_connected and not connected:
+            _LOGGER.warning(
+                "Cloud push stream lost; polling every %s s until it reconnects",
+                int(self._scan_interval.total_seconds()),
+            )
+
+    async def _async_stop_push(self) -> None:
+        task, self._push_task = self._push_task, None
+        # Deliberate stop (unload, options change): no "stream lost" warning
+        self.push_connected = False
+        self.update_interval = self._scan_interval
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _async_push_loop(self) -> None:
+        backoff = 1
+        while True:
+            try:
+                connected = await self._async_push_session()
+            except asyncio.CancelledError:
+                raise
+            except aiohttp.WSServerHandshakeError as err:
+                connected = False
+                _LOGGER.debug("Cloud push handshake failed: HTTP %s", err.status)
+                if err.status == 401:
+                    try:
+                        await self._refresh_access_token()
+                    except Exception as auth_err:
+                        _LOGGER.debug("Cloud push token refresh failed: %s", auth_err)
+            except Exception as err:
+                connected = False
+                _LOGGER.debug("Cloud push stream error: %s", err)
+            if self.push_connected:
+                self._set_push_connected(False)
+                # The next poll was scheduled with the reconcile interval: poll now
+                self._async_track_task(self.async_request_refresh())
+
+            # A session that got as far as subscribing resets the backoff.
+            backoff = 1 if connected else min(backoff * 2, CLOUD_PUSH_MAX_BACKOFF)
+            await asyncio.sleep(backoff)
+
+    async def _async_push_session(self) -> bool:
+        """Run one websocket session; True if it reached the subscribed state."""
+        await self._ensure_authenticated()
+        session = self._session
+        subscribed = False
+        async with session.ws_connect(
+            self._push_endpoint(),
+            headers={"Authorization": f"Bearer {self._token}"},
+            timeout=20,
+        ) as ws:
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    subscribed = await self._handle_push_frame(ws, msg.data) or subscribed
+                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+        _LOGGER.debug("Cloud push stream closed")
+        return subscribed
+
+    async def _handle_push_frame(self, ws: Any, frame: str) -> bool:
+        """Handle one Engine.IO/Socket.IO text frame; True once subscribed."""
+        if frame.startswith("0"):
+            # Engine.IO open packet -> join the default Socket.IO namespace
+            await ws.send_str("40")
+            return False
+        if frame == "2":
+            await ws.send_str("3")
+            return False
+        if frame.startswith("40"):
+            for installation_id in self._cloud_installation_ids:
+                await ws.send_str("42" + json.dumps(["listen_installation", installation_id]))
+            self._set_push_connected(True)
+            _LOGGER.debug("Cloud push subscribed to %s installations", len(self._cloud_installation_ids))
+            return True
+        if not frame.startswith("42"):
+            return False
+
+        try:
+            packet = json.loads(frame[2:])
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed Cloud push frame: %.200s", frame)
+            return False
+        if not isinstance(packet, list) or not packet:
+            return False
+
+        applied = False
+        for device_id, changes in self._push_changes(packet[1:]):
+            applied = self._apply_push_update(device_id, changes) or applied
+        if applied:
+            self.async_update_listeners()
+        return False
+
+    @staticmethod
+    def _push_changes(payloads: list[Any]) -> list[tuple[str, dict[str, Any]]]:
+        """Extract (device_id, status delta) pairs from a push event payload."""
+        out: list[tuple[str, dict[str, Any]]] = []
+        items: list[Any] = []
+        for payload in payloads:
+            items.extend(payload if isinstance(payload, list) else [payload])
+        for item in items:
+            if not isinstance(item, dict) or not item.get("device_id"):
+                continue
+            change = item.get("change")
+            if isinstance(change, dict) and isinstance(change.get("status"), dict):
+                status = change["status"]
+            elif isinstance(item.get("status"), dict):
+                status = item["status"]
+            elif isinstance(change, dict):
+                status = change
+            else:
+                continue
+            out.append((str(item["device_id"]), status))
+        return out
+
+    def _apply_push_update(self, device_id: str, changes: dict[str, Any]) -> bool:
+        """Merge a pushed status delta into the coordinator state.
+
+        Only the affected device is normalized again; the published maps are
+        replaced (not mutated) and the change-sets name just that device, so
+        entities of other devices skip their state write.
+        """
+        entry = self._cloud_device_entries.get(device_id)
+        if entry is None or not changes:
+            return False
+
+        status = {**(self._cloud_raw_statuses.get(device_id) or {}), **changes}
+        self._cloud_raw_statuses[device_id] = status
+        # The next reconciliation poll must not reuse the pre-push record.
+        self._cloud_status_cache.pop(device_id, None)
+
+        device_type = entry.get("device_type")
+        changed_zone_keys: set[tuple[int, int]] = set()
+        changed_iaq_keys: set[tuple[int, int]] = set()
+        changed_energy_meter_ids: set[str] = set()
+
+        if device_type in ZONE_DEVICE_TYPES:
+            if not self._cloud_category_enabled(CLOUD_CATEGORY_CLIMATE_ZONES):
+                return False
+            key = self._cloud_ids(entry)
+            self.data = {**(self.data or {}), key: self._normalize_zone_status(entry, status)}
+            changed_zone_keys.add(key)
+        elif device_type in SYSTEM_DEVICE_TYPES:
+            sid = self._cloud_ids(entry)[0]
+            base = self.systems.get(sid) or {"systemID": sid, "manufacturer": "Airzone Cloud"}
+            self.systems = {**self.systems, sid: {**base, **self._normalize_system_status(entry, status)}}
+            changed_zone_keys = {key for key in (self.data or {}) if key[0] == sid}
+        elif device_type in ENERGY_DEVICE_TYPES:
+            meter = self._normalize_energy_meter_status(entry, status)
+            meter_id = str(meter.get("id") or device_id)
+            previous = self.cloud_energy_meters.get(meter_id) or {}
+            self.cloud_energy_meters = {**self.cloud_energy_meters, meter_id: {**previous, **meter}}
+            changed_energy_meter_ids.add(meter_id)
+        elif device_type in IAQ_DEVICE_TYPES:
+            if not self._cloud_iaq_should_expose(entry):
+                return False
+            key = self._cloud_ids(entry)
+            previous = self.iaqs.get(key) or {}
+            self.iaqs = {**self.iaqs, key: {**previous, **self._normalize_iaq_status(entry, status)}}
+            self._cloud_iaq_keys[device_id] = key
+            changed_iaq_keys.add(key)
+        else:
+            systems = dict(self.systems)
+            sid = self._cloud_ids(entry)[0]
+            if sid in systems:
+                systems[sid] = dict(systems[sid])
+            self._merge_aux_status_into_system(systems, entry, status)
+            self.systems = systems
+
+        self.changed_zone_keys = changed_zone_keys
+        self.changed_iaq_keys = changed_iaq_keys
+        self.changed_energy_meter_ids = changed_energy_meter_ids
+        return True
+
     async def async_close(self) -> None:
         """The shared Home Assistant session must not be closed by the integration."""
-        return None
+        await self._async_stop_push()
+        await self._async_cancel_background_tasks()
+        if self.recorder is not None:
+            self._stop_recording()
@@ -0,0 +1,103 @@
+"""Per refresh cycle time budget for Airzone Control coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from contextvars import ContextVar, Token
+from typing import Any
+
+# Plazo del ciclo en curso; las peticiones anidadas (escaleras de fallback,
+# gather, fetches compartidos del hub Cloud) lo heredan con el contexto.
+_ACTIVE: ContextVar["CycleDeadline | None"] = ContextVar("airzone_control_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The time budget of the current refresh cycle is spent."""
+
+
+class CycleDeadline:
+    """Absolute deadline shared by every request of one refresh cycle.
+
+    `expired` is set once a request was refused or cut short by the deadline,
+    so the coordinator knows the data of that step may be incomplete.
+    """
+
+    __slots__ = ("budget", "at", "expired")
+
+    def __init__(self, budget: float) -> None:
+        self.budget = budget
+        self.at = time.monotonic() + budget
+        self.expired = False
+
+    @staticmethod
+    def active() -> "CycleDeadline | None":
+        return _ACTIVE.get()
+
+    def begin(self) -> Token:
+        return _ACTIVE.set(self)
+
+    @staticmethod
+    def end(token: Token) -> None:
+        _ACTIVE.reset(token)
+
+    def remaining(self) -> float:
+        return self.at - time.monotonic()
+
+
+def request_timeout(timeout: float) -> float:
+    """Timeout for the next request, clipped to what is left of the cycle.
+
+    Raises DeadlineExceeded instead of starting a request that has no time left.
+    """
+    deadline = _ACTIVE.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        deadline.expired = True
+        raise DeadlineExceeded(f"refresh cycle deadline of {deadline.budget:.0f} s exceeded")
+    return min(timeout, remaining)
+
+
+def note_failure() -> None:
+    """Mark the deadline as hit when a request failed after it ran out."""
+    deadline = _ACTIVE.get()
+    if deadline is not None and deadline.remaining() <= 0:
+        deadline.expired = True
+
+
+def detached_context() -> contextvars.Context:
+    """Copia del contexto actual sin plazo, para trabajo compartido entre ciclos."""
+    context = contextvars.copy_context()
+    context.run(_ACTIVE.set, None)
+    return context
+
+
+async def wait_within_deadline(future: asyncio.Future) -> Any:
+    """Espera un future compartido como mucho lo que le queda al ciclo propio.
+
+    El future no se cancela al agotarse el plazo: otros ciclos pueden seguir
+    esperándolo.
+    """
+    deadline = _ACTIVE.get()
+    if deadline is None:
+        return await asyncio.shield(future)
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        deadline.expired = True
+        raise DeadlineExceeded(f"refresh cycle deadline of {deadline.budget:.0f} s exceeded")
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), remaining)
+    except asyncio.TimeoutError:
+        if future.done():
+            # El timeout era del propio fetch, no del plazo de este ciclo
+            raise
+        deadline.expired = True
+        raise DeadlineExceeded(f"refresh cycle deadline of {deadline.budget:.0f} s exceeded") from None
+
+
+def deadline_expired() -> bool:
+    deadline = _ACTIVE.get()
+    return deadline is not None and deadline.expired
@@ -11,34 +11,10 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .cloud_hub import REQUEST_TIMEOUT as CLOUD_REQUEST_TIMEOUT
+from .const import DOMAIN, TO_REDACT
 from .coordinator import AirzoneCoordinator
-
-TO_REDACT = {
-    "ip",
-    "host",
-    "hostname",
-    "url",
-    "base_url",
-    "email",
-    "token",
-    "access_token",
-    "refresh_token",
-    "password",
-    "user_id",
-    "installation_id",
-    "device_id",
-    "ws_id",
-    "cloud_installation_id",
-    "cloud_device_id",
-    "cloud_ws_id",
-    "ssid",
-    "mac",
-    "mac_address",
-    "serial",
-    "serial_number",
-    "unique_id",
-}
+from .transport import REQUEST_TIMEOUT
 
 
 def _jsonable(obj: Any) -> Any:
@@ -80,6 +56,14 @@ def _jsonable(obj: Any) -> Any:
         return repr(obj)
 
 
+def _rtt(coordinator: AirzoneCoordinator) -> dict[str, Any] | None:
+    """RTT and derived timeout of the Local API transport or the Cloud hub."""
+    if getattr(coordinator, "connection_type", "local") == "local":
+        return coordinator.transport.rtt.as_dict(REQUEST_TIMEOUT)
+    hub = getattr(coordinator, "_hub", None)
+    return hub.rtt.as_dict(CLOUD_REQUEST_TIMEOUT) if hub is not None else None
+
+
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry):
     """Return diagnostics for a config entry."""
     bundle = hass.data[DOMAIN][config_entry.entry_id]
@@ -100,7 +84,14 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry):
         "coordinator": {
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(getattr(coordinator, "update_interval", "")),
+            "interval_range": getattr(coordinator, "interval_range", None),
+            "capacity": coordinator.capacity.as_dict(),
+            "offline": getattr(coordinator, "offline_since", None) is not None,
         },
+        "rtt": _rtt(coordinator),
+        "telemetry": coordinator.telemetry.as_dict(),
+        "phases": coordinator.phases.as_dict(),
+        "trace": coordinator.telemetry.trace.records(TO_REDACT),
         "api_data": _jsonable(getattr(coordinator, "data", None)),
     }
 
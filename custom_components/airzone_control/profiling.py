@@ -0,0 +1,59 @@
+"""Captura de perfiles de los ciclos de refresco bajo demanda."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_PYINSTRUMENT = "pyinstrument"
+
+
+class CycleProfiler:
+    """Profiles the next N refresh cycles of one coordinator.
+
+    The profiler is enabled around the whole refresh (update + entity
+    fan-out) and paused between cycles, so the result only covers polling.
+    cProfile writes a .prof file (snakeviz, flameprof, gprof2dot...);
+    pyinstrument, a sampling profiler, writes a speedscope .json.
+    """
+
+    def __init__(self, cycles: int, path: str, kind: str = PROFILER_CPROFILE, module: Any = None) -> None:
+        self.remaining = max(1, int(cycles))
+        self.cycles = self.remaining
+        self.path = path
+        self.kind = kind
+        if kind == PROFILER_PYINSTRUMENT:
+            # async_mode="disabled": muestrea el hilo del loop entero, como cProfile
+            self._profiler = module.Profiler(async_mode="disabled")
+        else:
+            self._profiler = cProfile.Profile()
+        self._module = module
+
+    def start(self) -> None:
+        if self.kind == PROFILER_PYINSTRUMENT:
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def stop(self) -> bool:
+        """Pause after a cycle; True when all requested cycles are captured."""
+        if self.kind == PROFILER_PYINSTRUMENT:
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+        self.remaining -= 1
+        return self.remaining <= 0
+
+    def write(self) -> str:
+        """Write the capture to disk (blocking: run in the executor)."""
+        if self.kind == PROFILER_PYINSTRUMENT:
+            renderer = self._module.renderers.SpeedscopeRenderer()
+            with open(self.path, "w", encoding="utf-8") as handle:
+                handle.write(self._profiler.output(renderer))
+        else:
+            self._profiler.dump_stats(self.path)
+        return self.path
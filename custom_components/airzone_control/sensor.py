@@ -3,9 +3,9 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_state_change_event
@@ -57,6 +57,9 @@ async def async_setup_entry(
     if getattr(coord, "expose_webserver_entities", True):
         entities.extend(_build_webserver_sensors(coord))
 
+    # ---- Telemetría del sondeo (diagnóstico, desactivados por defecto) ----
+    entities.extend([PollDurationSensor(coord), RequestsPerPollSensor(coord)])
+
     # ---- Sensores IAQ ----
     if isinstance(getattr(coord, "iaqs", None), dict):
         for (sid, iid), _ in coord.iaqs.items():
@@ -115,6 +118,12 @@ class _BaseZoneSensor(CoordinatorEntity[AirzoneCoordinator], SensorEntity):
     def _zone(self) -> dict:
         return self.coordinator.get_zone(self._sid, self._zid) or {}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.zone_changed(self._sid, self._zid):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         return bool(self._zone())
@@ -162,6 +171,12 @@ class _BaseIAQSensor(CoordinatorEntity[AirzoneCoordinator], SensorEntity):
     def _iaq(self) -> dict:
         return self.coordinator.get_iaq(self._sid, self._iid) or {}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if not self.coordinator.iaq_changed(self._sid, self._iid):
+            return
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         return bool(self._iaq())
@@ -221,6 +236,13 @@ class _BaseCloudEnergyMeterSensor(CoordinatorEntity[AirzoneCoordinator], SensorE
             return {}
         return meters.get(self._meter_id) or {}
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = getattr(self.coordinator, "changed_energy_meter_ids", None)
+        if changed is not None and self._meter_id not in changed:
+            return
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         return self._key in self._meter()
@@ -973,6 +995,50 @@ class WSTransportSensor(_BaseWSSensor):
         return d.get("transport") or None
 
 
+class _BaseTelemetrySensor(_BaseWSSensor):
+    """Métricas del último sondeo; se actualizan al terminar cada ciclo."""
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.telemetry.async_add_listener(self.async_write_ha_state))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # La telemetría del ciclo se cierra después del fan-out del coordinator
+        return
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.telemetry.polls > 0
+
+
+class PollDurationSensor(_BaseTelemetrySensor):
+    """Duración del último ciclo de sondeo."""
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator: AirzoneCoordinator) -> None:
+        super().__init__(coordinator, "poll_duration", "poll_duration")
+
+    @property
+    def native_value(self) -> Optional[float]:
+        value = self.coordinator.telemetry.last_poll_duration
+        return None if value is None else round(value * 1000, 1)
+
+
+class RequestsPerPollSensor(_BaseTelemetrySensor):
+    """Peticiones HTTP realizadas en el último ciclo de sondeo."""
+    def __init__(self, coordinator: AirzoneCoordinator) -> None:
+        super().__init__(coordinator, "requests_per_poll", "requests_per_poll")
+
+    @property
+    def native_value(self) -> Optional[int]:
+        return self.coordinator.telemetry.last_poll_requests
+
+
 class WSMacSensor(_BaseWSSensor):
     def __init__(self, coordinator: AirzoneCoordinator) -> None:
         super().__init__(coordinator, "ws_mac", "ws_mac")
@@ -0,0 +1,202 @@
+"""Servicios de mantenimiento de Airzone Control."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+import os
+from datetime import datetime
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .calibration import async_calibrate, async_save_capacity
+from .cassette import CassetteRecorder
+from .const import CALIBRATION_MAX_CONCURRENCY, CONNECTION_TYPE_LOCAL, DOMAIN, TO_REDACT
+from .coordinator import AirzoneCoordinator
+from .profiling import PROFILER_CPROFILE, PROFILER_PYINSTRUMENT, CycleProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_PROFILE = "profile"
+SERVICE_RECORD = "record"
+SERVICE_CALIBRATE = "calibrate"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_PROFILER = "profiler"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+PROFILER_AUTO = "auto"
+
+DUMP_TRACE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+        vol.Optional(ATTR_PROFILER, default=PROFILER_AUTO): vol.In(
+            [PROFILER_AUTO, PROFILER_CPROFILE, PROFILER_PYINSTRUMENT]
+        ),
+    }
+)
+RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+CALIBRATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=CALIBRATION_MAX_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=16)
+        ),
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, entry_id: str | None) -> dict[str, AirzoneCoordinator]:
+    """Coordinators cargados (todos, o el de la entrada pedida)."""
+    out: dict[str, AirzoneCoordinator] = {}
+    for key, bundle in (hass.data.get(DOMAIN) or {}).items():
+        if entry_id and key != entry_id:
+            continue
+        coordinator = bundle.get("coordinator") if isinstance(bundle, dict) else None
+        if isinstance(coordinator, AirzoneCoordinator):
+            out[key] = coordinator
+    if entry_id and not out:
+        raise HomeAssistantError(f"Airzone Control entry not loaded: {entry_id}")
+    return out
+
+
+def _write_json(path: str, payload: dict) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, ensure_ascii=False, indent=2)
+
+
+async def _async_dump_trace(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Vuelca la traza HTTP de cada coordinator a <config>/airzone_control_trace_*.json."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    for entry_id, coordinator in _coordinators(hass, call.data.get(ATTR_ENTRY_ID)).items():
+        path = hass.config.path(f"{DOMAIN}_trace_{entry_id}_{stamp}.json")
+        payload = {
+            "entry_id": entry_id,
+            "connection_type": coordinator.connection_type,
+            "trace": coordinator.telemetry.trace.records(TO_REDACT),
+        }
+        await hass.async_add_executor_job(_write_json, path, payload)
+        _LOGGER.info("Airzone trace written to %s", os.path.basename(path))
+
+
+async def _async_import_pyinstrument(hass: HomeAssistant) -> object | None:
+    def _import() -> object | None:
+        try:
+            module = importlib.import_module("pyinstrument")
+            importlib.import_module("pyinstrument.renderers")
+            return module
+        except ImportError:
+            return None
+
+    return await hass.async_add_executor_job(_import)
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Perfila los próximos N ciclos de refresco de una entrada."""
+    entry_id = call.data[ATTR_ENTRY_ID]
+    coordinator = _coordinators(hass, entry_id)[entry_id]
+    if coordinator.profiler is not None:
+        raise HomeAssistantError("A profile capture is already running for this entry")
+
+    kind = call.data[ATTR_PROFILER]
+    module = None
+    if kind in (PROFILER_AUTO, PROFILER_PYINSTRUMENT):
+        module = await _async_import_pyinstrument(hass)
+        if module is None and kind == PROFILER_PYINSTRUMENT:
+            raise HomeAssistantError("pyinstrument is not installed")
+        kind = PROFILER_PYINSTRUMENT if module is not None else PROFILER_CPROFILE
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    suffix = "speedscope.json" if kind == PROFILER_PYINSTRUMENT else "prof"
+    path = hass.config.path(f"{DOMAIN}_profile_{entry_id}_{stamp}.{suffix}")
+    coordinator.profiler = CycleProfiler(call.data[ATTR_CYCLES], path, kind, module)
+    _LOGGER.info(
+        "Profiling the next %s refresh cycles of %s with %s",
+        call.data[ATTR_CYCLES],
+        entry_id,
+        kind,
+    )
+
+
+async def _async_record(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Graba los intercambios HTTP de los próximos N ciclos en un cassette."""
+    entry_id = call.data[ATTR_ENTRY_ID]
+    coordinator = _coordinators(hass, entry_id)[entry_id]
+    if coordinator.recorder is not None:
+        raise HomeAssistantError("A recording is already running for this entry")
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = hass.config.path(f"{DOMAIN}_cassette_{entry_id}_{stamp}.jsonl.gz")
+    recorder = CassetteRecorder(call.data[ATTR_CYCLES], path, TO_REDACT, coordinator.connection_type)
+    try:
+        await coordinator.async_start_recording(recorder)
+    except ValueError as e:
+        raise HomeAssistantError(str(e)) from e
+    _LOGGER.info("Recording the next %s refresh cycles of %s", call.data[ATTR_CYCLES], entry_id)
+
+
+async def _async_calibrate(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Mide cuántas escrituras simultáneas aguanta el webserver y lo guarda para las operaciones en bloque."""
+    entry_id = call.data[ATTR_ENTRY_ID]
+    coordinator = _coordinators(hass, entry_id)[entry_id]
+    if coordinator.connection_type != CONNECTION_TYPE_LOCAL:
+        raise HomeAssistantError("Capacity calibration is only available for Local API entries")
+    if coordinator.calibrating:
+        raise HomeAssistantError("A calibration is already running for this entry")
+
+    try:
+        capacity = await async_calibrate(coordinator, call.data[ATTR_MAX_CONCURRENCY])
+    except (ValueError, UpdateFailed) as e:
+        raise HomeAssistantError(f"Calibration failed: {e}") from e
+
+    coordinator.capacity = capacity
+    await async_save_capacity(hass, coordinator.capacity_key, capacity)
+    _LOGGER.info(
+        "Airzone webserver of %s calibrated: %s concurrent requests, %.2f s apart",
+        entry_id,
+        capacity.concurrency,
+        capacity.pacing,
+    )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Registra los servicios (una vez por instancia de Home Assistant)."""
+    if hass.services.has_service(DOMAIN, SERVICE_DUMP_TRACE):
+        return
+
+    async def _dump_trace(call: ServiceCall) -> None:
+        await _async_dump_trace(hass, call)
+
+    async def _profile(call: ServiceCall) -> None:
+        await _async_profile(hass, call)
+
+    async def _record(call: ServiceCall) -> None:
+        await _async_record(hass, call)
+
+    async def _calibrate(call: ServiceCall) -> None:
+        await _async_calibrate(hass, call)
+
+    hass.services.async_register(DOMAIN, SERVICE_DUMP_TRACE, _dump_trace, schema=DUMP_TRACE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, _profile, schema=PROFILE_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_RECORD, _record, schema=RECORD_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_CALIBRATE, _calibrate, schema=CALIBRATE_SCHEMA)
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Elimina los servicios cuando ya no queda ninguna entrada cargada."""
+    hass.services.async_remove(DOMAIN, SERVICE_DUMP_TRACE)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+    hass.services.async_remove(DOMAIN, SERVICE_RECORD)
+    hass.services.async_remove(DOMAIN, SERVICE_CALIBRATE)
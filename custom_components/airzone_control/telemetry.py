@@ -0,0 +1,343 @@
+"""Lightweight request telemetry for Airzone Control coordinators."""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Any, Callable
+
+# Latencias guardadas por endpoint para calcular percentiles
+LATENCY_SAMPLES = 256
+# Traza: últimos intercambios HTTP y tamaño máximo del cuerpo guardado
+TRACE_SIZE = 64
+TRACE_BODY_LIMIT = 512
+# Timeouts adaptativos: RTT recientes por controlador, mínimo de muestras para
+# adaptarlos y factor sobre el p99
+RTT_SAMPLES = 64
+RTT_MIN_SAMPLES = 16
+RTT_TIMEOUT_FACTOR = 2
+
+# Telemetría del ciclo en curso; las tareas creadas durante el ciclo (gather,
+# fetches compartidos del hub Cloud) la heredan con el contexto.
+_ACTIVE: ContextVar["RequestTelemetry | None"] = ContextVar("airzone_control_telemetry", default=None)
+
+# Segmentos variables (IDs de dispositivo/instalación, MACs, tokens)
+_ID_SEGMENT = re.compile(r"^(?=.*[0-9:])[^/]+$|^[^/]{20,}$")
+
+
+def endpoint_label(path: str) -> str:
+    """Collapse identifiers in a request path so it can be used as a metric label.
+
+    "/devices/5f1e.../status" -> "/devices/{id}/status"
+    """
+    path = path.split("?", 1)[0]
+    return "/".join("{id}" if segment and _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float | None:
+    if not sorted_samples:
+        return None
+    # nearest-rank
+    rank = min(len(sorted_samples), max(1, math.ceil(pct / 100 * len(sorted_samples)))) - 1
+    return sorted_samples[rank]
+
+
+class RequestTrace:
+    """Fixed-size ring buffer with the last HTTP exchanges.
+
+    Slots are preallocated and overwritten in place; each record is a plain
+    tuple holding a truncated slice of the response body. Redaction happens
+    only when the buffer is dumped.
+    """
+
+    __slots__ = ("_slots", "_next", "_size")
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        self._size = size
+        self._slots: list[tuple | None] = [None] * size
+        self._next = 0
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        scheme: str,
+        latency: float,
+        status: int | None,
+        params: dict | None,
+        body: dict | None,
+        response: str | None,
+    ) -> None:
+        self._slots[self._next % self._size] = (
+            time.time(),
+            method,
+            path,
+            tuple(params) if params else (),
+            tuple(body) if body else (),
+            status,
+            latency,
+            len(response) if response is not None else None,
+            scheme,
+            response[:TRACE_BODY_LIMIT] if response else response,
+        )
+        self._next += 1
+
+    def records(self, redact: frozenset[str] | set[str] = frozenset()) -> list[dict[str, Any]]:
+        """Oldest-first records with sensitive body values and path IDs masked."""
+        start = max(0, self._next - self._size)
+        out: list[dict[str, Any]] = []
+        for index in range(start, self._next):
+            record = self._slots[index % self._size]
+            if record is None:
+                continue
+            ts, method, path, param_keys, body_keys, status, latency, size, scheme, text = record
+            out.append(
+                {
+                    "ts": ts,
+                    "method": method,
+                    "path": endpoint_label(path),
+                    "param_keys": list(param_keys),
+                    "body_keys": list(body_keys),
+                    "status": status,
+                    "latency_ms": _ms(latency),
+                    "bytes": size,
+                    "scheme": scheme,
+                    "body": _redact_text(text, redact) if text else text,
+                }
+            )
+        return out
+
+
+_REDACT_PATTERNS: dict[frozenset[str], re.Pattern[str]] = {}
+
+
+def _redact_text(text: str, keys: frozenset[str] | set[str]) -> str:
+    if not keys:
+        return text
+    pattern = _REDACT_PATTERNS.get(frozenset(keys))
+    if pattern is None:
+        pattern = _REDACT_PATTERNS[frozenset(keys)] = re.compile(
+            r'("(?:' + "|".join(re.escape(key) for key in sorted(keys)) + r')"\s*:\s*)("(?:[^"\\]|\\.)*"?|[^,}\]]+)'
+        )
+    return pattern.sub(r'\1"**REDACTED**"', text)
+
+
+
+class RttTracker:
+    """Recent round-trip times of one controller and the timeouts derived from them.
+
+    timeout(ceiling) is p99 * RTT_TIMEOUT_FACTOR + margin, clamped between
+    `minimum` and `ceiling` (the fixed timeout of the call site). Until
+    RTT_MIN_SAMPLES answers are known the ceiling is used as is. A request that
+    times out counts as a sample of its timeout, so the next ones widen quickly
+    when the controller slows down.
+    """
+
+    __slots__ = ("minimum", "margin", "_samples", "_p99")
+
+    def __init__(self, minimum: float, margin: float) -> None:
+        self.minimum = minimum
+        self.margin = margin
+        self._samples: deque[float] = deque(maxlen=RTT_SAMPLES)
+        self._p99: float | None = None
+
+    def observe(self, latency: float) -> None:
+        self._samples.append(latency)
+        self._p99 = None
+
+    def observe_timeout(self, timeout: float) -> None:
+        self.observe(timeout)
+
+    @property
+    def p99(self) -> float | None:
+        if self._p99 is None and len(self._samples) >= RTT_MIN_SAMPLES:
+            self._p99 = _percentile(sorted(self._samples), 99)
+        return self._p99
+
+    def timeout(self, ceiling: float) -> float:
+        p99 = self.p99
+        if p99 is None:
+            return ceiling
+        return max(min(self.minimum, ceiling), min(ceiling, p99 * RTT_TIMEOUT_FACTOR + self.margin))
+
+    def as_dict(self, ceiling: float) -> dict[str, Any]:
+        return {
+            "samples": len(self._samples),
+            "p99_ms": _ms(self.p99),
+            "timeout_s": round(self.timeout(ceiling), 2),
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("count", "errors", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+
+class RequestTelemetry:
+    """Per endpoint/method/scheme request counters and latency percentiles."""
+
+    def __init__(self) -> None:
+        self._stats: dict[tuple[str, str, str], _EndpointStats] = {}
+        self._poll_requests = 0
+        self._poll_started: float | None = None
+        self.last_poll_duration: float | None = None
+        self.last_poll_requests: int | None = None
+        self.polls = 0
+        self._listeners: list[Callable[[], None]] = []
+        self.trace = RequestTrace()
+
+    @staticmethod
+    def active() -> "RequestTelemetry | None":
+        return _ACTIVE.get()
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        scheme: str,
+        latency: float,
+        ok: bool,
+        *,
+        status: int | None = None,
+        params: dict | None = None,
+        body: dict | None = None,
+        response: str | None = None,
+    ) -> None:
+        self.trace.add(method, path, scheme, latency, status, params, body, response)
+        key = (endpoint_label(path), method.upper(), scheme)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats()
+        stats.count += 1
+        if not ok:
+            stats.errors += 1
+        stats.samples.append(latency)
+        self._poll_requests += 1
+
+    def begin_poll(self) -> Token:
+        self._poll_requests = 0
+        self._poll_started = time.monotonic()
+        return _ACTIVE.set(self)
+
+    def end_poll(self, token: Token) -> None:
+        _ACTIVE.reset(token)
+        if self._poll_started is not None:
+            self.last_poll_duration = time.monotonic() - self._poll_started
+        self.last_poll_requests = self._poll_requests
+        self._poll_started = None
+        self.polls += 1
+        for listener in list(self._listeners):
+            listener()
+
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after every poll; returns the remove callback."""
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def as_dict(self) -> dict[str, Any]:
+        endpoints: dict[str, Any] = {}
+        for (endpoint, method, scheme), stats in sorted(self._stats.items()):
+            samples = sorted(stats.samples)
+            endpoints[f"{method} {endpoint} ({scheme})"] = {
+                "count": stats.count,
+                "errors": stats.errors,
+                "p50_ms": _ms(_percentile(samples, 50)),
+                "p95_ms": _ms(_percentile(samples, 95)),
+                "p99_ms": _ms(_percentile(samples, 99)),
+                "max_ms": _ms(samples[-1] if samples else None),
+            }
+        return {
+            "polls": self.polls,
+            "last_poll_duration_ms": _ms(self.last_poll_duration),
+            "last_poll_requests": self.last_poll_requests,
+            "endpoints": endpoints,
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+# Ciclos recientes conservados por fase
+PHASE_WINDOW = 30
+
+
+class PhaseTimings:
+    """Per-phase durations of the refresh cycle over a rolling window.
+
+    Phases are closed with lap() in the order they run, so timing a cycle
+    only needs one call at the end of each step.
+    """
+
+    def __init__(self, window: int = PHASE_WINDOW) -> None:
+        self._window = window
+        self._history: dict[str, deque[float]] = {}
+        self._cycle: dict[str, float] | None = None
+        self._notes: list[str] = []
+        self._mark = 0.0
+        self.last_cycle: dict[str, float] = {}
+        self.last_notes: list[str] = []
+
+    def begin_cycle(self) -> None:
+        self._cycle = {}
+        self._notes = []
+        self._mark = time.monotonic()
+
+    def lap(self, phase: str) -> None:
+        """Close `phase`: charge it the time elapsed since the previous lap."""
+        if self._cycle is None:
+            return
+        now = time.monotonic()
+        self._cycle[phase] = self._cycle.get(phase, 0.0) + (now - self._mark)
+        self._mark = now
+
+    def add(self, phase: str, seconds: float) -> None:
+        if self._cycle is not None:
+            self._cycle[phase] = self._cycle.get(phase, 0.0) + seconds
+
+    def note(self, text: str) -> None:
+        """Record a fallback/detection step taken in this cycle."""
+        if self._cycle is not None:
+            self._notes.append(text)
+
+    def end_cycle(self) -> str:
+        """Store the cycle in the window and return a one-line summary."""
+        cycle, self._cycle = self._cycle or {}, None
+        for phase, seconds in cycle.items():
+            history = self._history.get(phase)
+            if history is None:
+                history = self._history[phase] = deque(maxlen=self._window)
+            history.append(seconds)
+        self.last_cycle = cycle
+        self.last_notes = self._notes
+        summary = " ".join(f"{phase}={seconds * 1000:.0f}ms" for phase, seconds in cycle.items())
+        if self._notes:
+            summary += " [" + ", ".join(self._notes) + "]"
+        return summary
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "last_cycle_ms": {phase: _ms(seconds) for phase, seconds in self.last_cycle.items()},
+            "last_notes": list(self.last_notes),
+            "window": {
+                phase: {
+                    "samples": len(history),
+                    "avg_ms": _ms(sum(history) / len(history)),
+                    "max_ms": _ms(max(history)),
+                }
+                for phase, history in self._history.items()
+                if history
+            },
+        }
@@ -0,0 +1,334 @@
+"""Transportes HTTP de la Local API (aiohttp y en memoria)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import aiohttp
+
+from .const import DEFAULT_PORT, LOCAL_TIMEOUT_MARGIN, LOCAL_TIMEOUT_MIN
+from .deadline import DeadlineExceeded, note_failure, request_timeout
+from .telemetry import RttTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HTTPS_PORT = 3443
+# Timeout de una lectura sin RTT conocido (y techo del timeout adaptativo)
+REQUEST_TIMEOUT = 8
+
+
+class TransportResponse:
+    """Successful (HTTP 200) response and the scheme that served it."""
+
+    __slots__ = ("status", "text", "scheme")
+
+    def __init__(self, status: int, text: str, scheme: str) -> None:
+        self.status = status
+        self.text = text
+        self.scheme = scheme
+
+    def json(self) -> Any:
+        # Igual que aiohttp: cuerpo vacío -> None; no JSON -> texto en bruto
+        if not self.text.strip():
+            return None
+        try:
+            return json.loads(self.text)
+        except ValueError:
+            return {"raw": self.text}
+
+
+class AirzoneTransport:
+    """Local API transport: API prefix detection and http/https fallback.
+
+    Subclasses only implement _send(); every attempt is reported to
+    `observer` (same signature as RequestTelemetry.record).
+    """
+
+    def __init__(self, prefix: str | None = None) -> None:
+        self.prefix: str | None = prefix  # puede venir del config_flow
+        self.prefer_https: bool | None = None  # autodetección en runtime
+        self.scheme: str | None = None  # último esquema que respondió 200
+        self.last_success: float | None = None  # monotonic de la última respuesta 200
+        self.server_errors = 0  # respuestas 5xx acumuladas (señal de estrés)
+        self.observer: Callable[..., None] | None = None
+        # RTT del controlador: los timeouts se ajustan a lo que tarda de verdad
+        self.rtt = RttTracker(LOCAL_TIMEOUT_MIN, LOCAL_TIMEOUT_MARGIN)
+
+    async def _send(
+        self,
+        scheme: str,
+        prefix: str,
+        method: str,
+        path: str,
+        params: dict | None,
+        body: dict | None,
+        timeout: float,
+    ) -> tuple[int, str]:
+        """Perform one request; return (status, body text) or raise on connection errors."""
+        raise NotImplementedError
+
+    async def async_close(self) -> None:
+        return None
+
+    async def async_probe(self, timeout: float = 3) -> bool:
+        """One cheap liveness check: a single GET /webserver on the preferred scheme.
+
+        Any HTTP answer counts as alive; the full poll decides the rest.
+        """
+        try:
+            scheme = self._schemes()[0]
+            await self._send(scheme, self.prefix or "", "GET", "/webserver", None, None, request_timeout(timeout))
+        except Exception as e:
+            _LOGGER.debug("Liveness probe failed: %s", e)
+            return False
+        return True
+
+    def _schemes(self) -> list[str]:
+        # Si ya se decidió https/http, respetarlo; si no, http primero.
+        return ["https", "http"] if self.prefer_https else ["http", "https"]
+
+    async def async_detect_prefix(self, candidates: list[str], timeout: float = 6) -> bool:
+        """Probe GET/POST /webserver on every candidate prefix; True when one answers."""
+        if self.prefix is not None:
+            return False
+        for scheme in self._schemes():
+            for pref in candidates:
+                for method in ("GET", "POST"):
+                    budget = self._budget(method, timeout)
+                    try:
+                        attempt_timeout = request_timeout(budget)
+                    except DeadlineExceeded as e:
+                        _LOGGER.debug("API prefix detection stopped: %s", e)
+                        return False
+                    started = time.monotonic()
+                    try:
+                        status, text = await self._send(
+                            scheme, pref, method, "/webserver", None, {} if method == "POST" else None, attempt_timeout
+                        )
+                    except Exception as e:
+                        self._failed(e, method, attempt_timeout, budget)
+                        self._observe(method, "/webserver", scheme, started, False, response=repr(e))
+                        continue
+                    self._observe(method, "/webserver", scheme, started, status == 200, status=status, response=text)
+                    if status == 200:
+                        self.last_success = time.monotonic()
+                        self.prefix = pref
+                        self.prefer_https = scheme == "https"
+                        self.scheme = scheme
+                        _LOGGER.debug("Detected API prefix via %s /webserver: %s (scheme=%s)", method, pref, scheme)
+                        return True
+        return False
+
+    async def async_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict | None = None,
+        body: dict | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        failure_level: int = logging.DEBUG,
+    ) -> TransportResponse | None:
+        """Try the preferred scheme and fall back to the other; None if both fail.
+
+        Inside a refresh cycle every attempt is bounded by the cycle deadline;
+        once it is spent no new attempt is started and None is returned.
+        """
+        is_get = method == "GET"
+        last_status: int | None = None
+        last_txt = ""
+        for scheme in self._schemes():
+            budget = self._budget(method, timeout)
+            try:
+                attempt_timeout = request_timeout(budget)
+            except DeadlineExceeded as e:
+                _LOGGER.debug("%s %s not sent: %s", method, path, e)
+                return None
+            started = time.monotonic()
+            try:
+                status, text = await self._send(
+                    scheme,
+                    self.prefix or "",
+                    method,
+                    path,
+                    params if is_get else None,
+                    None if is_get else (body or {}),
+                    attempt_timeout,
+                )
+            except Exception as e:
+                self._failed(e, method, attempt_timeout, budget)
+                self._observe(method, path, scheme, started, False, params=params, body=body, response=repr(e))
+                _LOGGER.debug("%s %s %s failed on %s: %s", method, path, params if is_get else body, scheme, e)
+                last_txt = str(e)
+                continue
+
+            self._observe(
+                method, path, scheme, started, status == 200,
+                status=status, params=params if is_get else None, body=None if is_get else body, response=text,
+            )
+            if status >= 500:
+                self.server_errors += 1
+            if status != 200:
+                _LOGGER.log(failure_level, "%s %s %s -> %s %s", method, path, params if is_get else body, status, text)
+                last_status, last_txt = status, text
+                continue
+
+            self.prefer_https = scheme == "https"
+            self.scheme = scheme
+            self.last_success = time.monotonic()
+            return TransportResponse(status, text, scheme)
+
+        if last_status:
+            _LOGGER.debug("%s %s final error -> %s %s", method, path, last_status, last_txt)
+        return None
+
+    def _observe(self, method: str, path: str, scheme: str, started: float, ok: bool, **kwargs: Any) -> None:
+        latency = time.monotonic() - started
+        if kwargs.get("status") is not None and method != "PUT":
+            # Cualquier respuesta HTTP (también 4xx) de una lectura mide el RTT
+            self.rtt.observe(latency)
+        if self.observer is not None:
+            self.observer(method, path, scheme, latency, ok, **kwargs)
+
+    def _budget(self, method: str, timeout: float) -> float:
+        # Solo las lecturas se ajustan al RTT: un PUT puede tardar bastante más en
+        # aplicarse, y un falso timeout lo repetiría por el otro esquema
+        return timeout if method == "PUT" else self.rtt.timeout(timeout)
+
+    def _failed(self, error: Exception, method: str, timeout: float, budget: float) -> None:
+        note_failure()
+        # Un timeout recortado por el plazo del ciclo no dice nada del RTT del controlador
+        if isinstance(error, asyncio.TimeoutError) and method != "PUT" and timeout >= budget:
+            self.rtt.observe_timeout(timeout)
+
+
+class AiohttpTransport(AirzoneTransport):
+    """Real webserver over aiohttp; https skips certificate checks (LAPI 1.78 is self-signed)."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = DEFAULT_PORT,
+        *,
+        https_port: int = DEFAULT_HTTPS_PORT,
+        prefix: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        super().__init__(prefix)
+        self.host = host.strip()
+        self.port = int(port or DEFAULT_PORT)
+        self.https_port = https_port
+        self._session = session
+
+    async def async_ensure_session(self) -> aiohttp.ClientSession:
+        if self._session and not self._session.closed:
+            return self._session
+        self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _send(
+        self,
+        scheme: str,
+        prefix: str,
+        method: str,
+        path: str,
+        params: dict | None,
+        body: dict | None,
+        timeout: float,
+    ) -> tuple[int, str]:
+        session = await self.async_ensure_session()
+        if scheme == "https":
+            url = f"https://{self.host}:{self.https_port}{prefix}{path}"
+            ssl_opt: bool | None = False
+        else:
+            url = f"http://{self.host}:{self.port}{prefix}{path}"
+            ssl_opt = None
+        if method == "GET":
+            request = session.get(url, params=params, timeout=timeout, ssl=ssl_opt)
+        else:
+            request = session.request(method, url, json=body, timeout=timeout, ssl=ssl_opt)
+        async with request as resp:
+            return resp.status, await resp.text()
+
+    async def async_probe(self, timeout: float = 3) -> bool:
+        """A single TCP connect to the port of the preferred scheme, without HTTP."""
+        port = self.https_port if self.prefer_https else self.port
+        try:
+            _reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, port), request_timeout(timeout)
+            )
+        except Exception as e:
+            _LOGGER.debug("Liveness probe to %s:%s failed: %s", self.host, port, e)
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return True
+
+    async def async_close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class InMemoryTransport(AirzoneTransport):
+    """Serves requests from a simulated controller without any socket.
+
+    `model` only needs handle(method, path, params, body) -> (status, payload),
+    e.g. dev_tools/fake_airzone_async.ControllerModel. `http`/`https` select
+    which schemes accept connections. With network=True the model's latency,
+    5xx and timeout injection are applied as well, and `model.in_flight`
+    counts the requests in progress (for its concurrency limit).
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        prefix: str | None = None,
+        http: bool = True,
+        https: bool = False,
+        network: bool = False,
+    ) -> None:
+        super().__init__(prefix)
+        self.model = model
+        self.http = http
+        self.https = https
+        self.network = network
+
+    async def _send(
+        self,
+        scheme: str,
+        prefix: str,
+        method: str,
+        path: str,
+        params: dict | None,
+        body: dict | None,
+        timeout: float,
+    ) -> tuple[int, str]:
+        if not (self.https if scheme == "https" else self.http):
+            raise aiohttp.ClientConnectionError(f"{scheme} not available")
+        if not self.network:
+            status, payload = self.model.handle(method, f"{prefix}{path}", params, body)
+            return status, json.dumps(payload)
+        self.model.in_flight += 1
+        try:
+            fault = self.model.pick_fault()
+            if fault == "timeout":
+                await asyncio.sleep(min(timeout, self.model.hang))
+                raise asyncio.TimeoutError()
+            delay = self.model.response_delay()
+            if delay:
+                await asyncio.sleep(delay)
+            if fault == "error":
+                return 503, json.dumps({"error": "service unavailable"})
+            status, payload = self.model.handle(method, f"{prefix}{path}", params, body)
+        finally:
+            self.model.in_flight -= 1
+        return status, json.dumps(payload)
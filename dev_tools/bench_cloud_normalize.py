@@ -0,0 +1,156 @@
+# bench_cloud_normalize.py
+# Micro-benchmark de la normalización Cloud sobre una cuenta sintética.
+# Genera N dispositivos (zonas, sistemas, IAQ y medidores) y mide cuántos
+# estados por segundo normalizan los _normalize_*_status del coordinador Cloud.
+#
+# Uso:
+#   python dev_tools/bench_cloud_normalize.py --devices 1000 --rounds 20
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from custom_components.airzone_control.coordinator_cloud import (  # noqa: E402
+    ENERGY_DEVICE_TYPES,
+    IAQ_DEVICE_TYPES,
+    SYSTEM_DEVICE_TYPES,
+    ZONE_DEVICE_TYPES,
+    AirzoneCloudCoordinator,
+)
+
+
+def make_status(device_type: str, rnd: random.Random) -> dict:
+    if device_type == "az_zone":
+        mode = rnd.choice([1, 2, 3, 4, 5])
+        return {
+            "name": f"Zona {rnd.randint(1, 99)}",
+            "power": rnd.choice([True, False]),
+            "mode": mode,
+            "mode_available": [1, 2, 3, 4, 5],
+            "local_temp": {"celsius": round(rnd.uniform(17, 27), 1), "fah": 70},
+            "zone_work_temp": {"celsius": 21.5, "fah": 70},
+            "setpoint_air_heat": {"celsius": 21, "fah": 70},
+            "setpoint_air_cool": {"celsius": 25, "fah": 77},
+            "setpoint_air_auto": {"celsius": 23, "fah": 73},
+            "range_sp_hot_air_min": {"celsius": 15, "fah": 59},
+            "range_sp_hot_air_max": {"celsius": 30, "fah": 86},
+            "range_sp_cool_air_min": {"celsius": 18, "fah": 64},
+            "range_sp_cool_air_max": {"celsius": 30, "fah": 86},
+            "speed_conf": rnd.randint(0, 3),
+            "speed_values": [0, 1, 2, 3],
+            "sleep": 0,
+            "sleep_values": [0, 30, 60, 90],
+            "humidity": rnd.randint(30, 60),
+            "double_sp": False,
+            "ws_connected": True,
+            "isConnected": True,
+            "usermode_conf": 0,
+            "usermode_values": [0, 1, 2],
+            "aq_quality": 1,
+        }
+    if device_type == "az_system":
+        return {
+            "isConnected": True,
+            "mode": rnd.choice([2, 3]),
+            "mode_available": [1, 2, 3, 4, 5],
+            "speed_conf": 1,
+            "speed_values": [0, 1, 2],
+            "ws_connected": True,
+            "errors": [],
+        }
+    if device_type == "az_airqsensor":
+        return {
+            "name": "IAQ",
+            "aq_score": rnd.randint(0, 100),
+            "aq_co2": rnd.randint(400, 1500),
+            "aq_tvoc": rnd.randint(0, 500),
+            "aq_pressure": 1013,
+            "aqpm2_5": rnd.randint(0, 50),
+            "aqpm10": rnd.randint(0, 60),
+            "aq_quality": "good",
+            "needs_ventilation": False,
+        }
+    return {
+        "name": "Energy",
+        "energy_acc": rnd.uniform(0, 9999),
+        "energy_ret": rnd.uniform(0, 100),
+        "power_total": rnd.uniform(0, 5000),
+        "current_p1": rnd.uniform(0, 20),
+        "voltage_p1": 230,
+        "energy_period_end_dt": "2026-01-01T00:00:00Z",
+    }
+
+
+def make_account(devices: int, seed: int = 1) -> list[tuple[dict, dict]]:
+    rnd = random.Random(seed)
+    weighted = ["az_zone"] * 6 + ["az_system", "az_airqsensor", "az_energy_clamp"]
+    out: list[tuple[dict, dict]] = []
+    for idx in range(devices):
+        device_type = weighted[idx % len(weighted)]
+        entry = {
+            "installation_id": f"inst{idx // 50}",
+            "device_id": f"dev{idx:05d}",
+            "device_type": device_type,
+            "name": f"Device {idx}",
+            "ws_id": f"AA:BB:CC:00:{idx // 250:02X}:{idx % 250:02X}",
+            "system_number": 1 + (idx // 10) % 8,
+            "zone_number": 1 + idx % 10 if device_type == "az_zone" else None,
+        }
+        out.append((entry, make_status(device_type, rnd)))
+    return out
+
+
+def make_coordinator(account: list[tuple[dict, dict]]) -> AirzoneCloudCoordinator:
+    # Sin hass: solo se ejercitan los normalizadores puros.
+    coord = AirzoneCloudCoordinator.__new__(AirzoneCloudCoordinator)
+    coord._cloud_entry_ids = {}
+    coord._index_cloud_ids({entry["device_id"]: entry for entry, _status in account})
+    return coord
+
+
+def normalize_all(coord: AirzoneCloudCoordinator, account: list[tuple[dict, dict]]) -> int:
+    count = 0
+    for entry, status in account:
+        device_type = entry["device_type"]
+        if device_type in ZONE_DEVICE_TYPES:
+            coord._normalize_zone_status(entry, status)
+        elif device_type in SYSTEM_DEVICE_TYPES:
+            coord._normalize_system_status(entry, status)
+        elif device_type in IAQ_DEVICE_TYPES:
+            coord._normalize_iaq_status(entry, status)
+        elif device_type in ENERGY_DEVICE_TYPES:
+            coord._normalize_energy_meter_status(entry, status)
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de normalización Airzone Cloud")
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    account = make_account(args.devices)
+    coord = make_coordinator(account)
+    normalize_all(coord, account)  # calentamiento
+
+    best = float("inf")
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        normalize_all(coord, account)
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"devices={args.devices} rounds={args.rounds} "
+        f"best={best * 1000:.2f} ms/poll  throughput={args.devices / best:,.0f} devices/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
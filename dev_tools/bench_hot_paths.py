@@ -0,0 +1,202 @@
+# bench_hot_paths.py
+# Suite de micro-benchmarks de los caminos calientes del sondeo, sin hardware:
+#   - Local API: _extract_zone_list, _extract_iaq_list, _extract_system_list,
+#     _derive_systems_from_zones, _determine_zone_profile, _determine_system_profile
+#   - Cloud: _normalize_*_status (cuenta sintética de bench_cloud_normalize.py)
+# con cargas de 1, 10, 100 y 1000 zonas/dispositivos.
+#
+# Los resultados (mejor tiempo por elemento) se comparan con una línea base JSON
+# para que las regresiones sean visibles.
+#
+# Uso:
+#   python dev_tools/bench_hot_paths.py                    # medir y comparar con la base
+#   python dev_tools/bench_hot_paths.py --update-baseline  # regrabar dev_tools/bench_baseline.json
+#   python dev_tools/bench_hot_paths.py --sizes 1,10 --tolerance 0.5
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..")))
+sys.path.insert(0, HERE)
+
+from bench_cloud_normalize import make_account, make_coordinator, normalize_all  # noqa: E402
+from fake_airzone_stdlib import make_zone  # noqa: E402
+
+from custom_components.airzone_control.coordinator import AirzoneCoordinator  # noqa: E402
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+DEFAULT_BASELINE = os.path.join(HERE, "bench_baseline.json")
+ZONES_PER_SYSTEM = 32
+
+
+# ---------------- Cargas sintéticas (Local API) ----------------
+
+def make_hvac_payload(zones: int) -> dict:
+    """Formato por sistemas, como lo devuelve un broadcast systemid=127."""
+    systems: dict[int, list[dict]] = {}
+    for idx in range(zones):
+        sid = 1 + idx // ZONES_PER_SYSTEM
+        zone = make_zone(1 + idx % ZONES_PER_SYSTEM, sid, [1, 2, 3, 4, 5], f"Sistema {sid}")
+        zone["humidity"] = 40 + idx % 20
+        zone["system_firmware"] = "3.44"
+        zone["manufacturer"] = "Airzone"
+        systems.setdefault(sid, []).append(zone)
+    return {
+        "systems": [
+            {"systemID": sid, "system_firmware": "3.44", "mc_connected": 1, "data": data}
+            for sid, data in systems.items()
+        ]
+    }
+
+
+def make_iaq_payload(sensors: int) -> dict:
+    return {
+        "data": [
+            {
+                "systemID": 1 + idx // ZONES_PER_SYSTEM,
+                "airqsensorID": 1 + idx % ZONES_PER_SYSTEM,
+                "iaq_mode_vent": 1,
+                "iaq_score": 80,
+                "co2_value": 450 + idx,
+                "pm2_5_value": 5,
+                "pm10_value": 8,
+                "tvoc_value": 100,
+                "pressure_value": 1013,
+            }
+            for idx in range(sensors)
+        ]
+    }
+
+
+def make_local_coordinator(zones: list[dict]) -> AirzoneCoordinator:
+    # Sin hass: solo se ejercitan los métodos puros sobre self.data
+    coord = AirzoneCoordinator.__new__(AirzoneCoordinator)
+    coord.data = AirzoneCoordinator._map_zones(zones)
+    coord.iaqs = {}
+    coord.iaq_fallback = {}
+    return coord
+
+
+# ---------------- Casos ----------------
+
+def build_cases(size: int) -> dict[str, Callable[[], object]]:
+    hvac = make_hvac_payload(size)
+    iaq = make_iaq_payload(size)
+    zones = AirzoneCoordinator._extract_zone_list(hvac)
+    coord = make_local_coordinator(zones)
+    system_ids = sorted({sid for (sid, _zid) in coord.data})
+    account = make_account(size)
+    cloud = make_coordinator(account)
+
+    return {
+        "local.extract_zone_list": lambda: AirzoneCoordinator._extract_zone_list(hvac),
+        # _extract_iaq_list renombra airqsensorID en sitio: copia por llamada (se mide también)
+        "local.extract_iaq_list": lambda: AirzoneCoordinator._extract_iaq_list(
+            {"data": [dict(sensor) for sensor in iaq["data"]]}
+        ),
+        "local.extract_system_list": lambda: AirzoneCoordinator._extract_system_list(hvac),
+        "local.derive_systems_from_zones": lambda: AirzoneCoordinator._derive_systems_from_zones(zones),
+        "local.determine_zone_profile": lambda: [AirzoneCoordinator._determine_zone_profile(z) for z in zones],
+        "local.determine_system_profile": lambda: [coord._determine_system_profile(sid) for sid in system_ids],
+        "cloud.normalize_status": lambda: normalize_all(cloud, account),
+    }
+
+
+def measure(func: Callable[[], object], budget: float) -> tuple[float, int]:
+    """Best wall time of one call, repeating until `budget` seconds are spent."""
+    func()  # calentamiento
+    best = float("inf")
+    rounds = 0
+    deadline = time.perf_counter() + budget
+    # Como timeit: sin GC durante la medición para reducir el ruido
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while rounds < 5 or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+            rounds += 1
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best, rounds
+
+
+def run(sizes: list[int], budget: float) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    for size in sizes:
+        for name, func in build_cases(size).items():
+            best, rounds = measure(func, budget)
+            results[f"{name}[{size}]"] = {
+                "size": size,
+                "best_us": round(best * 1e6, 2),
+                "us_per_item": round(best * 1e6 / size, 3),
+                "rounds": rounds,
+            }
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            print(f"  {key:<45} {current['best_us']:>12.2f} us   (sin base)")
+            continue
+        ratio = current["best_us"] / previous["best_us"] if previous["best_us"] else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  <-- REGRESIÓN"
+            regressions.append(key)
+        print(f"  {key:<45} {current['best_us']:>12.2f} us   x{ratio:5.2f} vs base{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de Airzone Control")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--budget", type=float, default=1.0, help="Segundos de medición por caso")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Regresión permitida (0.25 = +25%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.budget)
+
+    if args.update_baseline:
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        for key, current in results.items():
+            print(f"  {key:<45} {current['best_us']:>12.2f} us")
+        print(f"Línea base escrita en {args.baseline}")
+        return
+
+    baseline: dict[str, dict] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle).get("results", {})
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regresiones por encima de +{args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
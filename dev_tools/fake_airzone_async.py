@@ -0,0 +1,493 @@
+# fake_airzone_async.py
+# Simulador asyncio (aiohttp) de la Airzone Local API, pensado como base de las
+# pruebas de rendimiento y resiliencia:
+#   - zonas con estado: los PUT /hvac y /iaq se guardan y se ven en el siguiente GET
+#   - varios sistemas y sensores IAQ por sistema
+#   - "personalidades" de firmware: qué prefijos, broadcasts y métodos responden
+#   - latencia y jitter configurables
+#   - inyección de errores 5xx y de timeouts (peticiones que se quedan colgadas)
+#   - PUT perdidos con cierta probabilidad (responden 200 pero no se aplican),
+#     como describen los comentarios del modo Hotel en button.py
+#   - http y, con --certfile/--keyfile, https en el puerto 3443
+#
+# ControllerModel no depende de aiohttp: handle(method, path, params, body)
+# devuelve (status, payload) y puede usarse sin red.
+#
+# Uso:
+#   python dev_tools/fake_airzone_async.py --systems 2 --zones 8 --iaqs 1 --personality lapi_178
+#   python dev_tools/fake_airzone_async.py --latency 80 --jitter 40 --error-rate 0.05 --drop-rate 0.1
+#   python dev_tools/fake_airzone_async.py --personality lapi_176 --no-http --certfile c.pem --keyfile k.pem
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import random
+import ssl
+import sys
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_airzone_stdlib import make_zone, parse_modes  # noqa: E402
+
+BROADCAST_IDS = (0, 127)
+
+# Qué acepta cada firmware. "hvac"/"iaq": pares (método, systemID) de broadcast
+# que responden; el resto de broadcasts devuelve 400. Las lecturas por sistema
+# concreto funcionan siempre. "format": "systems" agrupa la respuesta por sistema.
+PERSONALITIES: dict[str, dict[str, Any]] = {
+    "lapi_178": {
+        "prefixes": ("/api/v1",),
+        "hvac": {("GET", 127), ("POST", 127)},
+        "format": "systems",
+        "iaq": {("GET", 0), ("GET", 127), ("POST", 0), ("POST", 127)},
+        "iaq_endpoint": True,
+        "webserver_get": True,
+        "integration": True,
+        "version": "1.78",
+    },
+    "lapi_177": {
+        "prefixes": ("/api/v1",),
+        "hvac": {("POST", 0), ("POST", 127)},
+        "format": "flat",
+        "iaq": {("POST", 0)},
+        "iaq_endpoint": True,
+        "webserver_get": False,
+        "integration": False,
+        "version": "1.77",
+    },
+    "lapi_176": {
+        # Sin broadcast: obliga al fallback por systemID
+        "prefixes": ("/api/v1",),
+        "hvac": set(),
+        "format": "flat",
+        "iaq": set(),
+        "iaq_endpoint": True,
+        "webserver_get": False,
+        "integration": False,
+        "version": "1.76",
+    },
+    "alt_prefix": {
+        "prefixes": ("/airzone/local/api/v1",),
+        "hvac": {("GET", 0)},
+        "format": "flat",
+        "iaq": {("GET", 0)},
+        "iaq_endpoint": True,
+        "webserver_get": True,
+        "integration": False,
+        "version": "1.77",
+    },
+    "get127_only": {
+        "prefixes": ("/api/v1",),
+        "hvac": {("GET", 127)},
+        "format": "flat",
+        "iaq": {("GET", 127)},
+        "iaq_endpoint": True,
+        "webserver_get": True,
+        "integration": True,
+        "version": "1.78",
+    },
+    "post0_only": {
+        "prefixes": ("/api/v1",),
+        "hvac": {("POST", 0)},
+        "format": "flat",
+        "iaq": {("POST", 0)},
+        "iaq_endpoint": True,
+        "webserver_get": False,
+        "integration": False,
+        "version": "1.75",
+    },
+    "lapi_prefix": {
+        # Último prefijo candidato: la detección tiene que recorrerlos todos
+        "prefixes": ("/lapi/v1",),
+        "hvac": {("GET", 127)},
+        "format": "systems",
+        "iaq": {("GET", 0)},
+        "iaq_endpoint": True,
+        "webserver_get": True,
+        "integration": True,
+        "version": "1.78",
+    },
+    "no_iaq": {
+        # Firmware sin endpoint /iaq (404)
+        "prefixes": ("/api/v1",),
+        "hvac": {("GET", 127)},
+        "format": "flat",
+        "iaq": set(),
+        "iaq_endpoint": False,
+        "webserver_get": True,
+        "integration": False,
+        "version": "1.76",
+    },
+}
+DEFAULT_PERSONALITY = "lapi_178"
+
+# Campos que acepta PUT /hvac y PUT /iaq
+WRITABLE_ZONE_KEYS = {
+    "on", "mode", "setpoint", "heatsetpoint", "coolsetpoint", "speed", "sleep",
+    "name", "usermode", "slats_vertical", "slats_horizontal", "slats_vswing", "slats_hswing",
+}
+WRITABLE_IAQ_KEYS = {"iaq_mode_vent"}
+
+
+def make_iaq(iid: int, system_id: int) -> dict:
+    return {
+        "systemID": system_id,
+        "airqsensorID": iid,
+        "iaq_mode_vent": 1,
+        "iaq_score": 80,
+        "co2_value": 450,
+        "pm2_5_value": 5,
+        "pm10_value": 8,
+        "tvoc_value": 100,
+        "pressure_value": 1013,
+    }
+
+
+class ControllerModel:
+    """Estado de un webserver Airzone simulado y su comportamiento de red."""
+
+    def __init__(
+        self,
+        *,
+        name: str = "Airzone Async",
+        mac: str = "AA:BB:CC:DD:EE:10",
+        systems: int = 1,
+        zones: int = 4,
+        iaqs: int = 0,
+        modes: list[int] | None = None,
+        personality: str = DEFAULT_PERSONALITY,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        hang: float = 30.0,
+        drop_rate: float = 0.0,
+        drift: float = 0.0,
+        max_concurrent: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        if personality not in PERSONALITIES:
+            raise ValueError(f"Unknown personality {personality!r}")
+        self.name = name
+        self.mac = mac
+        self.personality = personality
+        self.behaviour = PERSONALITIES[personality]
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang = hang
+        self.drop_rate = drop_rate
+        self.drift = drift
+        # Peticiones en curso a partir de las cuales el webserver pierde PUTs (0 = sin límite)
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.rnd = random.Random(seed)
+        self.driver: str | None = None
+
+        modes = modes or [1, 2, 3, 4]
+        self.zones: dict[int, dict[int, dict]] = {
+            sid: {zid: make_zone(zid, sid, modes, f"{name} S{sid}") for zid in range(1, zones + 1)}
+            for sid in range(1, systems + 1)
+        }
+        self.iaqs: dict[int, dict[int, dict]] = {
+            sid: {iid: make_iaq(iid, sid) for iid in range(1, iaqs + 1)}
+            for sid in range(1, systems + 1)
+        }
+
+        # Contadores para los harness
+        self.requests = 0
+        self.errors_injected = 0
+        self.timeouts_injected = 0
+        self.puts_dropped = 0
+
+    # ---------------- Red (la aplica el servidor o el transporte) ----------------
+
+    def response_delay(self) -> float:
+        return self.latency + (self.rnd.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def pick_fault(self) -> str | None:
+        """None, "error" (503) o "timeout" (la petición se cuelga `hang` segundos)."""
+        roll = self.rnd.random()
+        if roll < self.timeout_rate:
+            self.timeouts_injected += 1
+            return "timeout"
+        if roll < self.timeout_rate + self.error_rate:
+            self.errors_injected += 1
+            return "error"
+        return None
+
+    # ---------------- API ----------------
+
+    def handle(self, method: str, path: str, params: dict | None = None, body: Any = None) -> tuple[int, Any]:
+        """Atiende una petición y devuelve (status HTTP, payload JSON)."""
+        self.requests += 1
+        method = method.upper()
+        params = {k.lower(): v for k, v in (params or {}).items()}
+        body = body if isinstance(body, dict) else {}
+
+        endpoint = self._strip_prefix(path)
+        if endpoint is None:
+            return 404, {"error": "not found"}
+
+        if endpoint == "/webserver":
+            if method == "GET" and not self.behaviour["webserver_get"]:
+                return 405, {"error": "method not allowed"}
+            return 200, {
+                "mac": self.mac,
+                "name": self.name,
+                "ws_type": "ws_az",
+                "ws_firmware": "3.44",
+                "interface": "eth",
+                "cloud_connected": "0",
+            }
+        if endpoint == "/version":
+            return 200, {"version": self.behaviour["version"]}
+        if endpoint == "/integration":
+            if not self.behaviour["integration"]:
+                return 404, {"error": "not found"}
+            if method == "PUT":
+                self.driver = str(body.get("driver") or "") or None
+            return 200, {"driver": self.driver}
+        if endpoint == "/hvac":
+            if method == "PUT":
+                return self._put(self.zones, body, "zoneID", WRITABLE_ZONE_KEYS)
+            args = params if method == "GET" else {k.lower(): v for k, v in body.items()}
+            return self._read_hvac(method, args)
+        if endpoint == "/iaq":
+            if not self.behaviour["iaq_endpoint"]:
+                return 404, {"error": "not found"}
+            if method == "PUT":
+                return self._put(self.iaqs, body, "iaqsensorID", WRITABLE_IAQ_KEYS, alias="airqsensorID")
+            args = params if method == "GET" else {k.lower(): v for k, v in body.items()}
+            return self._read_iaq(method, args)
+        return 404, {"error": "not found"}
+
+    def _strip_prefix(self, path: str) -> str | None:
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        for prefix in self.behaviour["prefixes"]:
+            if prefix and path.startswith(prefix + "/"):
+                return path[len(prefix):]
+            if not prefix:
+                return path
+        return None
+
+    def _read_hvac(self, method: str, args: dict) -> tuple[int, Any]:
+        sid = _int(args.get("systemid"), 1)
+        zid = _int(args.get("zoneid"), 0)
+        self._tick()
+
+        if sid in BROADCAST_IDS:
+            if (method, sid) not in self.behaviour["hvac"]:
+                return 400, {"errors": [{"systemid": "out of range"}]}
+            if self.behaviour["format"] == "systems":
+                return 200, {
+                    "systems": [
+                        {"systemID": s, "data": [copy.deepcopy(z) for z in zones.values()]}
+                        for s, zones in self.zones.items()
+                    ]
+                }
+            return 200, {"data": [copy.deepcopy(z) for zones in self.zones.values() for z in zones.values()]}
+
+        zones = self.zones.get(sid)
+        if zones is None:
+            return 400, {"errors": [{"systemid": "out of range"}]}
+        if zid:
+            zone = zones.get(zid)
+            if zone is None:
+                return 400, {"errors": [{"zoneid": "out of range"}]}
+            return 200, {"data": [copy.deepcopy(zone)]}
+        return 200, {"data": [copy.deepcopy(z) for z in zones.values()]}
+
+    def _read_iaq(self, method: str, args: dict) -> tuple[int, Any]:
+        sid = _int(args.get("systemid"), 1)
+        if sid in BROADCAST_IDS:
+            if (method, sid) not in self.behaviour["iaq"]:
+                return 400, {"errors": [{"systemid": "out of range"}]}
+            return 200, {"data": [copy.deepcopy(i) for iaqs in self.iaqs.values() for i in iaqs.values()]}
+        iaqs = self.iaqs.get(sid)
+        if iaqs is None:
+            return 400, {"errors": [{"systemid": "out of range"}]}
+        return 200, {"data": [copy.deepcopy(i) for i in iaqs.values()]}
+
+    def _put(
+        self,
+        table: dict[int, dict[int, dict]],
+        body: dict,
+        id_key: str,
+        writable: set[str],
+        alias: str | None = None,
+    ) -> tuple[int, Any]:
+        sid = _int(body.get("systemID"), 0)
+        item_id = _int(body.get(id_key, body.get(alias) if alias else None), 0)
+        changes = {k: v for k, v in body.items() if k not in ("systemID", id_key, alias)}
+        unknown = [k for k in changes if k not in writable]
+        if unknown:
+            return 400, {"errors": [{key: "not available"} for key in unknown]}
+
+        items = table.get(sid)
+        if items is None or (item_id and item_id not in items):
+            return 400, {"errors": [{id_key: "out of range"}]}
+        targets = list(items.values()) if item_id == 0 else [items[item_id]]
+
+        # El webserver confirma el PUT aunque a veces no lo aplique (o si va saturado)
+        overloaded = bool(self.max_concurrent) and self.in_flight > self.max_concurrent
+        if overloaded or (self.drop_rate and self.rnd.random() < self.drop_rate):
+            self.puts_dropped += 1
+        else:
+            for target in targets:
+                target.update(changes)
+        return 200, {"data": [{"systemID": sid, id_key: item_id, **changes}]}
+
+    def _tick(self) -> None:
+        """Pequeñas variaciones de temperatura/humedad entre lecturas (--drift)."""
+        if not self.drift:
+            return
+        for zones in self.zones.values():
+            for zone in zones.values():
+                if self.rnd.random() < self.drift:
+                    zone["roomTemp"] = round(zone["roomTemp"] + self.rnd.choice((-0.1, 0.1)), 1)
+
+
+def _int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+# ---------------- Servidor aiohttp ----------------
+
+def create_app(model: ControllerModel):
+    from aiohttp import web
+
+    async def handler(request: web.Request) -> web.Response:
+        body: Any = None
+        if request.can_read_body:
+            try:
+                body = json.loads(await request.text() or "null")
+            except ValueError:
+                body = None
+
+        model.in_flight += 1
+        try:
+            delay = model.response_delay()
+            fault = model.pick_fault()
+            if fault == "timeout":
+                await asyncio.sleep(model.hang)
+            elif delay:
+                await asyncio.sleep(delay)
+            if fault == "error":
+                return web.json_response({"error": "service unavailable"}, status=503)
+
+            status, payload = model.handle(request.method, request.path, dict(request.query), body)
+        finally:
+            model.in_flight -= 1
+        return web.json_response(payload, status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+async def start_server(
+    model: ControllerModel,
+    host: str = "127.0.0.1",
+    port: int | None = 3000,
+    *,
+    https_port: int | None = None,
+    ssl_context: ssl.SSLContext | None = None,
+):
+    """Arranca el simulador (http y/o https) y devuelve el AppRunner para pararlo."""
+    from aiohttp import web
+
+    runner = web.AppRunner(create_app(model), access_log=None)
+    await runner.setup()
+    if port is not None:
+        await web.TCPSite(runner, host, port).start()
+    if https_port is not None and ssl_context is not None:
+        await web.TCPSite(runner, host, https_port, ssl_context=ssl_context).start()
+    return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Airzone Local API (asyncio)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--https-port", type=int, default=3443)
+    parser.add_argument("--certfile", help="Certificado para https (sin él, solo http)")
+    parser.add_argument("--keyfile")
+    parser.add_argument("--no-http", action="store_true", help="Solo https, como algunos 1.78")
+    parser.add_argument("--mac", default="AA:BB:CC:DD:EE:10")
+    parser.add_argument("--name", default="Airzone Async")
+    parser.add_argument("--personality", choices=sorted(PERSONALITIES), default=DEFAULT_PERSONALITY)
+    parser.add_argument("--systems", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=4, help="Zonas por sistema")
+    parser.add_argument("--iaqs", type=int, default=0, help="Sensores IAQ por sistema")
+    parser.add_argument("--modes", default="1,2,3,4", help="Lista de modos numéricos, p.ej. '4,3,7'")
+    parser.add_argument("--latency", type=float, default=0.0, help="ms por respuesta")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms extra aleatorios por respuesta")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidad de 503")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Probabilidad de petición colgada")
+    parser.add_argument("--hang", type=float, default=30.0, help="Segundos que se cuelga una petición")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probabilidad de PUT perdido")
+    parser.add_argument("--drift", type=float, default=0.0, help="Probabilidad de cambio de roomTemp por lectura")
+    parser.add_argument("--max-concurrent", type=int, default=0, help="Peticiones simultáneas a partir de las cuales se pierden PUTs")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    model = ControllerModel(
+        name=args.name,
+        mac=args.mac,
+        systems=args.systems,
+        zones=args.zones,
+        iaqs=args.iaqs,
+        modes=parse_modes(args.modes),
+        personality=args.personality,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        hang=args.hang,
+        drop_rate=args.drop_rate,
+        drift=args.drift,
+        max_concurrent=args.max_concurrent,
+        seed=args.seed,
+    )
+
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+
+    async def run() -> None:
+        runner = await start_server(
+            model,
+            args.host,
+            None if args.no_http else args.port,
+            https_port=args.https_port,
+            ssl_context=ssl_context,
+        )
+        listening = [] if args.no_http else [f"http://{args.host}:{args.port}"]
+        if ssl_context is not None:
+            listening.append(f"https://{args.host}:{args.https_port}")
+        print(f"Fake Airzone async en {' '.join(listening)}  Personalidad={args.personality}  "
+              f"Sistemas={args.systems}  Zonas/sistema={args.zones}  IAQ/sistema={args.iaqs}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
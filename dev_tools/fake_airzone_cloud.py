@@ -0,0 +1,404 @@
+# fake_airzone_cloud.py
+# Simulador local de la API de Airzone Cloud para medir y probar el coordinador
+# Cloud sin cuenta real. Endpoints (relativos a /api/v1):
+#   POST /auth/login
+#   GET  /auth/refreshToken/{refreshToken}
+#   GET  /installations?items=&page=          (paginado)
+#   GET  /installations/{installation_id}
+#   GET  /devices/ws/{ws_id}/status
+#   GET  /devices/{device_id}/status
+#   GET  /websockets/connect                  (con --push, ver fake_airzone_cloud_ws.py)
+#   GET  /__stats                             (contadores del simulador)
+#
+# Genera una cuenta sintética con --devices dispositivos (dev00000, dev00001...)
+# repartidos en instalaciones de --per-installation, con todos los tipos que el
+# coordinador consulta (SUPPORTED_STATUS_DEVICE_TYPES).
+#
+# Además simula:
+#   - latencia/jitter por petición
+#   - caducidad del token (--token-ttl): 401 hasta que se renueve o se haga login
+#   - límite de peticiones por token (--rate/--burst): 429 con Retry-After
+#   - cambios de estado entre lecturas (--change-rate) para que la detección
+#     de cambios por huella tenga trabajo
+#   - caídas del servicio (FakeCloud.down = True): 503 en todo, para harness
+#
+# Uso:
+#   python dev_tools/fake_airzone_cloud.py --port 8443 --devices 2000 --latency 60 --token-ttl 300 --rate 20
+#   (entrada Cloud con data["cloud_base_url"] = "http://127.0.0.1:8443/api/v1",
+#    usuario cualquiera y contraseña --password)
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import sys
+import time
+from typing import Any
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_airzone_cloud_ws import CONNECT_PATH, make_connect_handler  # noqa: E402
+
+API_PREFIX = "/api/v1"
+
+# Reparto de tipos; cubre SUPPORTED_STATUS_DEVICE_TYPES de coordinator_cloud.py
+DEVICE_MIX = (
+    ["az_zone"] * 6
+    + ["az_system", "az_airqsensor", "az_energy_clamp", "aidoo", "aidoo_it"]
+    + ["az_acs", "aidoo_acs", "az_vmc", "az_relay", "az_dehumidifier"]
+)
+
+
+# ---------------- Cuenta sintética ----------------
+
+def _temp(value: float) -> dict:
+    return {"celsius": round(value, 1), "fah": round(value * 9 / 5 + 32)}
+
+
+def make_status(device_type: str, rnd: random.Random) -> dict:
+    if device_type in ("az_zone", "aidoo", "aidoo_it"):
+        return {
+            "name": f"Zona {rnd.randint(1, 99)}",
+            "power": rnd.choice([True, False]),
+            "mode": rnd.choice([1, 2, 3, 4, 5]),
+            "mode_available": [1, 2, 3, 4, 5],
+            "local_temp": _temp(rnd.uniform(17, 27)),
+            "zone_work_temp": _temp(21.5),
+            "setpoint_air_heat": _temp(21),
+            "setpoint_air_cool": _temp(25),
+            "setpoint_air_auto": _temp(23),
+            "range_sp_hot_air_min": _temp(15),
+            "range_sp_hot_air_max": _temp(30),
+            "range_sp_cool_air_min": _temp(18),
+            "range_sp_cool_air_max": _temp(30),
+            "speed_conf": rnd.randint(0, 3),
+            "speed_values": [0, 1, 2, 3],
+            "sleep": 0,
+            "sleep_values": [0, 30, 60, 90],
+            "humidity": rnd.randint(30, 60),
+            "double_sp": False,
+            "ws_connected": True,
+            "isConnected": True,
+            "usermode_conf": 0,
+            "usermode_values": [0, 1, 2],
+            "aq_quality": 1,
+        }
+    if device_type == "az_system":
+        return {
+            "isConnected": True,
+            "mode": rnd.choice([2, 3]),
+            "mode_available": [1, 2, 3, 4, 5],
+            "speed_conf": 1,
+            "speed_values": [0, 1, 2],
+            "ws_connected": True,
+            "errors": [],
+        }
+    if device_type == "az_airqsensor":
+        return {
+            "name": "IAQ",
+            "aq_score": rnd.randint(0, 100),
+            "aq_co2": rnd.randint(400, 1500),
+            "aq_tvoc": rnd.randint(0, 500),
+            "aq_pressure": 1013,
+            "aqpm2_5": rnd.randint(0, 50),
+            "aqpm10": rnd.randint(0, 60),
+            "aq_quality": "good",
+            "needs_ventilation": False,
+        }
+    if device_type == "az_energy_clamp":
+        return {
+            "name": "Energy",
+            "energy_acc": rnd.uniform(0, 9999),
+            "energy_ret": rnd.uniform(0, 100),
+            "power_total": rnd.uniform(0, 5000),
+            "current_p1": rnd.uniform(0, 20),
+            "voltage_p1": 230,
+            "energy_period_end_dt": "2026-01-01T00:00:00Z",
+        }
+    if device_type in ("az_acs", "aidoo_acs"):
+        return {
+            "name": "ACS",
+            "power": rnd.choice([True, False]),
+            "tank_temp": _temp(rnd.uniform(40, 55)),
+            "setpoint": _temp(50),
+            "powerful_mode": False,
+            "isConnected": True,
+        }
+    return {
+        "name": device_type.replace("az_", "").upper(),
+        "power": rnd.choice([True, False]),
+        "isConnected": True,
+    }
+
+
+def make_cloud_account(devices: int, per_installation: int = 50, seed: int = 1) -> dict[str, Any]:
+    """Instalaciones, inventario y estados con los IDs de bench_cloud_normalize.py."""
+    rnd = random.Random(seed)
+    installations: dict[str, dict] = {}
+    statuses: dict[str, dict] = {}
+    ws_statuses: dict[str, dict] = {}
+    for idx in range(devices):
+        installation_id = f"inst{idx // per_installation}"
+        device_id = f"dev{idx:05d}"
+        device_type = DEVICE_MIX[idx % len(DEVICE_MIX)]
+        # Un webserver por instalación
+        ws_id = f"AA:BB:CC:00:{(idx // per_installation) // 256:02X}:{(idx // per_installation) % 256:02X}"
+
+        installation = installations.get(installation_id)
+        if installation is None:
+            installation = installations[installation_id] = {
+                "installation_id": installation_id,
+                "name": f"Installation {idx // per_installation}",
+                "ws_ids": [ws_id],
+                "groups": [],
+            }
+            ws_statuses[ws_id] = {
+                "ws_type": "ws_az",
+                "config": {
+                    "ws_fw": "3.44",
+                    "api_version": "1.78",
+                    "mac": ws_id,
+                    "stat_channel": 6,
+                    "conn_type": "wifi",
+                    "lmachine_fw": "3.21",
+                },
+                "status": {"isConnected": True, "stat_quality": 4, "stat_rssi": -55},
+            }
+
+        system_number = 1 + (idx // 10) % 8
+        group_id = f"{installation_id}-g{system_number}"
+        group = next((g for g in installation["groups"] if g["group_id"] == group_id), None)
+        if group is None:
+            group = {"group_id": group_id, "name": f"Group {system_number}", "devices": []}
+            installation["groups"].append(group)
+
+        meta: dict[str, Any] = {"system_number": system_number}
+        if device_type in ("az_zone", "aidoo", "aidoo_it"):
+            meta["zone_number"] = 1 + idx % 10
+        elif device_type == "az_airqsensor":
+            meta["iaqsensor_id"] = 1 + idx % 10
+        group["devices"].append(
+            {"device_id": device_id, "type": device_type, "name": f"Device {idx}", "ws_id": ws_id, "meta": meta}
+        )
+        statuses[device_id] = make_status(device_type, rnd)
+
+    return {"installations": installations, "statuses": statuses, "ws_statuses": ws_statuses}
+
+
+# ---------------- Servidor ----------------
+
+class FakeCloud:
+    """Estado del simulador: cuenta, tokens, límites y contadores."""
+
+    def __init__(
+        self,
+        account: dict[str, Any],
+        *,
+        password: str = "secret",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        token_ttl: float = 0.0,
+        rate: float = 0.0,
+        burst: int = 0,
+        change_rate: float = 0.0,
+        seed: int = 1,
+    ) -> None:
+        self.account = account
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.token_ttl = token_ttl
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.change_rate = change_rate
+        self.rnd = random.Random(seed)
+        # token -> caducidad (monotonic, 0 = no caduca) y refreshTokens válidos
+        self.tokens: dict[str, float] = {}
+        self.refresh_tokens: set[str] = set()
+        # token -> (fichas, último relleno)
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.stats: dict[str, int] = {"requests": 0, "logins": 0, "refreshes": 0, "401": 0, "429": 0, "503": 0}
+        self.per_endpoint: dict[str, int] = {}
+        # Caída simulada del servicio: todo responde 503 mientras sea True
+        self.down = False
+
+    def issue_token(self) -> dict[str, Any]:
+        token = secrets.token_hex(16)
+        refresh = secrets.token_hex(16)
+        self.tokens[token] = time.monotonic() + self.token_ttl if self.token_ttl else 0.0
+        self.refresh_tokens.add(refresh)
+        return {"_id": "fakeuser", "token": token, "refreshToken": refresh}
+
+    def token_error(self, request: web.Request) -> web.Response | None:
+        auth = request.headers.get("Authorization", "")
+        token = auth[len("Bearer "):] if auth.startswith("Bearer ") else ""
+        expires = self.tokens.get(token)
+        if expires is None or (expires and time.monotonic() >= expires):
+            self.tokens.pop(token, None)
+            self.stats["401"] += 1
+            return web.json_response({"_id": "expiredToken", "msg": "Token expired"}, status=401)
+        if self.rate and not self._take(token):
+            self.stats["429"] += 1
+            return web.json_response(
+                {"_id": "tooManyRequests", "msg": "Too many requests"},
+                status=429,
+                headers={"Retry-After": str(max(1, round(1 / self.rate)))},
+            )
+        return None
+
+    def _take(self, token: str) -> bool:
+        now = time.monotonic()
+        tokens, last = self.buckets.get(token, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self.buckets[token] = (tokens, now)
+            return False
+        self.buckets[token] = (tokens - 1, now)
+        return True
+
+    def device_status(self, device_id: str) -> dict | None:
+        status = self.account["statuses"].get(device_id)
+        if status is not None and "local_temp" in status and self.rnd.random() < self.change_rate:
+            status["local_temp"] = _temp(status["local_temp"]["celsius"] + self.rnd.choice((-0.1, 0.1)))
+        return status
+
+
+def create_app(cloud: FakeCloud, *, push_interval: float | None = None) -> web.Application:
+    installations = cloud.account["installations"]
+
+    @web.middleware
+    async def simulate(request: web.Request, handler):
+        cloud.stats["requests"] += 1
+        label = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        cloud.per_endpoint[label] = cloud.per_endpoint.get(label, 0) + 1
+        delay = cloud.latency + (cloud.rnd.uniform(0, cloud.jitter) if cloud.jitter else 0.0)
+        if delay and not request.path.startswith("/__"):
+            await asyncio.sleep(delay)
+        if cloud.down and not request.path.startswith("/__"):
+            cloud.stats["503"] += 1
+            return web.json_response({"_id": "serviceUnavailable", "msg": "Service unavailable"}, status=503)
+        return await handler(request)
+
+    async def login(request: web.Request) -> web.Response:
+        try:
+            body = await request.json()
+        except ValueError:
+            body = {}
+        if not body.get("email") or not body.get("password"):
+            return web.json_response({"_id": "badParams", "msg": "Missing credentials"}, status=400)
+        if body.get("password") != cloud.password:
+            return web.json_response({"_id": "userNotExist", "msg": "Invalid credentials"}, status=401)
+        cloud.stats["logins"] += 1
+        return web.json_response(cloud.issue_token())
+
+    async def refresh(request: web.Request) -> web.Response:
+        refresh_token = request.match_info["refresh"]
+        if refresh_token not in cloud.refresh_tokens:
+            return web.json_response({"_id": "invalidRefreshToken", "msg": "Invalid refresh token"}, status=401)
+        cloud.refresh_tokens.discard(refresh_token)
+        cloud.stats["refreshes"] += 1
+        return web.json_response(cloud.issue_token())
+
+    async def list_installations(request: web.Request) -> web.Response:
+        if (error := cloud.token_error(request)) is not None:
+            return error
+        try:
+            items = max(1, int(request.query.get("items", 10)))
+            page = max(0, int(request.query.get("page", 0)))
+        except ValueError:
+            return web.json_response({"_id": "badParams", "msg": "Bad pagination"}, status=400)
+        ordered = list(installations.values())
+        chunk = ordered[page * items:(page + 1) * items]
+        return web.json_response(
+            {
+                "installations": [
+                    {"installation_id": i["installation_id"], "name": i["name"], "ws_ids": i["ws_ids"]}
+                    for i in chunk
+                ],
+                "total": len(ordered),
+            }
+        )
+
+    async def installation_detail(request: web.Request) -> web.Response:
+        if (error := cloud.token_error(request)) is not None:
+            return error
+        installation = installations.get(request.match_info["installation_id"])
+        if installation is None:
+            return web.json_response({"_id": "notFound", "msg": "Installation not found"}, status=404)
+        return web.json_response(installation)
+
+    async def webserver_status(request: web.Request) -> web.Response:
+        if (error := cloud.token_error(request)) is not None:
+            return error
+        status = cloud.account["ws_statuses"].get(request.match_info["ws_id"])
+        if status is None:
+            return web.json_response({"_id": "notFound", "msg": "Webserver not found"}, status=404)
+        return web.json_response(status)
+
+    async def device_status(request: web.Request) -> web.Response:
+        if (error := cloud.token_error(request)) is not None:
+            return error
+        status = cloud.device_status(request.match_info["device_id"])
+        if status is None:
+            return web.json_response({"_id": "notFound", "msg": "Device not found"}, status=404)
+        return web.json_response(status)
+
+    async def stats(_request: web.Request) -> web.Response:
+        return web.json_response({**cloud.stats, "endpoints": cloud.per_endpoint})
+
+    app = web.Application(middlewares=[simulate])
+    app.router.add_post(f"{API_PREFIX}/auth/login", login)
+    app.router.add_get(f"{API_PREFIX}/auth/refreshToken/{{refresh}}", refresh)
+    app.router.add_get(f"{API_PREFIX}/installations", list_installations)
+    app.router.add_get(f"{API_PREFIX}/installations/{{installation_id}}", installation_detail)
+    app.router.add_get(f"{API_PREFIX}/devices/ws/{{ws_id}}/status", webserver_status)
+    app.router.add_get(f"{API_PREFIX}/devices/{{device_id}}/status", device_status)
+    app.router.add_get("/__stats", stats)
+    if push_interval:
+        app.router.add_get(CONNECT_PATH, make_connect_handler(len(cloud.account["statuses"]), push_interval))
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Airzone Cloud API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--per-installation", type=int, default=50, help="Dispositivos por instalación")
+    parser.add_argument("--password", default="secret")
+    parser.add_argument("--latency", type=float, default=0.0, help="ms por petición")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms extra aleatorios por petición")
+    parser.add_argument("--token-ttl", type=float, default=0.0, help="Segundos de vida del token (0 = no caduca)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Peticiones/s por token (0 = sin límite)")
+    parser.add_argument("--burst", type=int, default=0, help="Ráfaga permitida por token (por defecto = rate)")
+    parser.add_argument("--change-rate", type=float, default=0.1, help="Probabilidad de cambio por lectura de estado")
+    parser.add_argument("--push", type=float, default=0.0, help="Segundos entre cambios realtime (0 = sin websocket)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    cloud = FakeCloud(
+        make_cloud_account(args.devices, args.per_installation, args.seed),
+        password=args.password,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        token_ttl=args.token_ttl,
+        rate=args.rate,
+        burst=args.burst,
+        change_rate=args.change_rate,
+        seed=args.seed,
+    )
+    print(f"Fake Airzone Cloud en http://{args.host}:{args.port}{API_PREFIX}  "
+          f"Dispositivos={args.devices}  Instalaciones={len(cloud.account['installations'])}  "
+          f"TTL token={args.token_ttl or '-'}s  Límite={args.rate or '-'}/s")
+    web.run_app(create_app(cloud, push_interval=args.push or None), host=args.host, port=args.port, print=None)
+    print(json.dumps(cloud.stats))
+
+
+if __name__ == "__main__":
+    main()
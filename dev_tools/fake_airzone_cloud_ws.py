@@ -0,0 +1,104 @@
+# fake_airzone_cloud_ws.py
+# Simulador del canal realtime de Airzone Cloud (Socket.IO sobre websocket).
+# Endpoint: /api/v1/websockets/connect
+#
+# Tras "listen_installation" emite cada --interval segundos un cambio de estado
+# aleatorio de uno de los --devices dispositivos (dev00000, dev00001, ...), con
+# el mismo esquema de IDs que dev_tools/bench_cloud_normalize.py.
+#
+# Uso:
+#   python dev_tools/fake_airzone_cloud_ws.py --port 8765 --devices 50 --interval 2
+#   (entrada Cloud con data["cloud_push_url"] = "ws://127.0.0.1:8765/api/v1/websockets/connect")
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+
+from aiohttp import WSMsgType, web
+
+PING_INTERVAL = 25
+CONNECT_PATH = "/api/v1/websockets/connect"
+
+
+def make_change(rnd: random.Random, devices: int) -> dict:
+    idx = rnd.randrange(devices)
+    status: dict = {}
+    field = rnd.choice(["power", "local_temp", "setpoint_air_heat", "humidity"])
+    if field == "power":
+        status["power"] = rnd.choice([True, False])
+    elif field == "humidity":
+        status["humidity"] = rnd.randint(30, 60)
+    else:
+        status[field] = {"celsius": round(rnd.uniform(17, 27), 1)}
+    return {"device_id": f"dev{idx:05d}", "change": {"status": status}}
+
+
+def make_connect_handler(devices: int = 50, interval: float = 2.0, seed: int = 1):
+    """Handler del endpoint realtime; lo reutiliza fake_airzone_cloud.py."""
+    rnd = random.Random(seed)
+
+    async def connect(request: web.Request) -> web.WebSocketResponse:
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            raise web.HTTPUnauthorized()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_str("0" + json.dumps({"sid": "fake", "pingInterval": PING_INTERVAL * 1000}))
+
+        listening: set[str] = set()
+
+        async def emitter() -> None:
+            while not ws.closed:
+                await asyncio.sleep(interval)
+                if listening:
+                    await ws.send_str("42" + json.dumps(["DEVICES_UPDATES", make_change(rnd, devices)]))
+
+        async def pinger() -> None:
+            while not ws.closed:
+                await asyncio.sleep(PING_INTERVAL)
+                await ws.send_str("2")
+
+        tasks = [asyncio.create_task(emitter()), asyncio.create_task(pinger())]
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                if msg.data == "40":
+                    await ws.send_str("40")
+                elif msg.data.startswith("42"):
+                    event = json.loads(msg.data[2:])
+                    if event and event[0] == "listen_installation":
+                        listening.add(str(event[1]))
+                        print(f"listen_installation {event[1]}")
+        finally:
+            for task in tasks:
+                task.cancel()
+        return ws
+
+    return connect
+
+
+def create_app(devices: int = 50, interval: float = 2.0, seed: int = 1) -> web.Application:
+    app = web.Application()
+    app.router.add_get(CONNECT_PATH, make_connect_handler(devices, interval, seed))
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Airzone Cloud realtime websocket")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=2.0, help="Segundos entre cambios emitidos")
+    args = parser.parse_args()
+
+    print(f"Fake Airzone Cloud WS en ws://{args.host}:{args.port}/api/v1/websockets/connect  "
+          f"Dispositivos={args.devices}  Intervalo={args.interval}s")
+    web.run_app(create_app(args.devices, args.interval), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,13 @@
 # Endpoints: /api/v1/webserver, /api/v1/version, /api/v1/hvac (GET/POST/PUT)
 
 from __future__ import annotations
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
 import json
 import argparse
+import random
 import re
+import time
 
 CONFIG = {
     "mac": "AA:BB:CC:DD:EE:01",
@@ -16,6 +18,9 @@ CONFIG = {
     "modes": [1, 2, 3, 4],  # modos de ejemplo
     "host": "0.0.0.0",
     "port": 3000,
+    "latency": 0.0,  # segundos añadidos a cada respuesta
+    "jitter": 0.0,   # segundos extra aleatorios (0..jitter)
+    "quiet": False,
 }
 
 def make_zone(zid: int, system_id: int, modes: list[int], base_name: str) -> dict:
@@ -57,11 +62,21 @@ def parse_modes(modes_str: str) -> list[int]:
 class Handler(BaseHTTPRequestHandler):
     server_version = "FakeAirzone/1.0"
 
+    @property
+    def config(self) -> dict:
+        # Config propia del servidor (serve()) o la global (main())
+        return getattr(self.server, "config", CONFIG)
+
     def log_message(self, fmt, *args):
+        if self.config.get("quiet"):
+            return
         # imprime menos ruido en consola
         print("[%s] %s" % (self.address_string(), fmt % args))
 
     def _send_json(self, obj: dict, code: int = 200):
+        delay = self.config.get("latency", 0.0) + random.uniform(0, self.config.get("jitter", 0.0))
+        if delay > 0:
+            time.sleep(delay)
         data = json.dumps(obj).encode("utf-8")
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
@@ -80,8 +95,8 @@ class Handler(BaseHTTPRequestHandler):
 
         if path == "/api/v1/webserver":
             payload = {
-                "mac": CONFIG["mac"],
-                "name": CONFIG["name"],
+                "mac": self.config["mac"],
+                "name": self.config["name"],
                 "ws_type": "ws_az",
                 "ws_firmware": "3.44",
                 "interface": "eth",
@@ -98,11 +113,11 @@ class Handler(BaseHTTPRequestHandler):
             zoneid = int(qs.get("zoneid", ["0"])[0])
 
             if zoneid == 0:  # broadcast zonas
-                data = [make_zone(z, 1, CONFIG["modes"], CONFIG["name"]) for z in range(1, CONFIG["zones"] + 1)]
+                data = [make_zone(z, 1, self.config["modes"], self.config["name"]) for z in range(1, self.config["zones"] + 1)]
                 return self._send_json({"data": data})
 
             # zona concreta
-            return self._send_json({"data": [make_zone(zoneid, systemid, CONFIG["modes"], CONFIG["name"])]})
+            return self._send_json({"data": [make_zone(zoneid, systemid, self.config["modes"], self.config["name"])]})
 
         return self._not_found()
 
@@ -128,10 +143,10 @@ class Handler(BaseHTTPRequestHandler):
             zoneid = int(body.get("zoneID", 0))
 
             if zoneid == 0:
-                data = [make_zone(z, 1, CONFIG["modes"], CONFIG["name"]) for z in range(1, CONFIG["zones"] + 1)]
+                data = [make_zone(z, 1, self.config["modes"], self.config["name"]) for z in range(1, self.config["zones"] + 1)]
                 return self._send_json({"data": data})
 
-            return self._send_json({"data": [make_zone(zoneid, systemid, CONFIG["modes"], CONFIG["name"])]})
+            return self._send_json({"data": [make_zone(zoneid, systemid, self.config["modes"], self.config["name"])]})
 
         if parsed.path == "/api/v1/version":
             return self._send_json({"schema": "1.77"})
@@ -149,6 +164,13 @@ class Handler(BaseHTTPRequestHandler):
         changed = {k: v for k, v in body.items() if k not in ("systemID", "zoneID")}
         return self._send_json({"data": {"systemID": systemid, "zoneID": zoneid, **changed}})
 
+def serve(config: dict, host: str = "127.0.0.1", port: int = 0) -> HTTPServer:
+    """Crea un servidor con su propia config (port=0: puerto libre). Llamar a serve_forever()."""
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    httpd.config = {**CONFIG, **config, "host": host, "port": httpd.server_address[1]}
+    return httpd
+
 def main():
     parser = argparse.ArgumentParser(description="Fake Airzone Local API (stdlib only)")
     parser.add_argument("--host", default="0.0.0.0")
@@ -157,6 +179,8 @@ def main():
     parser.add_argument("--name", default=CONFIG["name"])
     parser.add_argument("--zones", type=int, default=CONFIG["zones"])
     parser.add_argument("--modes", default="1,2,3,4", help="Lista de modos numéricos, p.ej. '4,3,7'")
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos de retardo por respuesta")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Segundos extra aleatorios por respuesta")
     args = parser.parse_args()
 
     CONFIG.update({
@@ -166,6 +190,8 @@ def main():
         "name": args.name,
         "zones": args.zones,
         "modes": parse_modes(args.modes),
+        "latency": args.latency,
+        "jitter": args.jitter,
     })
 
     httpd = HTTPServer((CONFIG["host"], CONFIG["port"]), Handler)
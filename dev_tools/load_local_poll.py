@@ -0,0 +1,248 @@
+# load_local_poll.py
+# Harness de carga extremo a extremo: arranca N webservers simulados de la
+# Local API (fake_airzone_stdlib.py, cada uno en su hilo y puerto) y hace
+# sondear a N AirzoneCoordinator reales dentro de una instancia mínima de
+# Home Assistant, ciclo tras ciclo.
+#
+# Informa de:
+#   - latencia del sondeo (p50/p95/p99/max) por ciclo de coordinador
+#   - peticiones por sondeo
+#   - tiempo de CPU del hilo del event loop por ciclo
+#   - retardo del event loop (lag) medido por una tarea centinela
+#
+# Necesita homeassistant instalado (entorno de desarrollo de la integración);
+# no hace falta hardware.
+#
+# Uso:
+#   python dev_tools/load_local_poll.py --servers 10 --zones 8 --latency 40 --cycles 50
+#   python dev_tools/load_local_poll.py --servers 3 --latency 20,80,300 --jitter 30 --json out.json
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..")))
+sys.path.insert(0, HERE)
+
+from fake_airzone_stdlib import serve  # noqa: E402
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.airzone_control.coordinator import AirzoneCoordinator  # noqa: E402
+
+LAG_PROBE_INTERVAL = 0.05
+
+
+def percentile(samples: list[float], pct: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    # nearest-rank, igual que telemetry.py
+    rank = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered)))) - 1
+    return ordered[rank]
+
+
+def summarize(samples: list[float], scale: float = 1000.0) -> dict:
+    def fmt(value: float | None) -> float | None:
+        return None if value is None else round(value * scale, 2)
+
+    return {
+        "samples": len(samples),
+        "p50": fmt(percentile(samples, 50)),
+        "p95": fmt(percentile(samples, 95)),
+        "p99": fmt(percentile(samples, 99)),
+        "max": fmt(max(samples) if samples else None),
+    }
+
+
+def parse_list(value: str, count: int) -> list[float]:
+    """'40' -> [40]*count; '20,80' -> [20, 80, 20, 80...] (un valor por servidor)."""
+    items = [float(v) for v in value.split(",") if v.strip()] or [0.0]
+    return [items[idx % len(items)] for idx in range(count)]
+
+
+# ---------------- Servidores simulados ----------------
+
+def start_servers(count: int, zones: int, latencies_ms: list[float], jitter_ms: float) -> list:
+    servers = []
+    for idx in range(count):
+        httpd = serve(
+            {
+                "mac": f"AA:BB:CC:DD:{idx // 256:02X}:{idx % 256:02X}",
+                "name": f"Airzone Load {idx + 1}",
+                "zones": zones,
+                "latency": latencies_ms[idx] / 1000,
+                "jitter": jitter_ms / 1000,
+                "quiet": True,
+            }
+        )
+        threading.Thread(target=httpd.serve_forever, name=f"fake-airzone-{idx}", daemon=True).start()
+        servers.append(httpd)
+    return servers
+
+
+# ---------------- Instancia mínima de HA ----------------
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Versiones antiguas de HA: constructor sin argumentos
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    return hass
+
+
+class LoopLagProbe:
+    """Mide cuánto se retrasa un sleep fijo: retardo del event loop."""
+
+    def __init__(self, interval: float = LAG_PROBE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+# ---------------- Carga ----------------
+
+async def run_load(args: argparse.Namespace) -> dict:
+    latencies_ms = parse_list(args.latency, args.servers)
+    servers = start_servers(args.servers, args.zones, latencies_ms, args.jitter)
+
+    with tempfile.TemporaryDirectory(prefix="airzone_load_") as config_dir:
+        hass = await create_hass(config_dir)
+        coordinators = [
+            AirzoneCoordinator(
+                hass,
+                host="127.0.0.1",
+                port=httpd.server_address[1],
+                scan_interval=args.interval,
+                api_prefix="/api/v1",
+            )
+            for httpd in servers
+        ]
+
+        poll_latency: list[float] = []
+        requests_per_poll: list[float] = []
+        cpu_per_cycle: list[float] = []
+        failures = 0
+        probe = LoopLagProbe()
+
+        try:
+            # Ciclo de calentamiento (sesiones, driver /integration...), fuera de la medición
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+            probe.start()
+            wall_started = time.perf_counter()
+            for _cycle in range(args.cycles):
+                cpu_started = time.thread_time()
+                await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+                # CPU del hilo del loop (los servidores simulados viven en otros hilos)
+                cpu_per_cycle.append((time.thread_time() - cpu_started) / len(coordinators))
+                for coordinator in coordinators:
+                    telemetry = coordinator.telemetry
+                    if not coordinator.last_update_success:
+                        failures += 1
+                    if telemetry.last_poll_duration is not None:
+                        poll_latency.append(telemetry.last_poll_duration)
+                    if telemetry.last_poll_requests is not None:
+                        requests_per_poll.append(telemetry.last_poll_requests)
+                if args.pause:
+                    await asyncio.sleep(args.pause)
+            wall = time.perf_counter() - wall_started
+        finally:
+            await probe.stop()
+            for coordinator in coordinators:
+                await coordinator.async_close()
+            await hass.async_stop(force=True)
+            for httpd in servers:
+                httpd.shutdown()
+                httpd.server_close()
+
+    return {
+        "servers": args.servers,
+        "zones_per_server": args.zones,
+        "latency_ms": latencies_ms,
+        "jitter_ms": args.jitter,
+        "cycles": args.cycles,
+        "polls": len(poll_latency),
+        "failed_polls": failures,
+        "wall_s": round(wall, 3),
+        "poll_latency_ms": summarize(poll_latency),
+        "requests_per_poll": {
+            "avg": round(sum(requests_per_poll) / len(requests_per_poll), 2) if requests_per_poll else None,
+            "max": max(requests_per_poll) if requests_per_poll else None,
+        },
+        "cpu_per_poll_ms": summarize(cpu_per_cycle),
+        "loop_lag_ms": summarize(probe.samples),
+        "endpoints": {
+            f"{idx + 1}": coordinator.telemetry.as_dict()["endpoints"]
+            for idx, coordinator in enumerate(coordinators[: args.detail])
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    def line(label: str, stats: dict) -> str:
+        return (f"  {label:<22} p50={stats['p50']}  p95={stats['p95']}  "
+                f"p99={stats['p99']}  max={stats['max']}  (n={stats['samples']})")
+
+    print(f"Servidores={report['servers']}  Zonas/servidor={report['zones_per_server']}  "
+          f"Ciclos={report['cycles']}  Sondeos={report['polls']}  Fallidos={report['failed_polls']}  "
+          f"Duración={report['wall_s']}s")
+    print(line("latencia sondeo (ms)", report["poll_latency_ms"]))
+    print(line("CPU por sondeo (ms)", report["cpu_per_poll_ms"]))
+    print(line("lag event loop (ms)", report["loop_lag_ms"]))
+    rpp = report["requests_per_poll"]
+    print(f"  {'peticiones/sondeo':<22} media={rpp['avg']}  max={rpp['max']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Harness de carga de sondeo Local API de Airzone Control")
+    parser.add_argument("--servers", type=int, default=5, help="Webservers simulados (uno por coordinador)")
+    parser.add_argument("--zones", type=int, default=8, help="Zonas por webserver")
+    parser.add_argument("--latency", default="20", help="ms por respuesta; lista separada por comas = por servidor")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms extra aleatorios por respuesta")
+    parser.add_argument("--cycles", type=int, default=30)
+    parser.add_argument("--interval", type=int, default=10, help="scan_interval de los coordinadores (s)")
+    parser.add_argument("--pause", type=float, default=0.0, help="Segundos de pausa entre ciclos")
+    parser.add_argument("--detail", type=int, default=1, help="Coordinadores con desglose por endpoint")
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+        print(f"Informe guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# replay_cassette.py
+# Reproduce un cassette grabado con el servicio airzone_control.record contra un
+# AirzoneCoordinator / AirzoneCloudCoordinator real, dentro de una instancia
+# mínima de Home Assistant, a la velocidad original o acelerada.
+#
+# Sirve para convertir trazas de firmwares raros en pruebas deterministas de
+# rendimiento y regresión: el informe resume las peticiones por ciclo, la
+# duración de cada ciclo y lo que el coordinador ha extraído (zonas, sistemas,
+# IAQ), y lista las peticiones que el cassette no sabía responder.
+#
+# Uso:
+#   python dev_tools/replay_cassette.py airzone_control_cassette_XXXX.jsonl.gz
+#   python dev_tools/replay_cassette.py cassette.jsonl.gz --speed 10 --cycles 20
+#   python dev_tools/replay_cassette.py cassette.jsonl.gz --speed 0 --json out.json   # sin esperas
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..")))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.airzone_control.cassette import ReplaySession, load_cassette  # noqa: E402
+from custom_components.airzone_control.cloud_hub import AirzoneCloudHub  # noqa: E402
+from custom_components.airzone_control.const import CONNECTION_TYPE_CLOUD  # noqa: E402
+from custom_components.airzone_control.coordinator import AirzoneCoordinator  # noqa: E402
+from custom_components.airzone_control.coordinator_cloud import AirzoneCloudCoordinator  # noqa: E402
+from custom_components.airzone_control.transport import AiohttpTransport  # noqa: E402
+
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Versiones antiguas de HA: constructor sin argumentos
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    return hass
+
+
+def cloud_base_url(records: list[dict]) -> str:
+    # Las rutas grabadas incluyen el prefijo de la API (/api/v1/...); el host da igual
+    for record in records:
+        path = record.get("p") or ""
+        if "/installations" in path:
+            return f"{record.get('s') or 'https'}://replay.invalid{path.split('/installations', 1)[0]}"
+    return "https://replay.invalid/api/v1"
+
+
+def build_coordinator(
+    hass: HomeAssistant,
+    header: dict,
+    records: list[dict],
+    session: ReplaySession,
+) -> AirzoneCoordinator:
+    scan_interval = int(header.get("scan_interval") or 10)
+    if header.get("connection_type") == CONNECTION_TYPE_CLOUD:
+        base_url = cloud_base_url(records)
+        hub = AirzoneCloudHub(session, "replay@example.com", "replay", base_url=base_url)
+        return AirzoneCloudCoordinator(
+            hass,
+            email="replay@example.com",
+            password="replay",
+            scan_interval=scan_interval,
+            base_url=base_url,
+            hub=hub,
+        )
+    return AirzoneCoordinator(
+        hass,
+        host="replay.invalid",
+        scan_interval=scan_interval,
+        api_prefix=header.get("prefix"),
+        transport=AiohttpTransport("replay.invalid", prefix=header.get("prefix"), session=session),
+    )
+
+
+async def replay(args: argparse.Namespace) -> dict:
+    header, records = load_cassette(args.cassette)
+    session = ReplaySession(records, speed=args.speed)
+    recorded_cycles = header.get("cycles") or [0.0]
+    cycles = args.cycles or len(recorded_cycles)
+
+    with tempfile.TemporaryDirectory(prefix="airzone_replay_") as config_dir:
+        hass = await create_hass(config_dir)
+        coordinator = build_coordinator(hass, header, records, session)
+        per_cycle: list[dict] = []
+        try:
+            started = time.monotonic()
+            for cycle in range(cycles):
+                # Respeta el ritmo original entre ciclos (acelerado con --speed)
+                if args.speed > 0 and cycle < len(recorded_cycles):
+                    due = (recorded_cycles[cycle] - recorded_cycles[0]) / args.speed
+                    delay = due - (time.monotonic() - started)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await coordinator.async_refresh()
+                per_cycle.append(
+                    {
+                        "ok": coordinator.last_update_success,
+                        "duration_ms": round((coordinator.telemetry.last_poll_duration or 0) * 1000, 1),
+                        "requests": coordinator.telemetry.last_poll_requests,
+                        "phases_ms": {k: round(v * 1000, 1) for k, v in coordinator.phases.last_cycle.items()},
+                        "notes": list(coordinator.phases.last_notes),
+                    }
+                )
+        finally:
+            await coordinator.async_close()
+            await hass.async_stop(force=True)
+
+    return {
+        "cassette": os.path.basename(args.cassette),
+        "connection_type": header.get("connection_type"),
+        "recorded": {"created": header.get("created"), "cycles": len(recorded_cycles), "exchanges": len(records)},
+        "speed": args.speed,
+        "cycles": per_cycle,
+        "result": {
+            "zones": len(coordinator.data or {}),
+            "systems": len(coordinator.systems),
+            "iaqs": len(coordinator.iaqs),
+            "transport_hvac": coordinator.transport_hvac,
+            "transport_iaq": coordinator.transport_iaq,
+        },
+        "unmatched": sorted(set(session.unmatched)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reproduce un cassette de Airzone Control")
+    parser.add_argument("cassette")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = original, 10 = 10x, 0 = sin esperas")
+    parser.add_argument("--cycles", type=int, default=0, help="Ciclos a reproducir (por defecto, los grabados)")
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    args = parser.parse_args()
+
+    report = asyncio.run(replay(args))
+    for idx, cycle in enumerate(report["cycles"], 1):
+        phases = " ".join(f"{k}={v}" for k, v in cycle["phases_ms"].items())
+        print(f"  ciclo {idx:>3}: ok={cycle['ok']} {cycle['duration_ms']:>8} ms  "
+              f"peticiones={cycle['requests']}  {phases}")
+    result = report["result"]
+    print(f"Zonas={result['zones']}  Sistemas={result['systems']}  IAQ={result['iaqs']}  "
+          f"HVAC={result['transport_hvac']}  IAQ={result['transport_iaq']}")
+    if report["unmatched"]:
+        print(f"{len(report['unmatched'])} peticiones sin respuesta en el cassette:")
+        for line in report["unmatched"]:
+            print(f"  {line}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+        print(f"Informe guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
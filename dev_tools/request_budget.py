@@ -0,0 +1,204 @@
+# request_budget.py
+# Presupuesto de peticiones HTTP por sondeo para cada "personalidad" de firmware.
+#
+# Las escaleras de fallback de _detect_prefix, _fetch_hvac_all, _fetch_iaq_all y
+# del http/https de la Local API pueden multiplicar en silencio las peticiones
+# de cada ciclo. Este script hace sondear a un AirzoneCoordinator real contra
+# ControllerModel (fake_airzone_async.py) a través de InMemoryTransport, sin red,
+# y cuenta las peticiones del arranque (primer ciclo, con detección de prefijo)
+# y del régimen estable (el peor de los ciclos siguientes).
+#
+# Los máximos permitidos están en dev_tools/request_budget.json: si un cambio
+# añade idas y vueltas, el escenario afectado falla y el script sale con 1.
+#
+# Uso:
+#   python dev_tools/request_budget.py                   # comprobar todos los escenarios
+#   python dev_tools/request_budget.py --detail no_iaq   # ver la escalera de peticiones
+#   python dev_tools/request_budget.py --update-budget   # regrabar request_budget.json
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..")))
+sys.path.insert(0, HERE)
+
+from fake_airzone_async import ControllerModel  # noqa: E402
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.airzone_control.coordinator import AirzoneCoordinator  # noqa: E402
+from custom_components.airzone_control.transport import InMemoryTransport  # noqa: E402
+
+DEFAULT_BUDGET = os.path.join(HERE, "request_budget.json")
+DEFAULT_STEADY_CYCLES = 5
+
+# nombre -> personalidad, tamaño de la instalación y opciones del transporte
+SCENARIOS: dict[str, dict] = {
+    "lapi_178": {"personality": "lapi_178", "systems": 2, "zones": 4, "iaqs": 1},
+    "lapi_177": {"personality": "lapi_177", "systems": 2, "zones": 4, "iaqs": 1},
+    "lapi_176": {"personality": "lapi_176", "systems": 2, "zones": 4, "iaqs": 1},
+    "alt_prefix": {"personality": "alt_prefix", "systems": 1, "zones": 4, "iaqs": 1},
+    "lapi_prefix": {"personality": "lapi_prefix", "systems": 1, "zones": 4, "iaqs": 1},
+    "get127_only": {"personality": "get127_only", "systems": 2, "zones": 4, "iaqs": 1},
+    "post0_only": {"personality": "post0_only", "systems": 2, "zones": 4, "iaqs": 1},
+    "no_iaq": {"personality": "no_iaq", "systems": 1, "zones": 4, "iaqs": 0},
+    "https_only": {"personality": "lapi_178", "systems": 1, "zones": 4, "iaqs": 1, "http": False, "https": True},
+    # Prefijo guardado por el config_flow: sin detección en el arranque
+    "configured_prefix": {"personality": "lapi_178", "systems": 1, "zones": 4, "iaqs": 1, "api_prefix": "/api/v1"},
+}
+
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Versiones antiguas de HA: constructor sin argumentos
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    return hass
+
+
+async def measure_scenario(hass: HomeAssistant, name: str, steady_cycles: int) -> dict:
+    spec = SCENARIOS[name]
+    model = ControllerModel(
+        name=f"Budget {name}",
+        systems=spec["systems"],
+        zones=spec["zones"],
+        iaqs=spec["iaqs"],
+        personality=spec["personality"],
+        seed=1,
+    )
+    transport = InMemoryTransport(
+        model,
+        prefix=spec.get("api_prefix"),
+        http=spec.get("http", True),
+        https=spec.get("https", False),
+    )
+    coordinator = AirzoneCoordinator(
+        hass,
+        host="budget.invalid",
+        api_prefix=spec.get("api_prefix"),
+        transport=transport,
+    )
+
+    # Cuenta cada intento (también los que fallan por esquema) y sigue alimentando la telemetría
+    ladder: list[str] = []
+    telemetry_record = transport.observer
+
+    def observe(method, path, scheme, latency, ok, **kwargs) -> None:
+        sent = kwargs.get("params") or kwargs.get("body")
+        ladder.append(f"{method} {scheme} {path} {json.dumps(sent) if sent else ''} -> {kwargs.get('status') or 'ERR'}")
+        if telemetry_record is not None:
+            telemetry_record(method, path, scheme, latency, ok, **kwargs)
+
+    transport.observer = observe
+    cycles: list[list[str]] = []
+    try:
+        for _ in range(1 + steady_cycles):
+            ladder.clear()
+            await coordinator.async_refresh()
+            cycles.append(list(ladder))
+    finally:
+        await coordinator.async_close()
+
+    return {
+        "ok": coordinator.last_update_success,
+        "startup": len(cycles[0]),
+        "steady": max((len(c) for c in cycles[1:]), default=0),
+        "zones": len(coordinator.data or {}),
+        "iaqs": len(coordinator.iaqs),
+        "transport_hvac": coordinator.transport_hvac,
+        "transport_iaq": coordinator.transport_iaq,
+        "ladders": {"startup": cycles[0], "steady": cycles[-1] if len(cycles) > 1 else []},
+    }
+
+
+def load_budget(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle).get("scenarios", {})
+    except FileNotFoundError:
+        return {}
+
+
+def compare(name: str, result: dict, budget: dict | None) -> list[str]:
+    problems: list[str] = []
+    if not result["ok"]:
+        problems.append("el sondeo falla")
+    if budget is None:
+        problems.append("sin presupuesto (usa --update-budget)")
+        return problems
+    for phase in ("startup", "steady"):
+        if result[phase] > budget[phase]:
+            problems.append(f"{phase}: {result[phase]} peticiones > presupuesto {budget[phase]}")
+    return problems
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict]:
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Escenarios desconocidos: {', '.join(unknown)}")
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="airzone_budget_") as config_dir:
+        hass = await create_hass(config_dir)
+        try:
+            for name in names:
+                results[name] = await measure_scenario(hass, name, args.cycles)
+        finally:
+            await hass.async_stop(force=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Presupuesto de peticiones por sondeo de Airzone Control")
+    parser.add_argument("--scenarios", help=f"Lista separada por comas (por defecto todos: {','.join(SCENARIOS)})")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_STEADY_CYCLES, help="Ciclos estables tras el arranque")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET)
+    parser.add_argument("--detail", help="Escenario cuya escalera de peticiones se imprime")
+    parser.add_argument("--update-budget", action="store_true")
+    args = parser.parse_args()
+    if args.detail and args.scenarios and args.detail not in args.scenarios.split(","):
+        args.scenarios += f",{args.detail}"
+
+    results = asyncio.run(run(args))
+    budget = load_budget(args.budget)
+
+    failed = False
+    for name, result in results.items():
+        problems = [] if args.update_budget else compare(name, result, budget.get(name))
+        failed = failed or bool(problems)
+        allowed = budget.get(name) or {}
+        print(
+            f"{'FAIL' if problems else 'ok  '} {name:<18} arranque={result['startup']:>3}/{allowed.get('startup', '-'):<3} "
+            f"estable={result['steady']:>3}/{allowed.get('steady', '-'):<3} zonas={result['zones']} iaq={result['iaqs']} "
+            f"HVAC={result['transport_hvac']} IAQ={result['transport_iaq']}"
+        )
+        for problem in problems:
+            print(f"       {problem}")
+        if name == args.detail:
+            for phase, ladder in result["ladders"].items():
+                print(f"       {phase}:")
+                for line in ladder:
+                    print(f"         {line}")
+
+    if args.update_budget:
+        budget.update({name: {"startup": r["startup"], "steady": r["steady"]} for name, r in results.items()})
+        with open(args.budget, "w", encoding="utf-8") as handle:
+            json.dump({"scenarios": budget}, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"Presupuesto guardado en {args.budget}")
+        return
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+# soak.py
+# Prueba de resistencia: hace sondear un coordinador real durante días de tiempo
+# simulado (cada ciclo cuenta como --scan-interval segundos, sin esperas) contra
+# los simuladores, con escrituras periódicas, follow-master activo y caídas del
+# controlador, y vigila lo que no debería crecer:
+#   - memoria asignada por Python (tracemalloc)
+#   - tareas asyncio pendientes (todas y las del propio coordinator)
+#   - conexiones HTTP abiertas en la sesión aiohttp y descriptores del proceso
+#
+# Cada serie se mide cada --sample-minutes simulados; tras descartar el
+# calentamiento, una serie cuya media sube en los cuatro cuartos y acaba por
+# encima de su tolerancia se marca como crecimiento monótono (sale con 1).
+# Al final se listan las líneas que más memoria han ganado desde el calentamiento.
+#
+# Objetivos:
+#   local  ControllerModel (fake_airzone_async.py) por InMemoryTransport, o por
+#          http real con --transport http; las caídas cierran el webserver.
+#   cloud  fake_airzone_cloud.py en un puerto local; las caídas responden 503.
+#          El simulador Cloud no acepta escrituras: solo lecturas.
+#
+# Necesita homeassistant instalado (entorno de desarrollo de la integración).
+#
+# Uso:
+#   python dev_tools/soak.py --days 3
+#   python dev_tools/soak.py --target local --transport http --systems 2 --zones 8 --write-every 20
+#   python dev_tools/soak.py --target cloud --devices 300 --days 1 --json soak.json
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(HERE, "..")))
+sys.path.insert(0, HERE)
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+from fake_airzone_async import ControllerModel, start_server  # noqa: E402
+from fake_airzone_cloud import FakeCloud, create_app, make_cloud_account  # noqa: E402
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.airzone_control.cloud_hub import AirzoneCloudHub  # noqa: E402
+from custom_components.airzone_control.coordinator import AirzoneCoordinator  # noqa: E402
+from custom_components.airzone_control.coordinator_cloud import AirzoneCloudCoordinator  # noqa: E402
+from custom_components.airzone_control.transport import AiohttpTransport, InMemoryTransport  # noqa: E402
+
+TRACE_FRAMES = 5
+TOP_GROWTH = 10
+# Tolerancia por serie antes de considerar que crece (memoria: --mem-tolerance)
+COUNT_TOLERANCE = 0
+
+
+async def create_hass(config_dir: str) -> HomeAssistant:
+    try:
+        hass = HomeAssistant(config_dir)
+    except TypeError:
+        # Versiones antiguas de HA: constructor sin argumentos
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    return hass
+
+
+def open_fds() -> int | None:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def open_connections(session: aiohttp.ClientSession | None) -> int | None:
+    connector = getattr(session, "connector", None) if session is not None else None
+    if connector is None:
+        return None
+    # Privado en aiohttp, pero es la única forma de ver el pool sin parchearlo
+    pooled = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+    return pooled + len(getattr(connector, "_acquired", ()))
+
+
+def growth(values: list[float | None], warmup: float, tolerance: float) -> dict | None:
+    """Crecimiento monótono: la media de cada cuarto supera a la del anterior."""
+    tail = [v for v in values[int(len(values) * warmup):] if v is not None]
+    if len(tail) < 8:
+        return None
+    quarter = len(tail) // 4
+    means = [sum(tail[i * quarter:(i + 1) * quarter]) / quarter for i in range(4)]
+    delta = tail[-1] - tail[0]
+    return {
+        "quarter_means": [round(m, 1) for m in means],
+        "delta": round(delta, 1),
+        "growing": all(b > a for a, b in zip(means, means[1:])) and delta > tolerance,
+    }
+
+
+class LocalTarget:
+    """Controlador Local API simulado que se puede apagar y encender."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.model = ControllerModel(
+            name="Soak",
+            systems=args.systems,
+            zones=args.zones,
+            iaqs=args.iaqs,
+            personality=args.personality,
+            latency=args.latency / 1000.0,
+            seed=args.seed,
+        )
+        self.runner: web.AppRunner | None = None
+        self.port: int | None = None
+        self.transport: AiohttpTransport | InMemoryTransport | None = None
+
+    async def start(self, hass: HomeAssistant) -> AirzoneCoordinator:
+        if self.args.transport == "http":
+            await self._serve(0)
+            self.transport = AiohttpTransport("127.0.0.1", self.port, prefix="/api/v1")
+        else:
+            self.transport = InMemoryTransport(self.model, prefix="/api/v1", network=True)
+        coordinator = AirzoneCoordinator(
+            hass,
+            host="127.0.0.1",
+            port=self.port or 3000,
+            scan_interval=self.args.scan_interval,
+            api_prefix="/api/v1",
+            transport=self.transport,
+        )
+        # Enforcement en segundo plano en cada ciclo: el principal sospechoso de fugas
+        await coordinator.async_refresh()
+        for sid in sorted(coordinator.systems):
+            await coordinator.async_set_follow_master(sid, True)
+        return coordinator
+
+    async def _serve(self, port: int) -> None:
+        self.runner = await start_server(self.model, port=port)
+        self.port = self.runner.addresses[0][1]
+
+    async def set_outage(self, down: bool) -> None:
+        if isinstance(self.transport, InMemoryTransport):
+            self.transport.http = not down
+        elif down and self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+        elif not down and self.runner is None:
+            await self._serve(self.port)
+
+    async def write(self, coordinator: AirzoneCoordinator, rnd: random.Random) -> None:
+        if not coordinator.data:
+            return
+        sid, zid = rnd.choice(sorted(coordinator.data))
+        await coordinator.async_set_zone_params(sid, zid, setpoint=rnd.choice((20.0, 21.0, 22.0, 23.0)))
+
+    def session(self) -> aiohttp.ClientSession | None:
+        return getattr(self.transport, "_session", None)
+
+    async def stop(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+
+
+class CloudTarget:
+    """fake_airzone_cloud en un puerto local."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.cloud = FakeCloud(
+            make_cloud_account(args.devices, seed=args.seed),
+            latency=args.latency / 1000.0,
+            change_rate=0.1,
+            seed=args.seed,
+        )
+        self.runner: web.AppRunner | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    async def start(self, hass: HomeAssistant) -> AirzoneCoordinator:
+        self.runner = web.AppRunner(create_app(self.cloud), access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        base_url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/api/v1"
+        self._session = aiohttp.ClientSession()
+        hub = AirzoneCloudHub(self._session, "soak@example.com", self.cloud.password, base_url=base_url)
+        coordinator = AirzoneCloudCoordinator(
+            hass,
+            email="soak@example.com",
+            password=self.cloud.password,
+            scan_interval=self.args.scan_interval,
+            base_url=base_url,
+            hub=hub,
+        )
+        await coordinator.async_refresh()
+        return coordinator
+
+    async def set_outage(self, down: bool) -> None:
+        self.cloud.down = down
+
+    async def write(self, coordinator: AirzoneCoordinator, rnd: random.Random) -> None:
+        return None
+
+    def session(self) -> aiohttp.ClientSession | None:
+        return self._session
+
+    async def stop(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        if self.runner is not None:
+            await self.runner.cleanup()
+
+
+async def run_soak(args: argparse.Namespace) -> dict:
+    cycles_per_hour = 3600 / args.scan_interval
+    total_cycles = int(args.days * 24 * cycles_per_hour)
+    sample_every = max(1, int(args.sample_minutes * 60 / args.scan_interval))
+    outage_every = int(args.outage_every * cycles_per_hour) if args.outage_every else 0
+    outage_cycles = max(1, int(args.outage_minutes * 60 / args.scan_interval))
+    warmup_cycles = int(total_cycles * args.warmup)
+    rnd = random.Random(args.seed)
+
+    tracemalloc.start(TRACE_FRAMES)
+    target = LocalTarget(args) if args.target == "local" else CloudTarget(args)
+    samples: list[dict] = []
+    failed_polls = 0
+    write_errors = 0
+    baseline_snapshot: tracemalloc.Snapshot | None = None
+    started = time.monotonic()
+
+    with tempfile.TemporaryDirectory(prefix="airzone_soak_") as config_dir:
+        hass = await create_hass(config_dir)
+        coordinator = await target.start(hass)
+        down = False
+        try:
+            for cycle in range(1, total_cycles + 1):
+                in_outage = bool(outage_every) and cycle % outage_every < outage_cycles and cycle >= outage_every
+                if in_outage != down:
+                    down = in_outage
+                    await target.set_outage(down)
+
+                await coordinator.async_refresh()
+                if not coordinator.last_update_success:
+                    failed_polls += 1
+                if args.write_every and cycle % args.write_every == 0:
+                    try:
+                        await target.write(coordinator, rnd)
+                    except Exception:
+                        write_errors += 1
+                # Deja avanzar las tareas en segundo plano como lo haría el intervalo real
+                await asyncio.sleep(0)
+
+                if cycle == warmup_cycles:
+                    baseline_snapshot = tracemalloc.take_snapshot()
+                if cycle % sample_every == 0:
+                    current, _peak = tracemalloc.get_traced_memory()
+                    samples.append(
+                        {
+                            "sim_hours": round(cycle / cycles_per_hour, 2),
+                            "memory_kib": round(current / 1024, 1),
+                            "tasks": len(asyncio.all_tasks()),
+                            "coordinator_tasks": coordinator.pending_tasks,
+                            "connections": open_connections(target.session()),
+                            "fds": open_fds(),
+                            "outage": down,
+                        }
+                    )
+                    if args.progress:
+                        print(f"  {samples[-1]}", flush=True)
+        finally:
+            final_snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            await coordinator.async_close()
+            await target.stop()
+            await hass.async_stop(force=True)
+
+    top: list[str] = []
+    if baseline_snapshot is not None:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = final_snapshot.filter_traces(filters).compare_to(baseline_snapshot.filter_traces(filters), "lineno")
+        top = [str(stat) for stat in diff[:TOP_GROWTH] if stat.size_diff > 0]
+
+    tolerances = {
+        "memory_kib": args.mem_tolerance,
+        "tasks": COUNT_TOLERANCE,
+        "coordinator_tasks": COUNT_TOLERANCE,
+        "connections": COUNT_TOLERANCE,
+        "fds": COUNT_TOLERANCE,
+    }
+    trends = {
+        key: growth([s[key] for s in samples], args.warmup, tolerance)
+        for key, tolerance in tolerances.items()
+    }
+    return {
+        "target": args.target,
+        "transport": args.transport if args.target == "local" else "http",
+        "simulated_days": args.days,
+        "cycles": total_cycles,
+        "wall_s": round(time.monotonic() - started, 1),
+        "failed_polls": failed_polls,
+        "write_errors": write_errors,
+        "samples": samples,
+        "trends": trends,
+        "growing": sorted(key for key, trend in trends.items() if trend and trend["growing"]),
+        "top_growth": top,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{report['target']} ({report['transport']}): {report['simulated_days']} días simulados, "
+        f"{report['cycles']} ciclos en {report['wall_s']} s, sondeos fallidos={report['failed_polls']}, "
+        f"escrituras fallidas={report['write_errors']}"
+    )
+    for key, trend in report["trends"].items():
+        if trend is None:
+            print(f"  {key:<18} sin datos")
+            continue
+        flag = "CRECE" if trend["growing"] else "ok"
+        print(f"  {key:<18} {flag:<6} delta={trend['delta']:<10} cuartos={trend['quarter_means']}")
+    if report["top_growth"]:
+        print("Mayor crecimiento de memoria desde el calentamiento:")
+        for line in report["top_growth"]:
+            print(f"  {line}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Soak test de Airzone Control")
+    parser.add_argument("--target", choices=("local", "cloud"), default="local")
+    parser.add_argument("--transport", choices=("memory", "http"), default="memory", help="Solo para --target local")
+    parser.add_argument("--days", type=float, default=2.0, help="Días de tiempo simulado")
+    parser.add_argument("--scan-interval", type=int, default=10, help="Segundos simulados por ciclo")
+    parser.add_argument("--sample-minutes", type=float, default=60.0, help="Minutos simulados entre muestras")
+    parser.add_argument("--warmup", type=float, default=0.2, help="Fracción inicial que no cuenta para tendencias")
+    parser.add_argument("--write-every", type=int, default=30, help="Ciclos entre escrituras (0 = ninguna)")
+    parser.add_argument("--outage-every", type=float, default=6.0, help="Horas simuladas entre caídas (0 = ninguna)")
+    parser.add_argument("--outage-minutes", type=float, default=10.0, help="Duración simulada de cada caída")
+    parser.add_argument("--mem-tolerance", type=float, default=512.0, help="KiB de crecimiento tolerado")
+    parser.add_argument("--systems", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=6, help="Zonas por sistema")
+    parser.add_argument("--iaqs", type=int, default=1, help="Sensores IAQ por sistema")
+    parser.add_argument("--personality", default="lapi_178")
+    parser.add_argument("--devices", type=int, default=200, help="Dispositivos Cloud")
+    parser.add_argument("--latency", type=float, default=0.0, help="ms por petición del simulador")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--progress", action="store_true", help="Imprimir cada muestra")
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    args = parser.parse_args()
+    # Las caídas provocadas llenarían la salida de avisos de "keeping last valid state"
+    logging.getLogger("custom_components.airzone_control").setLevel(logging.ERROR)
+
+    report = asyncio.run(run_soak(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+            handle.write("\n")
+        print(f"Informe guardado en {args.json}")
+    if report["growing"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()